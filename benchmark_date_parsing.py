@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+DateTimeOriginal 날짜 파싱 비교: 값마다 형식을 하나씩 시도하던 방식(Series.apply)과
+형식마다 남은 행만 한 번에 변환하는 PhotoExifProcessor._parse_exif_dates
+
+실제 EXIF에 흔한 값(표준 형식, ISO 형식, 날짜만, 0000:00:00 00:00:00, 끝에 NUL/공백이 붙은 값,
+빈 값)을 섞은 합성 데이터나 실제 사진 폴더의 값으로 시간을 재고, 두 결과(값과 dtype)가 같은지도
+확인한다.
+
+사용 예시:
+  python benchmark_date_parsing.py
+  python benchmark_date_parsing.py --rows 200000 --repeat 3
+  python benchmark_date_parsing.py --folder "/mnt/nas/photos"
+"""
+
+import argparse
+import logging
+import random
+import time
+
+import pandas as pd
+
+from photo_exif_processor import EXIF_DATE_FORMATS, PhotoExifProcessor
+
+
+def parse_exif_dates_apply(date_series):
+    """이전 방식: 값마다 EXIF_DATE_FORMATS를 차례로 시도하고 실패하면 일반 파싱"""
+
+    def parse_exif_date(date_str):
+        if pd.isna(date_str):
+            return pd.NaT
+        for fmt in EXIF_DATE_FORMATS:
+            try:
+                return pd.to_datetime(date_str, format=fmt)
+            except Exception:
+                continue
+        try:
+            return pd.to_datetime(date_str, errors="coerce")
+        except Exception:
+            return pd.NaT
+
+    return date_series.apply(parse_exif_date)
+
+
+def make_dates(rows, seed=0):
+    """EXIF에서 흔한 날짜 값들을 섞은 합성 DateTimeOriginal 컬럼"""
+    rng = random.Random(seed)
+    start = pd.Timestamp("2015-01-01").value // 10**9
+    span = 10 * 365 * 24 * 3600
+
+    values = []
+    for _ in range(rows):
+        kind = rng.random()
+        moment = pd.Timestamp(start + rng.randrange(span), unit="s")
+        if kind < 0.85:
+            values.append(moment.strftime("%Y:%m:%d %H:%M:%S"))
+        elif kind < 0.90:
+            values.append(moment.strftime("%Y-%m-%d %H:%M:%S"))
+        elif kind < 0.92:
+            values.append(moment.strftime("%Y:%m:%d"))
+        elif kind < 0.925:
+            values.append("0000:00:00 00:00:00")
+        elif kind < 0.93:
+            # 끝에 NUL이나 공백이 붙은 값 (exiftool/piexif가 그대로 남기는 경우)
+            padding = rng.choice(["\x00", "\x00\x00", " ", "\x00 "])
+            values.append(moment.strftime("%Y:%m:%d %H:%M:%S") + padding)
+        else:
+            values.append(None)
+    return pd.Series(values, dtype=object)
+
+
+def time_parser(parser, dates, repeat):
+    """최소 소요 시간과 결과 반환"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parser(dates)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DateTimeOriginal 날짜 파싱 속도 비교")
+    parser.add_argument("--rows", type=int, default=200000, help="합성 데이터 행 수")
+    parser.add_argument("--folder", help="합성 데이터 대신 사진 폴더의 실제 값 사용")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    if args.folder:
+        processor = PhotoExifProcessor(args.folder)
+        dates = processor.process_all_photos()["DateTimeOriginal"]
+        processor.close()
+    else:
+        dates = make_dates(args.rows)
+
+    print(f"행 수: {len(dates)} / 반복: {args.repeat}")
+    old_time, old_result = time_parser(parse_exif_dates_apply, dates, args.repeat)
+    new_time, new_result = time_parser(
+        PhotoExifProcessor._parse_exif_dates, dates, args.repeat
+    )
+
+    same = old_result.dtype == new_result.dtype and old_result.equals(new_result)
+    print(f" apply: {old_time:.3f}초")
+    print(f"벡터화: {new_time:.3f}초 ({old_time / max(new_time, 1e-9):.0f}배)")
+    print(f"결과 동일: {'예' if same else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+processor.df 메모리 비교: 예전 표 형식(행마다 str 객체, float64 좌표, 문자열 chunk_id)과
+지금 형식(compact_columns 확장 배열, int32 마이크로도 좌표, 범주형 chunk_id)
+
+합성 데이터(폴더마다 사진 수백 장, NAS 사진 폴더와 비슷한 경로)나 실제 사진 폴더로
+표를 만든 뒤 컬럼별 메모리(deep)와 행당 바이트를 출력하고, 두 형식의 값과
+문자열 컬럼의 .str/min/max/+ 결과가 같은지도 확인한다.
+
+사용 예시:
+  python benchmark_memory.py
+  python benchmark_memory.py --rows 1000000 --per-dir 300
+  python benchmark_memory.py --folder "/mnt/nas/photos"
+"""
+
+import argparse
+import logging
+import random
+import tempfile
+
+import pandas as pd
+
+from photo_exif_processor import PhotoExifProcessor
+
+
+def make_columns(rows, per_dir, seed=0):
+    """추출 결과와 같은 모양의 합성 컬럼 dict"""
+    rng = random.Random(seed)
+    start = pd.Timestamp("2015-01-01")
+
+    columns = {
+        key: []
+        for key in (
+            "FileName",
+            "FilePath",
+            "DateTimeOriginal",
+            "SubSecTimeOriginal",
+            "OffsetTimeOriginal",
+            "GPSLat",
+            "GPSLong",
+        )
+    }
+    moment = start
+    for i in range(rows):
+        if i % per_dir == 0:
+            # 새 폴더 = 새 여행/행사 (며칠 뒤)
+            moment += pd.Timedelta(days=rng.randint(2, 20))
+            folder = f"/mnt/nas/photos/{moment.year}/{moment:%Y-%m-%d} 여행 사진"
+        moment += pd.Timedelta(seconds=rng.randint(5, 900))
+        name = f"IMG_{i % 10000:04d}.JPG"
+        columns["FileName"].append(name)
+        columns["FilePath"].append(f"{folder}/{name}")
+        has_date = rng.random() < 0.95
+        columns["DateTimeOriginal"].append(
+            moment.strftime("%Y:%m:%d %H:%M:%S") if has_date else None
+        )
+        columns["SubSecTimeOriginal"].append(
+            str(rng.randint(0, 99)) if has_date else None
+        )
+        columns["OffsetTimeOriginal"].append("+09:00" if has_date else None)
+        has_gps = rng.random() < 0.8
+        columns["GPSLat"].append(33 + rng.random() * 5 if has_gps else None)
+        columns["GPSLong"].append(126 + rng.random() * 4 if has_gps else None)
+    return columns
+
+
+def old_schema(df):
+    """지금 표를 예전 형식으로 되돌림 (값은 같고 dtype만 다름)"""
+    old = pd.DataFrame(index=df.index)
+    for column in df.columns:
+        if column == "status":
+            # 예전 형식에는 없던 컬럼
+            continue
+        values = df[column]
+        if column in ("FileName", "FilePath", "DateTimeOriginal"):
+            values = pd.Series(values.astype(object).tolist(), index=df.index)
+        elif column in ("GPSLat", "GPSLong"):
+            values = values.astype("float64")
+        elif column == "chunk_id":
+            values = values.astype(object)
+        elif column == "order":
+            values = values.astype("int64")
+        old[column] = values
+    return old
+
+
+def report(name, df):
+    """컬럼별 메모리와 행당 바이트 출력"""
+    usage = df.memory_usage(deep=True, index=False)
+    total = usage.sum()
+    print(f"[{name}] 전체 {total / 2**20:.1f} MiB, 행당 {total / len(df):.0f}바이트")
+    for column, size in usage.items():
+        print(f"  {column:<18} {str(df[column].dtype):<16} {size / len(df):7.1f}바이트/행")
+    return total
+
+
+def same_values(old, new):
+    """두 형식의 값 비교 (좌표는 소수점 6자리로 저장되므로 1e-6도 이내면 같음)"""
+    for column in old.columns:
+        a, b = old[column], new[column]
+        if column in ("GPSLat", "GPSLong"):
+            if not (a.isna().equals(b.isna()) and (a - b).abs().fillna(0).max() < 1e-6):
+                return False
+        elif not a.astype(object).equals(b.astype(object)):
+            return False
+    return True
+
+
+def same_accessors(old, new):
+    """문자열 컬럼의 .str 접근자, min/max, + 결과가 예전 형식과 같은지"""
+    for column in ("FileName", "FilePath", "DateTimeOriginal"):
+        a, b = old[column], new[column]
+        results = [
+            (a.str.upper(), b.str.upper()),
+            (a.str.len(), b.str.len()),
+            (a.str.split(".").str[-1], b.str.split(".").str[-1]),
+            (a + "_x", b + "_x"),
+        ]
+        if not all(x.astype(object).equals(y.astype(object)) for x, y in results):
+            return False
+        # object 컬럼은 빈 값이 있으면 min/max가 실패하므로 빈 값을 빼고 비교
+        if (a.dropna().min(), a.dropna().max()) != (b.min(), b.max()):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="processor.df 메모리 비교")
+    parser.add_argument("--rows", type=int, default=500000, help="합성 데이터 행 수")
+    parser.add_argument("--per-dir", type=int, default=200, help="폴더당 사진 수")
+    parser.add_argument("--folder", help="합성 데이터 대신 사진 폴더를 처리")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    if args.folder:
+        processor = PhotoExifProcessor(args.folder)
+        processor.process_all_photos()
+    else:
+        processor = PhotoExifProcessor(tempfile.gettempdir())
+        processor.df = processor._build_frame(make_columns(args.rows, args.per_dir))
+    processor.detect_date_chunks()
+    processor.add_order_column()
+    processor.close()
+
+    new = processor.df
+    old = old_schema(new)
+    print(f"행 수: {len(new)}")
+    old_bytes = report("예전 형식", old)
+    new_bytes = report("지금 형식", new)
+    print(
+        f"행당 메모리: {old_bytes / len(new):.0f} → {new_bytes / len(new):.0f}바이트 "
+        f"({old_bytes / max(new_bytes, 1):.1f}배 감소)"
+    )
+    print(f"값 동일: {'예' if same_values(old, new) else '아니오'}")
+    print(f"접근자 결과 동일: {'예' if same_accessors(old, new) else '아니오'}")
+
+
+if __name__ == "__main__":
+    main()
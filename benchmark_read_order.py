@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+읽기 순서(path / inode / extent)별 EXIF 추출 처리량 비교
+
+매 실행 전에 대상 파일의 페이지 캐시를 posix_fadvise(DONTNEED)로 비워서
+디스크(또는 NAS)에서 실제로 읽는 상황을 흉내낸다. 결과 DataFrame이
+읽기 순서와 상관없이 같은지도 함께 확인한다.
+
+사용 예시:
+  python benchmark_read_order.py "/mnt/nas/photos"
+  python benchmark_read_order.py "/mnt/nas/photos" --workers 4 --repeat 3
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from photo_exif_processor import PhotoExifProcessor
+from read_scheduler import READ_ORDERS
+
+
+def drop_file_cache(photo_files):
+    """파일들의 페이지 캐시 비우기 (root 권한 불필요, 지원하지 않으면 무시)"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    # 더티 페이지는 DONTNEED로 버려지지 않으므로 먼저 디스크에 기록
+    os.sync()
+    for file_path in photo_files:
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def run_once(photo_folder, read_order, workers):
+    """캐시를 비운 뒤 한 번 추출하고 (소요 시간, 결과 df) 반환"""
+    processor = PhotoExifProcessor(photo_folder, workers=workers, read_order=read_order)
+    photo_files = processor.scan_photos()
+    drop_file_cache(photo_files)
+
+    start = time.perf_counter()
+    df = processor.process_all_photos()
+    elapsed = time.perf_counter() - start
+    processor.close()
+    return elapsed, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽기 순서별 EXIF 추출 처리량 비교")
+    parser.add_argument("folder", help="사진 폴더 경로")
+    parser.add_argument(
+        "--orders",
+        nargs="+",
+        choices=READ_ORDERS,
+        default=list(READ_ORDERS),
+        help="비교할 읽기 순서 (기본값: 전부)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="워커 수 (기본값: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="순서별 반복 횟수 (기본값: 3)")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    baseline = None
+    print(f"폴더: {args.folder} / 워커: {args.workers} / 반복: {args.repeat}")
+    for read_order in args.orders:
+        times = []
+        for _ in range(args.repeat):
+            elapsed, df = run_once(args.folder, read_order, args.workers)
+            times.append(elapsed)
+
+        if baseline is None:
+            baseline = df
+        same = df.equals(baseline)
+
+        best = min(times)
+        print(
+            f"{read_order:>6}: 최소 {best:.3f}초, 평균 {sum(times) / len(times):.3f}초, "
+            f"{len(df) / best:.0f} 파일/초, 결과 동일: {'예' if same else '아니오'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
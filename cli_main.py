@@ -6,14 +6,24 @@ tkinter가 없는 환경에서 사용할 수 있는 CLI 버전
 
 import sys
 import os
+import signal
 from pathlib import Path
 import logging
 import argparse
-import pandas as pd
 
 # 로컬 모듈 import
-from photo_exif_processor import PhotoExifProcessor
-from data_exporter import DataExporter
+from exif_cache import DEFAULT_CACHE_PATH
+from photo_exif_processor import (
+    ADAPTIVE_WORKERS,
+    ESTIMATE_SAMPLE_PER_DIR,
+    PhotoExifProcessor,
+    ProcessingCancelled,
+)
+from processing_events import FILE_ERROR, STAGE_END, THROUGHPUT
+from read_scheduler import READ_ORDERS
+from scan_journal import DEFAULT_JOURNAL_PATH
+from data_exporter import DataExporter, LATEST_LABEL
+from folder_watcher import FolderWatcher
 
 # 로그 설정
 logging.basicConfig(
@@ -71,6 +81,41 @@ pip install -r requirements.txt
         sys.exit(1)
 
 
+def print_progress_event(event):
+    """처리기 진행 이벤트를 콘솔에 출력 (processor.subscribe용)"""
+    if event["type"] == THROUGHPUT:
+        print(
+            f"   ⏳ {event['done']:,}개 처리 · {event['rate']:.1f} 파일/초 "
+            f"(평균 {event['average']:.1f})"
+        )
+    elif event["type"] == FILE_ERROR:
+        print(f"   ⚠️ EXIF 추출 실패: {Path(event['path']).name} ({event['error']})")
+    elif event["type"] == STAGE_END and event["stage"] == "extract":
+        failed = f", 실패 {event['failed']:,}개" if event["failed"] else ""
+        print(
+            f"   ✅ 추출 완료: {event['files']:,}개, {event['seconds']:.1f}초{failed}"
+        )
+    elif event["type"] == STAGE_END and event["stage"] == "retry":
+        print(f"   🔁 실패한 파일 다시 시도: {event['failed']:,}개는 여전히 실패")
+
+
+def pause_on_interrupt(processor):
+    """
+    첫 Ctrl+C는 처리를 일시 중지(지금 읽는 묶음까지 마치고 저널에 저장)하고,
+    한 번 더 누르면 바로 종료하도록 SIGINT 처리기 설치
+
+    Returns:
+        이전 SIGINT 처리기 (끝나면 signal.signal로 되돌림)
+    """
+
+    def on_interrupt(signum, frame):
+        print("\n⏸ 일시 중지하는 중... (한 번 더 Ctrl+C를 누르면 바로 종료)")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        processor.cancel()
+
+    return signal.signal(signal.SIGINT, on_interrupt)
+
+
 def interactive_mode():
     """대화형 모드"""
     print("=== 사진 EXIF → Google My Maps 변환기 (대화형 모드) ===")
@@ -106,6 +151,7 @@ def interactive_mode():
         print("🔍 EXIF 데이터 처리를 시작합니다...")
 
         processor = PhotoExifProcessor(photo_folder)
+        processor.subscribe(print_progress_event)
 
         # 사진 스캔 및 EXIF 추출
         print("   📸 사진 파일 스캔 중...")
@@ -133,15 +179,15 @@ def interactive_mode():
         print(processor.get_summary())
 
         # 4. 분류 결과 표시
-        auto_df, manual_date_df, manual_gps_df, manual_both_df = (
-            processor.classify_processing_type()
+        auto_index, manual_date_index, manual_gps_index, manual_both_index = (
+            processor.classify_processing_index()
         )
 
         # 단계별 보정 필요 파일 계산
-        step1_needed = len(manual_date_df) + len(
-            manual_both_df
+        step1_needed = len(manual_date_index) + len(
+            manual_both_index
         )  # 날짜가 없는 모든 파일
-        step2_needed = len(manual_gps_df) + len(manual_both_df)  # GPS가 없는 모든 파일
+        step2_needed = len(manual_gps_index) + len(manual_both_index)  # GPS가 없는 모든 파일
 
         if step1_needed > 0 or step2_needed > 0:
             print("\n⚠️  단계별 수동 보정이 필요한 파일이 있습니다:")
@@ -149,21 +195,17 @@ def interactive_mode():
 
             if step1_needed > 0:
                 print(f"📅 1단계: 시간 보정 필요 → {step1_needed}개 파일")
-                if len(manual_date_df) > 0:
-                    print(f"   • GPS는 있지만 날짜 없음: {len(manual_date_df)}개")
-                if len(manual_both_df) > 0:
-                    print(f"   • 날짜와 GPS 둘 다 없음: {len(manual_both_df)}개")
+                if len(manual_date_index) > 0:
+                    print(f"   • GPS는 있지만 날짜 없음: {len(manual_date_index)}개")
+                if len(manual_both_index) > 0:
+                    print(f"   • 날짜와 GPS 둘 다 없음: {len(manual_both_index)}개")
 
                 # 날짜 보정이 필요한 파일들의 예시 표시
                 print(f"\n   💡 날짜 보정 예시 (처음 3개 파일):")
-                step1_files = (
-                    pd.concat([manual_date_df, manual_both_df])
-                    if not manual_date_df.empty or not manual_both_df.empty
-                    else pd.DataFrame()
-                )
-                if not step1_files.empty:
+                step1_index = manual_date_index.append(manual_both_index)
+                if not step1_index.empty:
                     show_sample_files_for_date_correction(
-                        processor, step1_files.head(3)
+                        processor, processor.df.loc[step1_index[:3]]
                     )
 
                 print(f"\n   📝 날짜 입력 포맷: YYYY:MM:DD HH:MM:SS")
@@ -174,10 +216,10 @@ def interactive_mode():
 
             if step2_needed > 0:
                 print(f"\n🗺️  2단계: 장소 보정 필요 → {step2_needed}개 파일")
-                if len(manual_gps_df) > 0:
-                    print(f"   • 날짜는 있지만 GPS 없음: {len(manual_gps_df)}개")
-                if len(manual_both_df) > 0:
-                    print(f"   • 1단계 완료 후 GPS 입력 필요: {len(manual_both_df)}개")
+                if len(manual_gps_index) > 0:
+                    print(f"   • 날짜는 있지만 GPS 없음: {len(manual_gps_index)}개")
+                if len(manual_both_index) > 0:
+                    print(f"   • 1단계 완료 후 GPS 입력 필요: {len(manual_both_index)}개")
             else:
                 print("\n✅ 2단계: 장소 보정 완료 (모든 파일에 GPS 있음)")
 
@@ -190,7 +232,7 @@ def interactive_mode():
                 print(f"   2️⃣ GUI에서 '2단계: 장소 보정' → 지도에서 위치 클릭")
 
             print(
-                f"\n📊 최종 완성 예상: {len(auto_df) + step1_needed}개 파일 (현재 자동처리 {len(auto_df)}개 + 보정 {step1_needed}개)"
+                f"\n📊 최종 완성 예상: {len(auto_index) + step1_needed}개 파일 (현재 자동처리 {len(auto_index)}개 + 보정 {step1_needed}개)"
             )
             print("현재 CLI 버전에서는 자동 처리가 가능한 파일만 내보냅니다.")
             print("GUI 버전 실행: python main.py (tkinter 설치 필요)")
@@ -371,17 +413,51 @@ def open_output_folder():
         print(f"📂 수동으로 확인하세요: {output_path}")
 
 
-def batch_mode(photo_folder, output_format="all"):
-    """배치 처리 모드"""
+def batch_mode(
+    photo_folder,
+    output_format="all",
+    workers=1,
+    backend="thread",
+    cache_path=DEFAULT_CACHE_PATH,
+    ignore_defaults=True,
+    follow_symlinks=False,
+    read_order="path",
+    resume=False,
+    journal_path=DEFAULT_JOURNAL_PATH,
+):
+    """배치 처리 모드 (Ctrl+C로 일시 중지, resume=True로 이어서 처리)"""
     print(f"=== 배치 처리 모드 ===")
     print(f"📁 처리 폴더: {photo_folder}")
     print(f"📤 출력 형식: {output_format}")
+    print(f"🧵 작업 워커: {workers} ({backend})")
+    print(f"🗃️ EXIF 캐시: {cache_path or '사용 안 함'}")
+    print(f"📒 체크포인트 저널: {journal_path}{' (이어서 처리)' if resume else ''}")
 
     try:
-        processor = PhotoExifProcessor(photo_folder)
+        processor = PhotoExifProcessor(
+            photo_folder,
+            workers=workers,
+            backend=backend,
+            cache_path=cache_path,
+            ignore_defaults=ignore_defaults,
+            follow_symlinks=follow_symlinks,
+            read_order=read_order,
+            journal_path=journal_path,
+        )
+        processor.subscribe(print_progress_event)
 
-        # EXIF 데이터 처리
-        df = processor.process_all_photos()
+        # EXIF 데이터 처리 (Ctrl+C → 일시 중지)
+        previous_handler = pause_on_interrupt(processor)
+        try:
+            df = processor.process_all_photos(resume=resume)
+        except ProcessingCancelled:
+            print("⏸ 일시 중지했습니다. 같은 명령에 --resume을 붙여 이어서 처리하세요.")
+            processor.close()
+            sys.exit(130)
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+        if processor.cache is not None:
+            print(f"🗃️ {processor.cache.report()}")
         processor.detect_date_chunks()
         processor.add_order_column()
 
@@ -410,6 +486,129 @@ def batch_mode(photo_folder, output_format="all"):
         sys.exit(1)
 
 
+def estimate_mode(
+    photo_folder,
+    sample=ESTIMATE_SAMPLE_PER_DIR,
+    workers=1,
+    backend="thread",
+    cache_path=DEFAULT_CACHE_PATH,
+    ignore_defaults=True,
+    follow_symlinks=False,
+    read_order="path",
+):
+    """추정 모드: 폴더별 무작위 표본만 추출해서 전체 처리 결과와 시간을 미리 추정"""
+    print(f"=== 추정 모드 ===")
+    print(f"📁 처리 폴더: {photo_folder}")
+    print(f"🎲 표본: 폴더당 최대 {sample}개")
+
+    processor = None
+    try:
+        processor = PhotoExifProcessor(
+            photo_folder,
+            workers=workers,
+            backend=backend,
+            cache_path=cache_path,
+            ignore_defaults=ignore_defaults,
+            follow_symlinks=follow_symlinks,
+            read_order=read_order,
+        )
+        estimate = processor.estimate_library(sample)
+        print(processor.get_estimate_summary(estimate))
+        print("전체 처리: 같은 명령에서 --estimate를 빼고 실행하세요.")
+
+    except Exception as e:
+        print(f"❌ 추정 오류: {e}")
+        logger.error(f"추정 오류: {e}")
+        sys.exit(1)
+    finally:
+        if processor is not None:
+            processor.close()
+
+
+def watch_mode(
+    photo_folder,
+    output_format="all",
+    workers=1,
+    backend="thread",
+    cache_path=DEFAULT_CACHE_PATH,
+    debounce=2.0,
+    ignore_defaults=True,
+    follow_symlinks=False,
+    read_order="path",
+):
+    """감시 모드: 폴더 변경을 감지해서 바뀐 파일만 처리하고 내보내기 파일 갱신"""
+    print(f"=== 감시 모드 ===")
+    print(f"📁 감시 폴더: {photo_folder}")
+    print(f"📤 출력 형식: {output_format} (파일명 *_{LATEST_LABEL})")
+
+    processor = PhotoExifProcessor(
+        photo_folder,
+        workers=workers,
+        backend=backend,
+        cache_path=cache_path,
+        ignore_defaults=ignore_defaults,
+        follow_symlinks=follow_symlinks,
+        read_order=read_order,
+    )
+    processor.subscribe(print_progress_event)
+    watcher = FolderWatcher(
+        photo_folder, debounce=debounce, ignore=processor.ignore_rules
+    )
+    print(f"👀 감시 방식: {watcher.mode}")
+
+    try:
+        processor.process_all_photos()
+        processor.detect_date_chunks()
+        processor.add_order_column()
+        print(processor.get_summary())
+
+        exporter = DataExporter(processor)
+        try:
+            exporter.update_latest_exports(output_format)
+            print("✅ 내보내기 파일 생성 완료 (Ctrl+C로 종료)")
+        except ValueError as e:
+            print(f"⚠️ {e}")
+
+        while True:
+            paths = watcher.wait()
+            changes = processor.rescan(paths=paths)
+            if not (changes["added"] or changes["removed"] or changes["modified"]):
+                continue
+
+            print(
+                f"🔄 추가 {len(changes['added'])}개, 삭제 {len(changes['removed'])}개, "
+                f"수정 {len(changes['modified'])}개 → 바뀐 덩어리 {len(changes['chunks'])}개"
+            )
+            if not changes["chunks"]:
+                # 날짜가 있는 사진이 바뀌지 않았으면 내보내기 내용도 그대로
+                continue
+
+            try:
+                exporter.update_latest_exports(output_format, changes["chunks"])
+                print("✅ 내보내기 파일 갱신 완료")
+            except ValueError as e:
+                print(f"⚠️ {e}")
+
+    except KeyboardInterrupt:
+        print("\n👋 감시를 종료합니다.")
+    finally:
+        watcher.close()
+        processor.close()
+
+
+def parse_workers(value):
+    """--workers 값 해석 (1 이상의 정수 또는 auto)"""
+    if value == ADAPTIVE_WORKERS:
+        return value
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수 또는 auto여야 합니다: {value}")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return workers
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(
@@ -422,8 +621,16 @@ def main():
   python cli_main.py -f "/path/to/photos" -o csv        # CSV만 생성
   python cli_main.py -f "/path/to/photos" -o kml        # KML만 생성
   python cli_main.py -f "/path/to/photos" -o separated  # 날짜별 분리 CSV
-
-지원 파일 형식: JPG, JPEG, PNG, MOV, MP4, HEIC, TIFF
+  python cli_main.py -f "/path/to/photos" --workers 8   # 8개 스레드로 EXIF 추출
+  python cli_main.py -f "/path/to/photos" --workers 8 --backend process  # 프로세스 풀 사용
+  python cli_main.py -f "/path/to/photos" --workers auto  # 저장소에 맞게 동시 처리 수 자동 조절
+  python cli_main.py -f "/path/to/photos" --no-cache    # EXIF 캐시 없이 전부 다시 읽기
+  python cli_main.py -f "/path/to/photos" --resume      # 중단된(Ctrl+C 등) 배치 처리 이어서 하기
+  python cli_main.py -f "/path/to/photos" --estimate    # 폴더별 표본만 읽어 결과/시간 미리 추정
+  python cli_main.py -f "/path/to/photos" --watch       # 폴더 감시, 바뀔 때마다 내보내기 갱신
+  python cli_main.py -f "/path/to/photos" --follow-symlinks  # 심볼릭 링크 폴더도 검색
+
+지원 파일 형식: JPG, JPEG, PNG, MOV, MP4, HEIC, HEIF, TIFF
         """,
     )
 
@@ -435,6 +642,71 @@ def main():
         default="all",
         help="출력 파일 형식 (기본값: all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=parse_workers,
+        default=1,
+        help="EXIF 추출에 사용할 워커 수 또는 auto(저장소 속도에 맞게 자동 조절) (배치 모드, 기본값: 1)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["thread", "process"],
+        default="thread",
+        help="병렬 추출 백엔드 (thread: I/O 위주, process: CPU 위주, 기본값: thread)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(DEFAULT_CACHE_PATH),
+        help=f"EXIF 캐시(SQLite) 파일 경로 (배치 모드, 기본값: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="EXIF 캐시를 사용하지 않음",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"체크포인트 저널({DEFAULT_JOURNAL_PATH})에 남은 기록부터 이어서 처리 (배치 모드)",
+    )
+    parser.add_argument(
+        "--estimate",
+        action="store_true",
+        help="전체 처리 전에 폴더별 무작위 표본만 추출해서 파일 수, 날짜/GPS 누락 비율, 처리 시간 추정",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=ESTIMATE_SAMPLE_PER_DIR,
+        help=f"추정 모드에서 폴더마다 추출할 최대 파일 수 (기본값: {ESTIMATE_SAMPLE_PER_DIR})",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="폴더를 감시하면서 바뀐 사진만 처리하고 내보내기 파일을 계속 갱신",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=2.0,
+        help="감시 모드에서 마지막 변경 후 기다리는 시간(초, 기본값: 2)",
+    )
+    parser.add_argument(
+        "--no-default-ignore",
+        action="store_true",
+        help="기본 제외 규칙(숨김 폴더, @eaDir, #recycle, Lightroom 미리보기 등)을 사용하지 않음",
+    )
+    parser.add_argument(
+        "--follow-symlinks",
+        action="store_true",
+        help="심볼릭 링크 폴더로도 내려가서 검색 (순환 링크는 자동으로 건너뜀)",
+    )
+    parser.add_argument(
+        "--read-order",
+        choices=READ_ORDERS,
+        default="path",
+        help="파일 읽기 순서 (inode/extent: HDD NAS에서 디스크 위치 순으로 읽고 미리 읽기, 기본값: path)",
+    )
     parser.add_argument("--version", action="version", version="1.0.0")
 
     args = parser.parse_args()
@@ -456,7 +728,45 @@ def main():
             print(f"❌ 폴더가 존재하지 않습니다: {args.folder}")
             sys.exit(1)
 
-        batch_mode(args.folder, args.output)
+        cache_path = None if args.no_cache else args.cache
+        if args.estimate:
+            estimate_mode(
+                args.folder,
+                args.sample,
+                args.workers,
+                args.backend,
+                cache_path,
+                not args.no_default_ignore,
+                args.follow_symlinks,
+                args.read_order,
+            )
+        elif args.watch:
+            watch_mode(
+                args.folder,
+                args.output,
+                args.workers,
+                args.backend,
+                cache_path,
+                args.debounce,
+                not args.no_default_ignore,
+                args.follow_symlinks,
+                args.read_order,
+            )
+        else:
+            batch_mode(
+                args.folder,
+                args.output,
+                args.workers,
+                args.backend,
+                cache_path,
+                not args.no_default_ignore,
+                args.follow_symlinks,
+                args.read_order,
+                args.resume,
+            )
+    elif args.watch:
+        print("❌ --watch는 -f/--folder와 함께 사용해야 합니다.")
+        sys.exit(1)
     else:
         # 대화형 모드
         interactive_mode()
@@ -0,0 +1,789 @@
+#!/usr/bin/env python3
+"""
+Compact Columns
+processor.df의 문자열 컬럼을 행마다 파이썬 str 객체로 두지 않고 연속된 버퍼에 담는 pandas 확장 배열
+(좌표 컬럼은 소수점 6자리까지 정확한 정수 배열)
+
+- CompactStringArray: 문자열들을 UTF-8 바이트 버퍼 하나와 오프셋 배열로 저장 (FileName, DateTimeOriginal)
+- PathArray: 경로를 폴더 사전(폴더마다 문자열 하나) + 폴더 번호(int32) + 파일 이름으로 저장 (FilePath)
+- CoordinateArray: 위도/경도를 int32 마이크로도로 저장하고 float로 보여줌 (GPSLat, GPSLong)
+
+컬럼 값은 그대로 str로 보이므로 df["FilePath"] == path, isin, 정렬, groupby/merge, to_csv,
+iterrows 등 기존 사용법은 바뀌지 않는다. (.str 접근자, min/max 같은 집계, + 로 이어 붙이기는
+값을 str 객체로 꺼내 object 컬럼과 같은 방식으로 계산)
+"""
+
+import operator
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer, is_list_like, pandas_dtype
+
+# take()에서 한 번에 모으는 행 수 (바이트 위치 임시 배열의 크기 제한)
+GATHER_BLOCK = 1 << 16
+
+# 값 바꾸기에서 바꿀 행이 전체의 이 비율 이하면 바이트를 잘라 붙이고, 넘으면 take()로 다시 모음
+SPLICE_FRACTION = 1 / 16
+
+# 좌표 1도 = 1,000,000 마이크로도 (소수점 6자리, 약 0.1m)
+MICRODEGREES = 1_000_000
+
+
+def _missing_mask(values):
+    """object 배열에서 없는 값(None/NaN/NA) 위치"""
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+def _as_objects(scalars):
+    """임의의 값 목록을 1차원 object 배열로"""
+    if isinstance(scalars, (ExtensionArray, pd.Series, pd.Index)):
+        return np.asarray(scalars, dtype=object)
+    values = np.empty(len(scalars), dtype=object)
+    values[:] = list(scalars)
+    return values
+
+
+def _encode(strings):
+    """
+    문자열 목록을 (UTF-8 바이트 버퍼, 오프셋) 으로 변환
+
+    surrogatepass로 인코딩하므로 파일 시스템에서 온 디코딩 불가 문자도 그대로 되돌릴 수 있다.
+    """
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    text = "".join(strings)
+    if text.isascii():
+        # 대부분의 파일 이름/날짜: 글자 수 = 바이트 수라서 한 번에 인코딩
+        lengths = np.fromiter(map(len, strings), np.int64, len(strings))
+        np.cumsum(lengths, out=offsets[1:])
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8), offsets
+
+    encoded = [value.encode("utf-8", "surrogatepass") for value in strings]
+    np.cumsum(np.fromiter(map(len, encoded), np.int64, len(encoded)), out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _normalize_take(indices, length, allow_fill):
+    """
+    take() 인덱스 확인
+
+    Returns:
+        tuple: (읽을 위치 배열, 빈 값으로 채울 위치 마스크)
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    if allow_fill:
+        if (indices < -1).any():
+            raise ValueError("allow_fill=True일 때 인덱스는 -1 이상이어야 합니다.")
+        fill = indices == -1
+    else:
+        fill = np.zeros(len(indices), dtype=bool)
+        indices = np.where(indices < 0, indices + length, indices)
+
+    taken = indices[~fill]
+    if len(taken) and (taken.min() < 0 or taken.max() >= length):
+        raise IndexError(f"인덱스가 범위(길이 {length})를 벗어났습니다.")
+    return np.where(fill, 0, indices), fill
+
+
+class _CompactArray(ExtensionArray):
+    """
+    두 확장 배열의 공통 동작 (인덱싱, 값 바꾸기, 비교, 변환)
+
+    .str 메서드(_str_*), 집계, + 는 값을 꺼낸 object 배열(pd.array(..., dtype=object))에
+    맡기므로 결과는 object 컬럼과 같다.
+    """
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._from_sequence(values)
+
+    def _positions(self, key):
+        """인덱서(정수/슬라이스/불리언/정수 배열)를 행 위치 배열로"""
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        if is_integer(key):
+            key = [key]
+        if isinstance(key, slice):
+            return np.arange(len(self))[key]
+        key = check_array_indexer(self, key)
+        if key.dtype == bool:
+            return np.flatnonzero(key)
+        return np.where(key < 0, key + len(self), key)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            position = int(item)
+            if position < 0:
+                position += len(self)
+            if not 0 <= position < len(self):
+                raise IndexError(f"인덱스 {item}가 범위(길이 {len(self)})를 벗어났습니다.")
+            return self._scalar(position)
+        return self.take(self._positions(item))
+
+    def __setitem__(self, key, value):
+        positions = self._positions(key)
+        if isinstance(value, str) or not is_list_like(value):
+            value = [value] * len(positions)
+        replacement = self._from_sequence(value)
+        if len(replacement) != len(positions):
+            raise ValueError("바꿀 값의 개수가 행 수와 다릅니다.")
+
+        # 같은 행이 여러 번 나오면 마지막 값 (위치는 정렬된 순서로 넘김)
+        positions, last = np.unique(positions[::-1], return_index=True)
+        self._assign(positions, replacement.take(len(replacement) - 1 - last))
+
+    def __iter__(self):
+        return iter(self._to_objects().tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self._to_objects()
+        return values if dtype is None else values.astype(dtype)
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if dtype == self.dtype:
+            return self.copy() if copy else self
+        if dtype == np.dtype(object):
+            return self._to_objects()
+        return super().astype(dtype, copy=copy)
+
+    def _values_for_argsort(self):
+        return self._to_objects()
+
+    def _object_array(self):
+        """값을 object dtype의 pandas 배열로 (.str/집계/+ 계산용)"""
+        return pd.array(self._to_objects(), dtype=object)
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        # min/max/any/all 등 (keepdims는 DataFrame 집계에서만 넘어옴)
+        values = self
+        if skipna and name in ("min", "max"):
+            # object 배열은 NaN과 str을 비교하다 실패하므로 없는 값을 빼고 계산
+            values = self[~self.isna()]
+        if len(values) or name not in ("min", "max"):
+            result = values._object_array()._reduce(name, skipna=skipna, **kwargs)
+        else:
+            result = self.dtype.na_value
+        return np.array([result], dtype=object) if keepdims else result
+
+    def __add__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, _CompactArray):
+            other = other._object_array()
+        return self._object_array() + other
+
+    def __radd__(self, other):
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        return other + self._object_array()
+
+    def _compare(self, other, op):
+        """문자열 비교 (없는 값은 != 만 True)"""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        result = np.full(len(self), op is operator.ne)
+        missing = self.isna()
+        if is_list_like(other) and not isinstance(other, str):
+            other = _as_objects(other)
+            if len(other) != len(self):
+                raise ValueError("비교할 값의 개수가 행 수와 다릅니다.")
+            missing = missing | _missing_mask(other)
+            other = other[~missing]
+        elif pd.isna(other):
+            return result
+        result[~missing] = op(self._to_objects()[~missing], other)
+        return result
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+
+def _object_method(name):
+    """object 배열의 같은 이름 메서드로 넘기는 메서드"""
+
+    def method(self, *args, **kwargs):
+        return getattr(self._object_array(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+# .str 접근자가 부르는 _str_* 메서드 (object 배열이 가진 것을 모두 넘김)
+for _name in dir(type(pd.array([], dtype=object))):
+    if _name.startswith("_str_"):
+        setattr(_CompactArray, _name, _object_method(_name))
+
+
+class _CompactDtype(ExtensionDtype):
+    """두 dtype의 공통 속성 (값은 str, 없는 값은 NaN)"""
+
+    type = str
+    kind = "O"
+    na_value = np.nan
+
+    def __repr__(self):
+        return self.name
+
+
+@register_extension_dtype
+class CompactStringDtype(_CompactDtype):
+    """CompactStringArray의 dtype"""
+
+    name = "compact_string"
+
+    @classmethod
+    def construct_array_type(cls):
+        return CompactStringArray
+
+
+class CompactStringArray(_CompactArray):
+    """
+    문자열을 UTF-8 바이트 버퍼 하나 + 오프셋 배열로 저장하는 확장 배열
+
+    행당 str 객체(최소 약 50바이트) 대신 글자 바이트 + 오프셋 8바이트 + 마스크 1바이트만 쓴다.
+    """
+
+    def __init__(self, data, offsets, mask):
+        """
+        Args:
+            data (np.ndarray): 모든 값을 이어 붙인 UTF-8 바이트 (uint8)
+            offsets (np.ndarray): 값마다 시작 위치 + 끝 위치 (int64, 길이 n+1)
+            mask (np.ndarray): 없는 값 위치 (bool)
+        """
+        self._data = data
+        self._offsets = offsets
+        self._mask = mask
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        values = _as_objects(scalars)
+        mask = _missing_mask(values)
+        strings = [
+            "" if missing else str(value) for value, missing in zip(values, mask)
+        ]
+        data, offsets = _encode(strings)
+        return cls(data, offsets, mask)
+
+    @property
+    def dtype(self):
+        return CompactStringDtype()
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._offsets.nbytes + self._mask.nbytes
+
+    def __len__(self):
+        return len(self._mask)
+
+    def isna(self):
+        return self._mask.copy()
+
+    def copy(self):
+        return type(self)(self._data.copy(), self._offsets.copy(), self._mask.copy())
+
+    def _scalar(self, position):
+        if self._mask[position]:
+            return self.dtype.na_value
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return self._data[start:end].tobytes().decode("utf-8", "surrogatepass")
+
+    def _to_strings(self):
+        """모든 값을 str 목록으로 (없는 값은 빈 문자열)"""
+        bounds = zip(self._offsets[:-1].tolist(), self._offsets[1:].tolist())
+        buffer = self._data.tobytes()
+        if buffer.isascii():
+            text = buffer.decode("ascii")
+            return [text[start:end] for start, end in bounds]
+        return [
+            buffer[start:end].decode("utf-8", "surrogatepass") for start, end in bounds
+        ]
+
+    def _to_objects(self):
+        values = np.empty(len(self), dtype=object)
+        values[:] = self._to_strings()
+        values[self._mask] = self.dtype.na_value
+        return values
+
+    def _assign(self, positions, replacement):
+        """정렬된 positions 행의 값을 replacement로 바꿈 (self를 직접 고침)"""
+        lengths = np.diff(self._offsets)
+        if len(positions) > len(self) * SPLICE_FRACTION:
+            # 새 값을 뒤에 붙인 뒤 한 번에 다시 모음
+            combined = self._concat_same_type([self, replacement])
+            indices = np.arange(len(self))
+            indices[positions] = len(self) + np.arange(len(positions))
+            self.__dict__.update(combined.take(indices).__dict__)
+            return
+
+        # 보정 창처럼 몇 행만 바꿀 때: 바뀌지 않은 구간은 그대로 복사하고 새 값만 끼움
+        pieces = []
+        previous = 0
+        bounds = zip(
+            positions.tolist(),
+            replacement._offsets[:-1].tolist(),
+            replacement._offsets[1:].tolist(),
+        )
+        for position, start, end in bounds:
+            pieces.append(self._data[previous : self._offsets[position]])
+            pieces.append(replacement._data[start:end])
+            previous = self._offsets[position + 1]
+        pieces.append(self._data[previous:])
+
+        lengths[positions] = np.diff(replacement._offsets)
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        mask = self._mask.copy()
+        mask[positions] = replacement._mask
+        self._data, self._offsets, self._mask = np.concatenate(pieces), offsets, mask
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        positions, fill = _normalize_take(indices, len(self), allow_fill)
+        if not len(self):
+            return self._from_sequence([None] * len(positions))
+
+        starts = self._offsets[positions]
+        lengths = self._offsets[positions + 1] - starts
+        lengths[fill] = 0
+        offsets = np.zeros(len(positions) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # 출력 바이트 위치 + (원래 시작 - 새 시작) = 원래 바이트 위치 (블록 단위로 모음)
+        data = np.empty(offsets[-1], dtype=np.uint8)
+        shifts = starts - offsets[:-1]
+        for lo in range(0, len(positions), GATHER_BLOCK):
+            hi = min(lo + GATHER_BLOCK, len(positions))
+            first, last = offsets[lo], offsets[hi]
+            if first == last:
+                continue
+            source = np.arange(first, last) + np.repeat(shifts[lo:hi], lengths[lo:hi])
+            data[first:last] = self._data[source]
+
+        return type(self)(data, offsets, fill | self._mask[positions])
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        sizes = np.cumsum([0] + [len(array._data) for array in to_concat])
+        offsets = [np.zeros(1, dtype=np.int64)]
+        offsets += [
+            array._offsets[1:] + shift for array, shift in zip(to_concat, sizes)
+        ]
+        return cls(
+            np.concatenate([array._data for array in to_concat]),
+            np.concatenate(offsets),
+            np.concatenate([array._mask for array in to_concat]),
+        )
+
+
+@register_extension_dtype
+class PathDtype(_CompactDtype):
+    """PathArray의 dtype"""
+
+    name = "compact_path"
+
+    @classmethod
+    def construct_array_type(cls):
+        return PathArray
+
+
+def _split_path(path):
+    """경로를 (마지막 구분자까지의 폴더 부분, 파일 이름)으로 (두 부분을 이으면 원래 경로)"""
+    if os.altsep:
+        # Windows는 / 도 구분자
+        cut = max(path.rfind(os.sep), path.rfind(os.altsep)) + 1
+        return path[:cut], path[cut:]
+    head, sep, name = path.rpartition(os.sep)
+    return head + sep, name
+
+
+class PathArray(_CompactArray):
+    """
+    파일 경로를 폴더 사전 + 폴더 번호 + 파일 이름으로 저장하는 확장 배열
+
+    같은 폴더의 사진 수백~수천 장이 폴더 문자열 하나를 공유하므로 행당
+    폴더 번호 4바이트 + 파일 이름 바이트만 쓴다. 값은 폴더 + 파일 이름으로 다시 만든다.
+    """
+
+    def __init__(self, directories, codes, names):
+        """
+        Args:
+            directories (list): 폴더 부분 문자열 목록 (끝 구분자 포함)
+            codes (np.ndarray): 행마다 directories 위치 (int32, 없는 값은 -1)
+            names (CompactStringArray): 행마다 파일 이름
+        """
+        self._directories = directories
+        self._codes = codes
+        self._names = names
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        values = _as_objects(scalars)
+        mask = _missing_mask(values)
+        parts = [
+            ("", "") if missing else _split_path(str(value))
+            for value, missing in zip(values, mask.tolist())
+        ]
+        lookup = {}
+        codes = np.fromiter(
+            (lookup.setdefault(directory, len(lookup)) for directory, _ in parts),
+            dtype=np.int32,
+            count=len(parts),
+        )
+        codes[mask] = -1
+        data, offsets = _encode([name for _, name in parts])
+        return cls(list(lookup), codes, CompactStringArray(data, offsets, mask))
+
+    @property
+    def dtype(self):
+        return PathDtype()
+
+    @property
+    def nbytes(self):
+        directories = sum(len(directory) for directory in self._directories)
+        return self._codes.nbytes + self._names.nbytes + directories
+
+    @property
+    def directories(self):
+        """폴더 부분 문자열 목록 (끝 구분자 포함)"""
+        return list(self._directories)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def isna(self):
+        return self._codes < 0
+
+    def copy(self):
+        return type(self)(
+            list(self._directories), self._codes.copy(), self._names.copy()
+        )
+
+    def _scalar(self, position):
+        code = self._codes[position]
+        if code < 0:
+            return self.dtype.na_value
+        return self._directories[code] + self._names._scalar(position)
+
+    def _to_objects(self):
+        # 폴더 부분 + 파일 이름을 object 배열끼리 한 번에 더함 (없는 값은 "" + "" 후 NaN)
+        directories = np.empty(len(self._directories) + 1, dtype=object)
+        directories[:] = self._directories + [""]
+        names = np.empty(len(self), dtype=object)
+        names[:] = self._names._to_strings()
+        values = directories[self._codes] + names
+        values[self.isna()] = self.dtype.na_value
+        return values
+
+    def _assign(self, positions, replacement):
+        """정렬된 positions 행의 값을 replacement로 바꿈 (self를 직접 고침)"""
+        directories, remap = self._merge_directories(self._directories, replacement)
+        codes = self._codes.copy()
+        codes[positions] = remap[replacement._codes]
+        self._names._assign(positions, replacement._names)
+        self._directories, self._codes = directories, codes
+
+    @staticmethod
+    def _merge_directories(directories, other):
+        """
+        directories 뒤에 other의 폴더를 합친 사전
+
+        Returns:
+            tuple: (합친 폴더 목록, other 폴더 번호 → 합친 번호 배열 (-1은 그대로))
+        """
+        lookup = {directory: code for code, directory in enumerate(directories)}
+        remap = [
+            lookup.setdefault(directory, len(lookup)) for directory in other._directories
+        ]
+        return list(lookup), np.array(remap + [-1], dtype=np.int32)
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        positions, fill = _normalize_take(indices, len(self), allow_fill)
+        if not len(self):
+            return self._from_sequence([None] * len(positions))
+        codes = self._codes[positions]
+        codes[fill] = -1
+        names = self._names.take(np.where(fill, -1, positions), allow_fill=True)
+        return type(self)(self._directories, codes, names)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        directories = to_concat[0]._directories
+        codes = [to_concat[0]._codes]
+        for array in to_concat[1:]:
+            # 뒤 배열의 폴더 번호를 합친 사전의 번호로 바꿈
+            directories, remap = cls._merge_directories(directories, array)
+            codes.append(remap[array._codes])
+        return cls(
+            directories,
+            np.concatenate(codes),
+            CompactStringArray._concat_same_type([array._names for array in to_concat]),
+        )
+
+    def _rows_in(self, paths):
+        """paths(경로 집합)에 든 행 마스크 (폴더가 맞는 행의 파일 이름만 비교)"""
+        wanted = {}
+        for path in paths:
+            if isinstance(path, str):
+                directory, name = _split_path(path)
+                wanted.setdefault(directory, set()).add(name)
+
+        result = np.zeros(len(self), dtype=bool)
+        for code, directory in enumerate(self._directories):
+            names = wanted.get(directory)
+            if not names:
+                continue
+            rows = np.flatnonzero(self._codes == code)
+            found = [name in names for name in self._names.take(rows)._to_strings()]
+            result[rows[np.array(found, dtype=bool)]] = True
+        return result
+
+    def isin(self, values):
+        return self._rows_in(set(values))
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self._rows_in([other])
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        if isinstance(other, str):
+            return ~self._rows_in([other])
+        return self._compare(other, operator.ne)
+
+
+@register_extension_dtype
+class CoordinateDtype(ExtensionDtype):
+    """CoordinateArray의 dtype (값은 float, 없는 값은 NaN)"""
+
+    name = "microdegree"
+    type = float
+    # "f"로 두면 pandas 내부 알고리즘이 numpy float 배열로 취급하므로 일반 확장 dtype처럼 "O"
+    kind = "O"
+    na_value = np.nan
+    _is_numeric = True
+
+    def __repr__(self):
+        return self.name
+
+    @classmethod
+    def construct_array_type(cls):
+        return CoordinateArray
+
+    def _get_common_dtype(self, dtypes):
+        # 숫자 컬럼과 합치면 좌표 컬럼 그대로 (예: 부분 결과 + 직접 만든 float 표)
+        for dtype in dtypes:
+            if not isinstance(dtype, CoordinateDtype) and (
+                not isinstance(dtype, np.dtype) or dtype.kind not in "fiu"
+            ):
+                return None
+        return self
+
+
+class CoordinateArray(ExtensionArray):
+    """
+    위도/경도를 int32 마이크로도(값 × 1,000,000)로 저장하는 확장 배열
+
+    값은 마이크로도 / 1,000,000인 float로 보이므로 내보내기에 쓰는 소수점 6자리
+    (약 0.1m)까지 정확하다 (37.123456 → 37.123456). 행당 int32 4바이트 + 마스크 1바이트.
+    int32에 담기지 않는 값(±2147도 초과, 좌표가 아닌 값)은 없는 값으로 둔다.
+    """
+
+    def __init__(self, micro, mask):
+        """
+        Args:
+            micro (np.ndarray): 마이크로도 값 (int32, 없는 값은 0)
+            mask (np.ndarray): 없는 값 위치 (bool)
+        """
+        self._micro = micro
+        self._mask = mask
+
+    @classmethod
+    def _from_floats(cls, values):
+        """float 배열(없는 값은 NaN)로 만들기 (소수점 6자리로 반올림)"""
+        scaled = np.rint(np.asarray(values, dtype=np.float64) * MICRODEGREES)
+        with np.errstate(invalid="ignore"):
+            mask = ~(np.abs(scaled) <= np.iinfo(np.int32).max)
+        micro = np.where(mask, 0, scaled).astype(np.int32)
+        return cls(micro, mask)
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        if isinstance(scalars, np.ndarray) and scalars.dtype.kind in "fiu":
+            return cls._from_floats(scalars)
+        numbers = pd.to_numeric(pd.Series(_as_objects(scalars), dtype=object))
+        return cls._from_floats(numbers.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._from_floats(values)
+
+    @property
+    def dtype(self):
+        return CoordinateDtype()
+
+    @property
+    def nbytes(self):
+        return self._micro.nbytes + self._mask.nbytes
+
+    def __len__(self):
+        return len(self._micro)
+
+    def isna(self):
+        return self._mask.copy()
+
+    def copy(self):
+        return type(self)(self._micro.copy(), self._mask.copy())
+
+    def _floats(self):
+        """값을 float64 배열로 (없는 값은 NaN)"""
+        values = self._micro / MICRODEGREES
+        values[self._mask] = np.nan
+        return values
+
+    def __getitem__(self, item):
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        if is_integer(item):
+            if self._mask[item]:
+                return self.dtype.na_value
+            return np.float64(self._micro[item] / MICRODEGREES)
+        if is_list_like(item):
+            item = check_array_indexer(self, item)
+        return type(self)(self._micro[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        if is_list_like(key):
+            key = check_array_indexer(self, key)
+        if is_list_like(value):
+            replacement = self._from_sequence(value)
+            self._micro[key] = replacement._micro
+            self._mask[key] = replacement._mask
+        else:
+            # 값 하나는 모든 위치에 그대로
+            replacement = self._from_sequence([value])
+            self._micro[key] = replacement._micro[0]
+            self._mask[key] = replacement._mask[0]
+
+    def __iter__(self):
+        return iter(self._floats().tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self._floats()
+        return values if dtype is None else values.astype(dtype)
+
+    def astype(self, dtype, copy=True):
+        dtype = pandas_dtype(dtype)
+        if dtype == self.dtype:
+            return self.copy() if copy else self
+        if isinstance(dtype, np.dtype):
+            return self._floats().astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def round(self, decimals=0, *args, **kwargs):
+        return self._from_floats(np.round(self._floats(), decimals))
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        positions, fill = _normalize_take(indices, len(self), allow_fill)
+        if not len(self):
+            return self._from_floats(np.full(len(positions), np.nan))
+        return type(self)(self._micro[positions], fill | self._mask[positions])
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        to_concat = list(to_concat)
+        return cls(
+            np.concatenate([array._micro for array in to_concat]),
+            np.concatenate([array._mask for array in to_concat]),
+        )
+
+    def _values_for_factorize(self):
+        return self._floats(), np.nan
+
+    def _values_for_argsort(self):
+        return self._floats()
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        # min/max/mean 등은 float 컬럼과 같게 계산
+        result = getattr(pd.Series(self._floats()), name)(skipna=skipna, **kwargs)
+        return np.array([result]) if keepdims else result
+
+    def _operate(self, other, op):
+        """float 컬럼과 같은 연산 (비교는 bool 배열, 산술은 float64 배열)"""
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, CoordinateArray):
+            other = other._floats()
+        return op(self._floats(), other)
+
+    def __neg__(self):
+        return -self._floats()
+
+    def __abs__(self):
+        return np.abs(self._floats())
+
+
+def _coordinate_operator(op, reflected=False):
+    """CoordinateArray의 연산자 메서드 (reflected는 b <op> a)"""
+    if reflected:
+
+        def method(self, other):
+            return self._operate(other, lambda a, b: op(b, a))
+
+    else:
+
+        def method(self, other):
+            return self._operate(other, op)
+
+    return method
+
+
+for _op in (
+    operator.eq,
+    operator.ne,
+    operator.lt,
+    operator.le,
+    operator.gt,
+    operator.ge,
+    operator.add,
+    operator.sub,
+    operator.mul,
+    operator.truediv,
+):
+    setattr(CoordinateArray, f"__{_op.__name__}__", _coordinate_operator(_op))
+    if _op in (operator.add, operator.sub, operator.mul, operator.truediv):
+        setattr(
+            CoordinateArray,
+            f"__r{_op.__name__}__",
+            _coordinate_operator(_op, reflected=True),
+        )
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Adaptive Concurrency Controller
+파일별 처리 시간과 처리량을 보면서 동시에 처리할 파일 수를 AIMD 방식으로 조절하는 컨트롤러
+(처리량이 늘면 1씩 올리고, 지연만 늘고 처리량이 떨어지면 비율로 줄임)
+로컬 NVMe처럼 빠른 저장소에서는 높게, USB HDD처럼 느린 저장소에서는 낮게 자리잡음
+AdaptiveExecutor는 묶음이 바뀌어도 실행 중인 작업이 0으로 비지 않도록
+묶음 경계 없이 컨트롤러가 정한 수만큼 작업을 이어서 넣어줌
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 동시성 범위 / 시작 값
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 32
+INITIAL_CONCURRENCY = 2
+
+# 측정 구간: 최소 완료 파일 수와 최소 시간(초)을 모두 채워야 판단
+WINDOW_MIN_FILES = 16
+WINDOW_MIN_SECONDS = 0.25
+
+# 처리량이 이만큼 이상 늘면 증가, 이만큼 이상 줄면 감소 (그 사이는 유지)
+INCREASE_GAIN = 0.05
+DECREASE_LOSS = 0.10
+# 지연이 가장 좋았을 때의 이 배수 이하이면 아직 여유가 있다고 보고 증가,
+# 혼잡 배수를 넘는데 처리량이 늘지 않으면 대기열만 길어진 것으로 보고 감소
+IDLE_LATENCY_RATIO = 1.2
+CONGESTED_LATENCY_RATIO = 2.0
+# 감소할 때 곱하는 비율
+DECREASE_FACTOR = 0.75
+
+
+class AimdController:
+    def __init__(
+        self,
+        min_level=MIN_CONCURRENCY,
+        max_level=MAX_CONCURRENCY,
+        initial=INITIAL_CONCURRENCY,
+    ):
+        """
+        AIMD 동시성 컨트롤러 초기화
+
+        Args:
+            min_level (int): 최소 동시 처리 수
+            max_level (int): 최대 동시 처리 수
+            initial (int): 시작 동시 처리 수
+        """
+        self.min_level = min_level
+        self.max_level = max(min_level, max_level)
+        self.level = min(max(initial, min_level), self.max_level)
+
+        self._window_start = time.perf_counter()
+        self._window_files = 0
+        self._window_latency = 0.0
+        self._last_throughput = None
+        self._best_latency = None
+
+        # 구간별 (동시성, 처리량) 기록 → 자리잡은 값 계산
+        self.history = []
+
+    def record(self, latency):
+        """
+        파일 하나의 처리 완료 기록 (구간이 차면 동시성 조정)
+
+        Args:
+            latency (float): 그 파일을 읽는 데 걸린 시간(초)
+        """
+        self._window_files += 1
+        self._window_latency += latency
+
+        elapsed = time.perf_counter() - self._window_start
+        if self._window_files < max(WINDOW_MIN_FILES, self.level * 2):
+            return
+        if elapsed < WINDOW_MIN_SECONDS:
+            return
+
+        throughput = self._window_files / elapsed
+        avg_latency = self._window_latency / self._window_files
+        self._adjust(throughput, avg_latency)
+
+        self._window_start = time.perf_counter()
+        self._window_files = 0
+        self._window_latency = 0.0
+
+    def skip_idle(self, seconds):
+        """
+        처리할 작업이 없던 시간을 측정 구간에서 빼기
+        (입력이 늦어 쉰 시간이 처리량 저하로 잡히지 않도록)
+
+        Args:
+            seconds (float): 실행 중인 작업이 없던 시간(초)
+        """
+        self._window_start += seconds
+
+    def _adjust(self, throughput, avg_latency):
+        """한 구간의 측정값으로 동시성 증가(+1) / 감소(×DECREASE_FACTOR) / 유지 결정"""
+        self.history.append((self.level, throughput))
+        if self._best_latency is None or avg_latency < self._best_latency:
+            self._best_latency = avg_latency
+
+        previous = self._last_throughput
+        self._last_throughput = throughput
+        old_level = self.level
+
+        dropped = previous is not None and throughput < previous * (1 - DECREASE_LOSS)
+        gained = previous is None or throughput > previous * (1 + INCREASE_GAIN)
+        congested = avg_latency > self._best_latency * CONGESTED_LATENCY_RATIO
+
+        if dropped or (congested and not gained):
+            # 처리량이 떨어지거나 지연만 늘어남 → 저장소가 포화됨
+            self.level = max(self.min_level, int(self.level * DECREASE_FACTOR))
+        elif gained or avg_latency <= self._best_latency * IDLE_LATENCY_RATIO:
+            self.level = min(self.max_level, self.level + 1)
+
+        if self.level != old_level:
+            logger.debug(
+                f"동시성 {old_level} → {self.level} "
+                f"(처리량 {throughput:.1f} 파일/초, 평균 지연 {avg_latency * 1000:.1f}ms)"
+            )
+
+    def settled_level(self):
+        """
+        자리잡은 동시성 (마지막 구간들 중 가장 자주 쓰인 값, 측정 구간이 없으면 현재 값)
+        """
+        recent = [level for level, _ in self.history[-8:]]
+        if not recent:
+            return self.level
+        return max(set(recent), key=lambda level: (recent.count(level), level))
+
+    def summary(self):
+        """로그용 요약 문자열"""
+        if not self.history:
+            return f"적응형 동시성: 측정 구간이 없어 {self.level}로 처리했습니다."
+        best_level, best_throughput = max(self.history, key=lambda item: item[1])
+        return (
+            f"적응형 동시성: {self.settled_level()}에서 자리잡음 "
+            f"(최고 처리량 {best_throughput:.1f} 파일/초 @ 동시성 {best_level}, "
+            f"측정 구간 {len(self.history)}개)"
+        )
+
+
+class AdaptiveExecutor:
+    def __init__(self, controller):
+        """
+        컨트롤러가 정한 수만큼만 동시에 실행하는 실행기 초기화
+
+        제출한 작업은 대기열에 쌓였다가 자리가 날 때마다 차례로 실행되므로,
+        앞 묶음의 마지막 파일들을 읽는 동안 다음 묶음의 파일이 이어서 들어감
+
+        Args:
+            controller (AimdController): 동시 처리 수를 정하는 컨트롤러
+        """
+        self.controller = controller
+        self._pool = ThreadPoolExecutor(max_workers=controller.max_level)
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._in_flight = 0
+        self._closed = False
+        # 실행 중인 작업도 대기열도 없게 된 시각 (작업 중이면 None)
+        self._idle_since = time.perf_counter()
+
+    def submit(self, timed, *args):
+        """
+        작업 제출
+
+        Args:
+            timed: (결과, 잰 시간(초) 또는 None)을 돌려주는 함수.
+                잰 시간만 컨트롤러에 기록됨 (None이면 기록하지 않음)
+
+        Returns:
+            Future: 결과만 담기는 Future
+        """
+        future = Future()
+        with self._lock:
+            self._queue.append((future, timed, args))
+            self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """허용된 수까지 대기열의 작업을 풀에 넣기 (self._lock을 잡은 상태에서 호출)"""
+        while (
+            not self._closed
+            and self._queue
+            and self._in_flight < self.controller.level
+        ):
+            if self._idle_since is not None:
+                self.controller.skip_idle(time.perf_counter() - self._idle_since)
+                self._idle_since = None
+            self._in_flight += 1
+            self._pool.submit(self._run, *self._queue.popleft())
+
+    def _run(self, future, timed, args):
+        """풀 스레드에서 작업 하나 실행 후 결과 전달"""
+        if not future.set_running_or_notify_cancel():
+            self._finish(None)
+            return
+        try:
+            result, seconds = timed(*args)
+        except BaseException as error:
+            self._finish(None)
+            future.set_exception(error)
+            return
+        self._finish(seconds)
+        future.set_result(result)
+
+    def _finish(self, seconds):
+        """작업 하나가 끝났을 때 지연 기록 후 다음 작업 넣기"""
+        with self._lock:
+            self._in_flight -= 1
+            if seconds is not None:
+                self.controller.record(seconds)
+            if not self._in_flight and not self._queue:
+                self._idle_since = time.perf_counter()
+            self._dispatch()
+
+    def shutdown(self):
+        """아직 시작하지 않은 작업은 취소하고 실행 중인 작업이 끝날 때까지 대기"""
+        with self._lock:
+            self._closed = True
+            pending, self._queue = self._queue, deque()
+        for future, _, _ in pending:
+            future.cancel()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
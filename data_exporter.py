@@ -4,7 +4,6 @@ Data Exporter for Google My Maps
 CSV/KML 파일 생성 및 내보내기
 """
 
-import pandas as pd
 import simplekml
 from pathlib import Path
 import logging
@@ -13,6 +12,9 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# 감시 모드에서 덮어쓰는 내보내기 파일 이름에 붙는 이름
+LATEST_LABEL = "latest"
+
 
 class DataExporter:
     def __init__(self, processor):
@@ -33,35 +35,26 @@ class DataExporter:
         if self.processor.df.empty:
             raise ValueError("내보낼 데이터가 없습니다. 먼저 EXIF 처리를 완료해주세요.")
 
-        # 완전한 데이터만 필터링 (날짜와 GPS 모두 있는 것)
-        export_df = self.processor.df[
-            (self.processor.df["DateTimeOriginal"].notna())
-            & (self.processor.df["GPSLat"].notna())
-            & (self.processor.df["GPSLong"].notna())
-        ].copy()
+        # 촬영 시각은 추출할 때 만든 datetime 컬럼 사용 (직접 만든 표라면 한 번 계산)
+        if "datetime" not in self.processor.df.columns:
+            self.processor.refresh_capture_times()
 
-        if export_df.empty:
+        # 완전한 데이터만 필터링 (날짜와 GPS 모두 있는 것)
+        complete = self.processor.status_index("complete")
+        if complete.empty:
             raise ValueError("내보낼 수 있는 완전한 데이터가 없습니다.")
 
-        # datetime 컬럼이 없으면 생성
-        if "datetime" not in export_df.columns:
-            export_df["datetime"] = pd.to_datetime(
-                export_df["DateTimeOriginal"], errors="coerce"
-            )
-
         # chunk_id가 없으면 재생성
-        if "chunk_id" not in export_df.columns or export_df["chunk_id"].isna().all():
+        df = self.processor.df
+        if "chunk_id" not in df.columns or df.loc[complete, "chunk_id"].isna().all():
             self.processor.detect_date_chunks()
-            export_df = self.processor.df[
-                (self.processor.df["DateTimeOriginal"].notna())
-                & (self.processor.df["GPSLat"].notna())
-                & (self.processor.df["GPSLong"].notna())
-            ].copy()
+            complete = self.processor.status_index("complete")
+        export_df = self.processor.df.loc[complete]
 
         # order 컬럼 추가
-        export_df["order"] = export_df.groupby("chunk_id")["datetime"].rank(
-            method="dense", ascending=True
-        )
+        export_df["order"] = export_df.groupby("chunk_id", observed=True)[
+            "datetime"
+        ].rank(method="dense", ascending=True)
         export_df["order"] = export_df["order"].astype(int)
 
         # 정렬
@@ -146,7 +139,7 @@ class DataExporter:
         kml.document.description = f"총 {len(export_df)}개 사진의 위치 정보 (생성일: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
 
         # chunk_id별로 폴더 생성
-        for chunk_id, chunk_df in export_df.groupby("chunk_id"):
+        for chunk_id, chunk_df in export_df.groupby("chunk_id", observed=True):
             # 날짜 범위 계산
             start_date = chunk_df["datetime"].min().strftime("%Y-%m-%d")
             end_date = chunk_df["datetime"].max().strftime("%Y-%m-%d")
@@ -163,6 +156,7 @@ class DataExporter:
             for _, row in chunk_df.sort_values("order").iterrows():
                 point = folder.newpoint()
                 point.name = f"{row['order']:02d}. {row['FileName']}"
+                # 좌표는 소수점 6자리(약 0.1m)까지 저장되어 있음 (37.881207)
                 point.coords = [(row["GPSLong"], row["GPSLat"])]
 
                 # 상세 정보
@@ -199,19 +193,26 @@ class DataExporter:
         logger.info(f"KML 파일 내보내기 완료: {output_path}")
         return str(output_path)
 
-    def export_chunk_separated_csv(self):
+    def export_chunk_separated_csv(self, chunk_ids=None, label=None):
         """
         chunk_id별로 분리된 CSV 파일들 생성
 
+        Args:
+            chunk_ids: 이 덩어리들의 파일만 생성 (None이면 전체)
+            label: 파일명 뒤에 붙일 이름 (None이면 생성 시각)
+
         Returns:
             list: 생성된 파일 경로들
         """
         export_df = self.prepare_export_data()
         output_files = []
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = label or datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        if chunk_ids is not None:
+            export_df = export_df[export_df["chunk_id"].isin(set(chunk_ids))]
 
-        for chunk_id, chunk_df in export_df.groupby("chunk_id"):
+        for chunk_id, chunk_df in export_df.groupby("chunk_id", observed=True):
             filename = f"photo_exif_{chunk_id}_{timestamp}.csv"
             output_path = self.output_dir / filename
 
@@ -240,6 +241,56 @@ class DataExporter:
 
         return output_files
 
+    def update_latest_exports(self, output_format="all", chunk_ids=None):
+        """
+        감시 모드용: 고정된 파일명(*_latest)의 내보내기 파일 갱신
+
+        chunk_ids가 주어지면 분리 CSV는 그 덩어리 파일만 다시 쓰고,
+        더 이상 없는 덩어리의 파일은 삭제한다. 통합 CSV/KML은 전체를 다시 쓴다.
+
+        Args:
+            output_format: "csv", "kml", "separated", "all"
+            chunk_ids: 바뀐 chunk_id 목록 (None이면 모든 덩어리)
+
+        Returns:
+            dict: 생성/삭제된 파일 경로들
+        """
+        results = {}
+
+        if output_format in ("csv", "all"):
+            results["csv"] = self.export_csv(f"photo_exif_export_{LATEST_LABEL}.csv")
+        if output_format in ("kml", "all"):
+            results["kml"] = self.export_kml(f"photo_exif_export_{LATEST_LABEL}.kml")
+
+        if output_format in ("separated", "all"):
+            results["chunk_csvs"] = self.export_chunk_separated_csv(
+                chunk_ids, label=LATEST_LABEL
+            )
+
+            # 합쳐지거나 사라진 덩어리의 파일 삭제
+            written = {Path(path).name for path in results["chunk_csvs"]}
+            if chunk_ids is None:
+                candidates = self.output_dir.glob(f"photo_exif_*_{LATEST_LABEL}.csv")
+                candidates = [
+                    path
+                    for path in candidates
+                    if path.name != f"photo_exif_export_{LATEST_LABEL}.csv"
+                ]
+            else:
+                candidates = [
+                    self.output_dir / f"photo_exif_{chunk_id}_{LATEST_LABEL}.csv"
+                    for chunk_id in chunk_ids
+                ]
+
+            results["removed"] = []
+            for path in candidates:
+                if path.name not in written and path.exists():
+                    path.unlink()
+                    results["removed"].append(str(path))
+                    logger.info(f"사라진 덩어리 CSV 삭제: {path}")
+
+        return results
+
     def create_google_my_maps_guide(self):
         """
         Google My Maps 업로드 가이드 텍스트 파일 생성
@@ -355,7 +406,7 @@ class DataExporter:
 == 날짜 덩어리별 상세 ==
 """
 
-        for chunk_id, chunk_df in export_df.groupby("chunk_id"):
+        for chunk_id, chunk_df in export_df.groupby("chunk_id", observed=True):
             start_date = chunk_df["datetime"].min().strftime("%Y-%m-%d")
             end_date = chunk_df["datetime"].max().strftime("%Y-%m-%d")
             date_range = (
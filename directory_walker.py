@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Directory Walker
+os.scandir 기반 폴더 탐색기
+DirEntry의 파일 종류 정보를 그대로 써서 항목마다 stat을 하지 않고,
+하위 폴더는 스레드 풀에 나눠서 읽음 (SMB/NFS처럼 목록 읽기가 느린 곳에서 효과적)
+.photoexifignore 규칙과 기본 제외 목록에 걸리는 폴더는 내려가기 전에 잘라냄
+"""
+
+import fnmatch
+import logging
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 폴더 목록을 동시에 읽는 스레드 수
+DEFAULT_WALK_WORKERS = 8
+
+# 사진 폴더 최상위에 두는 제외 규칙 파일 (한 줄에 glob 하나, #은 주석, \#은 '#' 문자)
+IGNORE_FILE_NAME = ".photoexifignore"
+
+# 기본 제외 규칙: 숨김 폴더(.thumbnails, .Trash 등), NAS 썸네일/휴지통,
+# Lightroom 미리보기 캐시, macOS AppleDouble 파일
+DEFAULT_IGNORE_PATTERNS = (
+    ".*/",
+    "@eaDir/",
+    "@__thumb/",
+    "#recycle/",
+    "#snapshot/",
+    "$RECYCLE.BIN/",
+    "System Volume Information/",
+    "*.lrdata/",
+    "._*",
+)
+
+
+class IgnoreRules:
+    def __init__(self, patterns=()):
+        """
+        gitignore 형식의 glob 제외 규칙
+
+        - '/'가 없는 패턴은 어느 위치의 이름에나 적용 (예: @eaDir/, *.tmp)
+        - '/'가 있는 패턴은 사진 폴더 기준 상대 경로에 적용 (예: /raw/2019)
+        - '/'로 끝나는 패턴은 폴더에만 적용
+
+        Args:
+            patterns: glob 패턴 목록
+        """
+        self.patterns = []
+        groups = {
+            (False, False): [],  # (경로 기준, 폴더 전용)
+            (False, True): [],
+            (True, False): [],
+            (True, True): [],
+        }
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern:
+                continue
+            self.patterns.append(pattern)
+
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            groups[(anchored, dir_only)].append(fnmatch.translate(pattern.lstrip("/")))
+
+        # 패턴마다 fnmatch를 돌리지 않도록 그룹별로 정규식 하나로 합침
+        self._regex = {
+            key: re.compile("|".join(parts)) if parts else None
+            for key, parts in groups.items()
+        }
+
+    @classmethod
+    def load(cls, root, use_defaults=True):
+        """
+        기본 규칙과 root/.photoexifignore 규칙 읽기
+
+        Args:
+            root (str | Path): 사진 폴더
+            use_defaults (bool): 기본 제외 규칙 사용 여부
+        """
+        patterns = list(DEFAULT_IGNORE_PATTERNS) if use_defaults else []
+        ignore_file = Path(root) / IGNORE_FILE_NAME
+        if ignore_file.is_file():
+            try:
+                lines = ignore_file.read_text(encoding="utf-8").splitlines()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"{IGNORE_FILE_NAME} 읽기 실패: {e}")
+                lines = []
+            for line in lines:
+                line = line.strip()
+                if line.startswith("#"):
+                    continue
+                patterns.append(line[1:] if line.startswith("\\#") else line)
+        return cls(patterns)
+
+    def match(self, rel_path, is_dir):
+        """
+        사진 폴더 기준 상대 경로(/ 구분) 하나가 제외 대상인지 확인
+
+        Args:
+            rel_path (str): 예: "2024/@eaDir"
+            is_dir (bool): 폴더 여부
+        """
+        name = rel_path.rsplit("/", 1)[-1]
+        for (anchored, dir_only), regex in self._regex.items():
+            if regex is None or (dir_only and not is_dir):
+                continue
+            if regex.match(rel_path if anchored else name):
+                return True
+        return False
+
+    def match_path(self, rel_path, is_dir):
+        """상대 경로 자신이나 상위 폴더 중 하나라도 제외 대상이면 True"""
+        parts = rel_path.split("/")
+        for i in range(1, len(parts) + 1):
+            if self.match("/".join(parts[:i]), is_dir or i < len(parts)):
+                return True
+        return False
+
+
+def _suffix(name):
+    """Path.suffix와 같은 규칙으로 확장자 추출"""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
+
+
+def _scan_dir(directory, rel_dir, suffixes, ignore, follow_symlinks):
+    """
+    폴더 하나의 목록 읽기
+
+    기본적으로 Path.rglob과 같게 심볼릭 링크 폴더로는 내려가지 않고,
+    심볼릭 링크 파일은 대상이 파일이면 포함한다.
+
+    Returns:
+        tuple: (확장자가 맞는 파일 경로 목록,
+                하위 폴더 (경로, 상대 경로, (st_dev, st_ino)) 목록)
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=follow_symlinks):
+                        if ignore is not None and ignore.match(rel_path, True):
+                            continue
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        if st.st_ino == 0:
+                            # Windows의 DirEntry.stat()은 inode를 채우지 않음
+                            st = os.stat(entry.path, follow_symlinks=follow_symlinks)
+                        subdirs.append((entry.path, rel_path, (st.st_dev, st.st_ino)))
+                    elif _suffix(entry.name).lower() in suffixes and entry.is_file():
+                        if ignore is not None and ignore.match(rel_path, False):
+                            continue
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError as e:
+        logger.debug(f"폴더를 읽을 수 없습니다 {directory}: {e}")
+    return files, subdirs
+
+
+def walk_files(
+    root,
+    suffixes,
+    workers=DEFAULT_WALK_WORKERS,
+    ignore=None,
+    base=None,
+    follow_symlinks=False,
+):
+    """
+    root 아래에서 확장자가 suffixes(소문자)에 속하는 파일 경로를 찾는 대로 반환
+
+    제외 규칙에 걸리는 폴더는 목록을 읽지 않고 통째로 건너뛴다.
+    이미 방문한 (st_dev, st_ino) 폴더는 다시 내려가지 않으므로
+    심볼릭 링크/바인드 마운트가 순환해도 끝나고, 같은 폴더를 가리키는
+    여러 경로 중에서는 먼저 만난 경로 하나만 검색한다.
+    순서는 정해져 있지 않으므로 필요하면 호출하는 쪽에서 정렬한다.
+
+    Args:
+        root (str | Path): 탐색할 폴더
+        suffixes (set): 소문자 확장자 집합 (예: {".jpg", ".mov"})
+        workers (int): 폴더 목록을 동시에 읽을 스레드 수 (1이면 순차 탐색)
+        ignore (IgnoreRules): 제외 규칙 (None이면 모두 포함)
+        base (str | Path): 제외 규칙의 상대 경로 기준 폴더 (None이면 root)
+        follow_symlinks (bool): 심볼릭 링크 폴더로도 내려갈지 여부
+
+    Yields:
+        str: 파일 경로
+    """
+    root = os.fspath(root)
+    rel_root = ""
+    if base is not None:
+        rel_root = Path(os.path.relpath(root, base)).as_posix()
+        rel_root = "" if rel_root == "." else rel_root
+
+    try:
+        st = os.stat(root)
+        visited = {(st.st_dev, st.st_ino)}
+    except OSError:
+        visited = set()
+
+    def accept(subdirs):
+        """처음 보는 폴더만 남김 (순환 방지)"""
+        for path, rel_path, key in subdirs:
+            if key in visited:
+                logger.debug(f"이미 방문한 폴더 건너뜀: {path}")
+                continue
+            visited.add(key)
+            yield path, rel_path
+
+    args = (suffixes, ignore, follow_symlinks)
+
+    if workers <= 1:
+        stack = [(root, rel_root)]
+        while stack:
+            files, subdirs = _scan_dir(*stack.pop(), *args)
+            stack.extend(accept(subdirs))
+            yield from files
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_dir, root, rel_root, *args)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for path, rel_path in accept(subdirs):
+                    pending.add(executor.submit(_scan_dir, path, rel_path, *args))
+                yield from files
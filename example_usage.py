@@ -128,29 +128,23 @@ def example_chunk_analysis():
         processor.add_order_column()
 
         # 자동/수동 처리 분류
-        auto_df, manual_date_df, manual_gps_df, manual_both_df = (
-            processor.classify_processing_type()
+        auto_index, manual_date_index, manual_gps_index, manual_both_index = (
+            processor.classify_processing_index()
         )
 
         print("데이터 분류 결과:")
-        print(f"- 자동 처리 가능: {len(auto_df)}개")
-        print(f"- 날짜만 보정 필요: {len(manual_date_df)}개")
-        print(f"- GPS만 보정 필요: {len(manual_gps_df)}개")
-        print(f"- 전체 보정 필요: {len(manual_both_df)}개")
+        print(f"- 자동 처리 가능: {len(auto_index)}개")
+        print(f"- 날짜만 보정 필요: {len(manual_date_index)}개")
+        print(f"- GPS만 보정 필요: {len(manual_gps_index)}개")
+        print(f"- 전체 보정 필요: {len(manual_both_index)}개")
 
         # 덩어리별 상세 분석
         if "chunk_id" in processor.df.columns:
             print("\n덩어리별 상세:")
-            for chunk_id, chunk_df in processor.df.groupby("chunk_id"):
+            for chunk_id, chunk_df in processor.df.groupby("chunk_id", observed=True):
                 if pd.notna(chunk_id):
                     date_range = f"{chunk_df['datetime'].min().date()} ~ {chunk_df['datetime'].max().date()}"
-                    complete_count = len(
-                        chunk_df[
-                            (chunk_df["DateTimeOriginal"].notna())
-                            & (chunk_df["GPSLat"].notna())
-                            & (chunk_df["GPSLong"].notna())
-                        ]
-                    )
+                    complete_count = (chunk_df["status"] == "complete").sum()
                     print(
                         f"  {chunk_id}: {len(chunk_df)}개 사진, 완전한 데이터 {complete_count}개 ({date_range})"
                     )
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Persistent EXIF Cache
+파일별 EXIF 추출 결과를 (경로, 크기, mtime_ns, inode) 기준으로 SQLite에 저장하는 캐시
+바뀌지 않은 파일은 다시 읽지 않고 캐시된 결과를 사용함
+"""
+
+import json
+import os
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 기본 캐시 위치 (DataExporter의 output 폴더 옆)
+DEFAULT_CACHE_PATH = Path("output") / "exif_cache.sqlite3"
+
+# 추출 로직이 바뀌어 예전 결과를 쓰면 안 될 때 올리는 버전
+CACHE_VERSION = 2
+
+# 캐시에 저장하는 추출 결과 필드 (FileName/FilePath는 경로에서 다시 만듦)
+CACHED_FIELDS = (
+    "DateTimeOriginal",
+    "SubSecTimeOriginal",
+    "OffsetTimeOriginal",
+    "GPSLat",
+    "GPSLong",
+)
+
+
+def file_signature(stat_result):
+    """파일이 바뀌었는지 판단하는 (크기, mtime_ns, inode)"""
+    return (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+
+
+class ExifCache:
+    def __init__(self, db_path=DEFAULT_CACHE_PATH):
+        """
+        SQLite 캐시 열기 (없으면 생성)
+
+        여러 실행이 같은 파일을 동시에 쓸 수 있도록 WAL 모드와 busy timeout을 사용한다.
+
+        Args:
+            db_path (str | Path): 캐시 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS exif_cache (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                version INTEGER NOT NULL,
+                result TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def load_folder(self, folder):
+        """
+        폴더 아래 모든 캐시 항목을 한 번의 범위 쿼리로 읽기
+
+        파일마다 SELECT를 하지 않도록 경로 접두사 범위로 한꺼번에 가져온다.
+        경로는 실행 위치와 무관하도록 절대 경로로 저장한다.
+
+        Returns:
+            dict: {경로: ((size, mtime_ns, inode), result dict)} (현재 버전 항목만)
+        """
+        prefix = os.path.abspath(folder)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, size, mtime_ns, inode, result FROM exif_cache "
+                "WHERE path >= ? AND path < ? AND version = ?",
+                (prefix, prefix + "\U0010ffff", CACHE_VERSION),
+            ).fetchall()
+
+        return {
+            path: ((size, mtime_ns, inode), json.loads(result))
+            for path, size, mtime_ns, inode, result in rows
+        }
+
+    def lookup(self, entries, file_path, stat_result):
+        """
+        load_folder 결과에서 파일의 캐시 항목 찾기 (크기/mtime/inode가 같아야 적중)
+
+        Returns:
+            dict: 캐시된 결과 또는 None
+        """
+        entry = entries.get(os.path.abspath(file_path))
+        if entry is not None and entry[0] == file_signature(stat_result):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put_many(self, items):
+        """
+        추출 결과 여러 개를 한 트랜잭션으로 저장
+
+        Args:
+            items: (file_path, stat_result, result dict) 목록
+        """
+        rows = [
+            (
+                os.path.abspath(file_path),
+                *file_signature(stat_result),
+                CACHE_VERSION,
+                json.dumps({key: result.get(key) for key in CACHED_FIELDS}),
+            )
+            for file_path, stat_result, result in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO exif_cache "
+                    "(path, size, mtime_ns, inode, version, result) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def report(self):
+        """이번 실행의 캐시 적중/미적중 요약 문자열"""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"EXIF 캐시: 적중 {self.hits}개, 미적중 {self.misses}개 (적중률 {rate:.1f}%)"
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+Header-only EXIF Reader
+파일 전체를 읽지 않고 JPEG APP1 / TIFF IFD / HEIF Exif 아이템 / PNG 메타데이터 청크만 따라가서
+촬영 시각 태그(DateTimeOriginal, SubSecTimeOriginal, OffsetTimeOriginal)와
+GPS 태그 4개만 디코딩하는 빠른 EXIF 리더
+"""
+
+import mmap
+import re
+import struct
+import zlib
+from fractions import Fraction
+
+from video_atom_reader import VideoFormatError, iter_boxes
+
+# JPEG에서 처음 한 번에 읽는 바이트 수 (썸네일 없는 APP1은 대부분 이 안에 들어감)
+JPEG_HEADER_READ_SIZE = 16 * 1024
+
+# 필요한 태그 번호 (piexif.ExifIFD / piexif.GPSIFD 와 동일)
+TAG_EXIF_IFD_POINTER = 0x8769
+TAG_GPS_IFD_POINTER = 0x8825
+TAG_DATETIME_ORIGINAL = 0x9003
+TAG_OFFSET_TIME_ORIGINAL = 0x9011
+TAG_SUBSEC_TIME_ORIGINAL = 0x9291
+TAG_GPS_LATITUDE_REF = 1
+TAG_GPS_LATITUDE = 2
+TAG_GPS_LONGITUDE_REF = 3
+TAG_GPS_LONGITUDE = 4
+
+# 촬영 시각을 보완하는 Exif IFD 태그 (초 이하 자릿수, UTC 오프셋)
+TIME_DETAIL_TAG_NAMES = {
+    TAG_SUBSEC_TIME_ORIGINAL: "SubSecTimeOriginal",
+    TAG_OFFSET_TIME_ORIGINAL: "OffsetTimeOriginal",
+}
+
+GPS_TAG_NAMES = {
+    TAG_GPS_LATITUDE_REF: "GPSLatitudeRef",
+    TAG_GPS_LATITUDE: "GPSLatitude",
+    TAG_GPS_LONGITUDE_REF: "GPSLongitudeRef",
+    TAG_GPS_LONGITUDE: "GPSLongitude",
+}
+
+# TIFF 필드 타입
+TYPE_ASCII = 2
+TYPE_SHORT = 3
+TYPE_LONG = 4
+TYPE_RATIONAL = 5
+
+# 비정상적으로 큰 IFD는 손상/특이 구조로 보고 piexif에 맡김
+MAX_IFD_ENTRIES = 1000
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# PNG 텍스트 청크를 통째로 읽어도 되는 최대 크기 (그보다 크면 건너뜀)
+MAX_PNG_TEXT_CHUNK_SIZE = 1024 * 1024
+
+PNG_XMP_KEYWORD = b"XML:com.adobe.xmp"
+PNG_RAW_EXIF_KEYWORD = b"Raw profile type exif"
+
+# XMP 안의 exif:Xxx 값 (속성 또는 요소 형식)
+XMP_FIELD_PATTERN = r'exif:{name}\s*=\s*"([^"]*)"|<exif:{name}>([^<]*)</exif:{name}>'
+XMP_DATE_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:T(\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?(Z|[+-]\d{2}:\d{2})?)?"
+)
+XMP_GPS_PATTERN = re.compile(r"^\s*(\d+),(\d+(?:\.\d+)?)(?:,(\d+(?:\.\d+)?))?([NSEW])\s*$")
+
+# HEIF meta 박스 / Exif 아이템을 통째로 읽어도 되는 최대 크기
+MAX_HEIF_META_SIZE = 4 * 1024 * 1024
+MAX_HEIF_EXIF_SIZE = 1024 * 1024
+
+
+class ExifFormatError(Exception):
+    """빠른 리더가 처리하지 못하는 구조 (piexif로 폴백해야 함)"""
+
+
+def parse_tiff_exif(data):
+    """
+    TIFF 구조(바이트 순서 헤더 + IFD) 버퍼에서 필요한 태그만 디코딩
+
+    Args:
+        data: bytes / memoryview / mmap (TIFF 헤더가 0번 오프셋에 있어야 함)
+
+    Returns:
+        dict: DateTimeOriginal, SubSecTimeOriginal, OffsetTimeOriginal, GPSLatitudeRef,
+              GPSLatitude, GPSLongitudeRef, GPSLongitude 중 존재하는 태그
+              (piexif와 같은 값 형식)
+    """
+    if len(data) < 8:
+        raise ExifFormatError("TIFF 헤더가 너무 짧습니다")
+
+    byte_order = bytes(data[0:2])
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        raise ExifFormatError(f"알 수 없는 바이트 순서: {byte_order!r}")
+
+    magic, ifd0_offset = struct.unpack(endian + "HL", data[2:8])
+    if magic != 42:
+        raise ExifFormatError(f"TIFF 매직 넘버 불일치: {magic}")
+
+    tags = {}
+    ifd0 = _read_ifd(data, endian, ifd0_offset)
+
+    exif_entry = ifd0.get(TAG_EXIF_IFD_POINTER)
+    if exif_entry is not None:
+        exif_ifd = _read_ifd(data, endian, _entry_value(data, endian, exif_entry)[0])
+        if TAG_DATETIME_ORIGINAL in exif_ifd:
+            tags["DateTimeOriginal"] = _entry_value(
+                data, endian, exif_ifd[TAG_DATETIME_ORIGINAL]
+            )
+        for tag, name in TIME_DETAIL_TAG_NAMES.items():
+            if tag in exif_ifd:
+                tags[name] = _entry_value(data, endian, exif_ifd[tag])
+
+    gps_entry = ifd0.get(TAG_GPS_IFD_POINTER)
+    if gps_entry is not None:
+        gps_ifd = _read_ifd(data, endian, _entry_value(data, endian, gps_entry)[0])
+        for tag, name in GPS_TAG_NAMES.items():
+            if tag in gps_ifd:
+                tags[name] = _entry_value(data, endian, gps_ifd[tag])
+
+    return tags
+
+
+def _read_ifd(data, endian, offset):
+    """IFD 엔트리들을 {tag: (type, count, value_bytes)} 로 읽기 (값은 디코딩하지 않음)"""
+    if offset < 8 or offset + 2 > len(data):
+        raise ExifFormatError(f"IFD 오프셋이 범위를 벗어남: {offset}")
+
+    (count,) = struct.unpack(endian + "H", data[offset : offset + 2])
+    if count > MAX_IFD_ENTRIES or offset + 2 + count * 12 > len(data):
+        raise ExifFormatError(f"IFD 엔트리 수가 비정상적임: {count}")
+
+    entries = {}
+    for i in range(count):
+        start = offset + 2 + i * 12
+        tag, field_type, value_count = struct.unpack(
+            endian + "HHL", data[start : start + 8]
+        )
+        entries[tag] = (field_type, value_count, bytes(data[start + 8 : start + 12]))
+    return entries
+
+
+def _entry_value(data, endian, entry):
+    """필요한 타입(ASCII/SHORT/LONG/RATIONAL)의 엔트리 값만 piexif와 같은 형식으로 디코딩"""
+    field_type, count, raw = entry
+
+    if field_type == TYPE_ASCII:
+        size = count
+    elif field_type == TYPE_SHORT:
+        size = count * 2
+    elif field_type == TYPE_LONG:
+        size = count * 4
+    elif field_type == TYPE_RATIONAL:
+        size = count * 8
+    else:
+        raise ExifFormatError(f"예상하지 못한 필드 타입: {field_type}")
+
+    if size <= 4:
+        payload = raw[:size]
+    else:
+        (pointer,) = struct.unpack(endian + "L", raw)
+        if pointer + size > len(data):
+            raise ExifFormatError(f"값 오프셋이 범위를 벗어남: {pointer}")
+        payload = bytes(data[pointer : pointer + size])
+
+    if field_type == TYPE_ASCII:
+        # piexif와 동일하게 마지막 NUL 바이트 제거
+        return payload[: count - 1] if count else b""
+    if field_type == TYPE_SHORT:
+        return struct.unpack(endian + "H" * count, payload)
+    if field_type == TYPE_LONG:
+        return struct.unpack(endian + "L" * count, payload)
+
+    numbers = struct.unpack(endian + "L" * (count * 2), payload)
+    return tuple((numbers[i], numbers[i + 1]) for i in range(0, len(numbers), 2))
+
+
+def read_jpeg_exif(file_path):
+    """
+    JPEG 마커를 따라가며 APP1(Exif) 세그먼트만 읽어서 태그 디코딩
+
+    처음 JPEG_HEADER_READ_SIZE 바이트만 읽고, 다른 세그먼트가 길어서
+    APP1이 그 뒤에 있거나 버퍼보다 길 때만 해당 위치를 추가로 읽는다.
+
+    Returns:
+        dict: parse_tiff_exif와 같은 형식 (EXIF가 없으면 빈 dict)
+    """
+    with open(file_path, "rb") as f:
+        buf = f.read(JPEG_HEADER_READ_SIZE)
+        base = 0  # buf가 파일에서 시작하는 오프셋
+
+        def window(pos, size):
+            """파일의 [pos, pos+size) 구간을 버퍼에서 꺼내고, 없으면 그 위치부터 다시 읽기"""
+            nonlocal buf, base
+            if pos < base or pos + size > base + len(buf):
+                f.seek(pos)
+                buf = f.read(max(size, JPEG_HEADER_READ_SIZE))
+                base = pos
+                if len(buf) < size:
+                    raise ExifFormatError("APP1을 찾기 전에 파일이 끝났습니다")
+            return memoryview(buf)[pos - base : pos - base + size]
+
+        if bytes(window(0, 2)) != b"\xff\xd8":
+            raise ExifFormatError("JPEG SOI 마커가 없습니다")
+
+        pos = 2
+        while True:
+            header = window(pos, 2)
+            if header[0] != 0xFF:
+                raise ExifFormatError(f"잘못된 JPEG 마커 위치: {pos}")
+
+            marker = header[1]
+            if marker == 0xFF:
+                # 채움(fill) 바이트
+                pos += 1
+                continue
+            if marker in (0xDA, 0xD9):
+                # SOS/EOI 이후에는 메타데이터가 없음
+                return {}
+
+            (length,) = struct.unpack(">H", window(pos + 2, 2))
+            if length < 2:
+                raise ExifFormatError(f"잘못된 세그먼트 길이: {length}")
+
+            if marker == 0xE1:
+                segment = window(pos + 4, length - 2)
+                if bytes(segment[:6]) == b"Exif\x00\x00":
+                    return parse_tiff_exif(segment[6:])
+
+            pos += 2 + length
+
+
+def read_tiff_exif(file_path):
+    """
+    TIFF 파일을 메모리 맵으로 열어서 IFD가 가리키는 페이지만 읽어 태그 디코딩
+
+    TIFF는 IFD가 파일 끝에 있는 경우가 많아 앞부분만 읽을 수 없으므로
+    mmap으로 필요한 페이지만 접근한다.
+    """
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_tiff_exif(mm)
+
+
+def _read_uint(data, pos, size):
+    """size(0/4/8 바이트) 길이의 빅엔디언 정수 읽기 (iloc 가변 길이 필드용)"""
+    if size == 0:
+        return 0, pos
+    if size not in (4, 8):
+        raise ExifFormatError(f"지원하지 않는 iloc 필드 크기: {size}")
+    (value,) = struct.unpack(">L" if size == 4 else ">Q", data[pos : pos + size])
+    return value, pos + size
+
+
+def _find_heif_exif_item_id(iinf):
+    """iinf 박스 payload에서 item_type이 'Exif'인 아이템 ID 찾기"""
+    version = iinf[0]
+    pos = 4
+    if version == 0:
+        (count,) = struct.unpack(">H", iinf[pos : pos + 2])
+        pos += 2
+    else:
+        (count,) = struct.unpack(">L", iinf[pos : pos + 4])
+        pos += 4
+
+    for _ in range(count):
+        size, box_type = struct.unpack(">L4s", iinf[pos : pos + 8])
+        if size < 8:
+            raise ExifFormatError(f"잘못된 infe 크기: {size}")
+        if box_type == b"infe":
+            infe_version = iinf[pos + 8]
+            body = pos + 12
+            if infe_version == 2:
+                (item_id,) = struct.unpack(">H", iinf[body : body + 2])
+                item_type = iinf[body + 4 : body + 8]
+            elif infe_version == 3:
+                (item_id,) = struct.unpack(">L", iinf[body : body + 4])
+                item_type = iinf[body + 6 : body + 10]
+            else:
+                item_type = None
+            if item_type == b"Exif":
+                return item_id
+        pos += size
+    return None
+
+
+def _find_heif_item_extents(iloc, item_id):
+    """iloc 박스 payload에서 아이템의 파일 내 (offset, length) 목록 찾기"""
+    version = iloc[0]
+    offset_size = iloc[4] >> 4
+    length_size = iloc[4] & 0x0F
+    base_offset_size = iloc[5] >> 4
+    index_size = iloc[5] & 0x0F if version in (1, 2) else 0
+    pos = 6
+
+    if version < 2:
+        (count,) = struct.unpack(">H", iloc[pos : pos + 2])
+        pos += 2
+    else:
+        (count,) = struct.unpack(">L", iloc[pos : pos + 4])
+        pos += 4
+
+    for _ in range(count):
+        if version < 2:
+            (current_id,) = struct.unpack(">H", iloc[pos : pos + 2])
+            pos += 2
+        else:
+            (current_id,) = struct.unpack(">L", iloc[pos : pos + 4])
+            pos += 4
+
+        construction_method = 0
+        if version in (1, 2):
+            (method_field,) = struct.unpack(">H", iloc[pos : pos + 2])
+            construction_method = method_field & 0x0F
+            pos += 2
+        pos += 2  # data_reference_index
+
+        base_offset, pos = _read_uint(iloc, pos, base_offset_size)
+        (extent_count,) = struct.unpack(">H", iloc[pos : pos + 2])
+        pos += 2
+
+        extents = []
+        for _ in range(extent_count):
+            _, pos = _read_uint(iloc, pos, index_size)
+            extent_offset, pos = _read_uint(iloc, pos, offset_size)
+            extent_length, pos = _read_uint(iloc, pos, length_size)
+            extents.append((base_offset + extent_offset, extent_length))
+
+        if current_id == item_id:
+            if construction_method != 0:
+                # idat/아이템 참조 방식은 드물어서 지원하지 않음
+                raise ExifFormatError(
+                    f"지원하지 않는 iloc construction_method: {construction_method}"
+                )
+            return extents
+    return None
+
+
+def read_heif_exif(file_path):
+    """
+    HEIC/HEIF에서 meta 박스의 iinf/iloc로 Exif 아이템 위치를 찾아 그 구간만 읽기
+
+    이미지 데이터(mdat)는 디코딩하지도 읽지도 않는다.
+
+    Returns:
+        dict: parse_tiff_exif와 같은 형식 (Exif 아이템이 없으면 빈 dict)
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+
+        try:
+            meta = None
+            for box_type, payload_start, box_end in iter_boxes(f, 0, file_size):
+                if box_type == b"meta":
+                    meta = (payload_start, box_end)
+                    break
+            if meta is None:
+                raise ExifFormatError("HEIF meta 박스를 찾을 수 없습니다")
+
+            payload_start, box_end = meta
+            if box_end - payload_start > MAX_HEIF_META_SIZE:
+                raise ExifFormatError("HEIF meta 박스가 너무 큽니다")
+
+            # meta는 FullBox (version/flags 4바이트) → 자식 박스는 그 뒤부터
+            iinf = iloc = None
+            for box_type, child_start, child_end in iter_boxes(
+                f, payload_start + 4, box_end
+            ):
+                if box_type in (b"iinf", b"iloc"):
+                    f.seek(child_start)
+                    data = f.read(child_end - child_start)
+                    if box_type == b"iinf":
+                        iinf = data
+                    else:
+                        iloc = data
+        except VideoFormatError as e:
+            raise ExifFormatError(str(e))
+
+        if iinf is None or iloc is None:
+            raise ExifFormatError("HEIF iinf/iloc 박스가 없습니다")
+
+        item_id = _find_heif_exif_item_id(iinf)
+        if item_id is None:
+            return {}
+
+        extents = _find_heif_item_extents(iloc, item_id)
+        if not extents:
+            raise ExifFormatError(f"Exif 아이템 {item_id}의 위치 정보가 없습니다")
+        if sum(length for _, length in extents) > MAX_HEIF_EXIF_SIZE:
+            raise ExifFormatError("HEIF Exif 아이템이 너무 큽니다")
+
+        chunks = []
+        for offset, length in extents:
+            f.seek(offset)
+            chunks.append(f.read(length))
+        item = b"".join(chunks)
+
+    # Exif 아이템: u32 TIFF 헤더 오프셋 + (보통 'Exif\0\0') + TIFF 구조
+    if len(item) < 4:
+        raise ExifFormatError("HEIF Exif 아이템이 너무 짧습니다")
+    (tiff_offset,) = struct.unpack(">L", item[:4])
+    return parse_tiff_exif(memoryview(item)[4 + tiff_offset :])
+
+
+def _xmp_field(xmp, name):
+    match = re.search(XMP_FIELD_PATTERN.format(name=name), xmp)
+    if not match:
+        return None
+    return match.group(1) if match.group(1) is not None else match.group(2)
+
+
+def _xmp_gps_to_rational(value):
+    """XMP GPS 좌표('37,33.99N' / '37,33,59.4N') → piexif 형식 (도분초 유리수, 방향)"""
+    match = XMP_GPS_PATTERN.match(value or "")
+    if not match:
+        return None, None
+    degrees, minutes, seconds, ref = match.groups()
+    parts = [Fraction(degrees), Fraction(minutes), Fraction(seconds or "0")]
+    return (
+        tuple((f.numerator, f.denominator) for f in parts),
+        ref.encode("ascii"),
+    )
+
+
+def parse_xmp_exif(xmp):
+    """
+    XMP 패킷에서 exif:DateTimeOriginal(초 이하 자릿수/오프셋 포함)과 GPS 좌표를 읽어
+    parse_tiff_exif와 같은 형식으로 반환
+    """
+    tags = {}
+
+    date = _xmp_field(xmp, "DateTimeOriginal")
+    match = XMP_DATE_PATTERN.match(date.strip()) if date else None
+    if match:
+        year, month, day, hour, minute, second, subsec, offset = match.groups()
+        if hour is None:
+            value = f"{year}:{month}:{day}"
+        else:
+            value = f"{year}:{month}:{day} {hour}:{minute}:{second or '00'}"
+        tags["DateTimeOriginal"] = value.encode("ascii")
+        if subsec:
+            tags["SubSecTimeOriginal"] = subsec.encode("ascii")
+        if offset:
+            offset = "+00:00" if offset == "Z" else offset
+            tags["OffsetTimeOriginal"] = offset.encode("ascii")
+
+    for field in ("GPSLatitude", "GPSLongitude"):
+        coord, ref = _xmp_gps_to_rational(_xmp_field(xmp, field))
+        if coord is not None:
+            tags[field] = coord
+            tags[field + "Ref"] = ref
+
+    return tags
+
+
+def _parse_png_text_chunk(chunk_type, data):
+    """
+    tEXt/zTXt/iTXt 청크에서 (키워드, 본문 bytes) 추출
+
+    압축된 본문은 zlib으로 푼다.
+    """
+    keyword, _, rest = data.partition(b"\x00")
+    if chunk_type == b"tEXt":
+        return keyword, rest
+    if chunk_type == b"zTXt":
+        return keyword, zlib.decompress(rest[1:])
+
+    # iTXt: 압축 플래그, 압축 방식, 언어 태그\0, 번역 키워드\0, 본문
+    compressed = rest[0]
+    _, _, rest = rest[2:].partition(b"\x00")
+    _, _, text = rest.partition(b"\x00")
+    return keyword, zlib.decompress(text) if compressed else text
+
+
+def _parse_png_raw_exif_profile(text):
+    """ImageMagick 'Raw profile type exif' (16진수 텍스트) → TIFF 구조 태그"""
+    # 형식: "\nexif\n<길이>\n<16진수 ...>"
+    lines = text.decode("ascii", errors="ignore").strip().split("\n")
+    raw = bytes.fromhex("".join(lines[2:]))
+    if raw.startswith(b"Exif\x00\x00"):
+        raw = raw[6:]
+    return parse_tiff_exif(raw)
+
+
+def read_png_exif(file_path):
+    """
+    PNG 청크를 순서대로 따라가며 eXIf 또는 XMP/Exif 텍스트 청크에서 태그 읽기
+
+    첫 메타데이터 청크나 IDAT(이미지 데이터)를 만나면 멈추므로
+    이미지 데이터는 읽지 않는다.
+
+    Returns:
+        dict: parse_tiff_exif와 같은 형식 (메타데이터가 없으면 빈 dict)
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        if f.read(8) != PNG_SIGNATURE:
+            raise ExifFormatError("PNG 시그니처가 없습니다")
+
+        pos = 8
+        while True:
+            f.seek(pos)
+            header = f.read(8)
+            if len(header) < 8:
+                return {}
+
+            length, chunk_type = struct.unpack(">L4s", header)
+            if chunk_type in (b"IDAT", b"IEND"):
+                return {}
+
+            if chunk_type == b"eXIf":
+                return parse_tiff_exif(f.read(length))
+
+            if (
+                chunk_type in (b"tEXt", b"zTXt", b"iTXt")
+                and length <= MAX_PNG_TEXT_CHUNK_SIZE
+            ):
+                try:
+                    keyword, text = _parse_png_text_chunk(chunk_type, f.read(length))
+                except (zlib.error, ValueError, IndexError):
+                    # 깨진 텍스트 청크는 건너뛰고 뒤의 eXIf 등 다음 청크를 계속 봄
+                    pos += 12 + length
+                    continue
+                if keyword == PNG_XMP_KEYWORD:
+                    tags = parse_xmp_exif(text.decode("utf-8", errors="ignore"))
+                    if tags:
+                        return tags
+                elif keyword == PNG_RAW_EXIF_KEYWORD:
+                    return _parse_png_raw_exif_profile(text)
+
+            # 청크 길이 + 타입(8) + 데이터 + CRC(4)
+            pos += 12 + length
+
+
+def read_exif_tags(file_path):
+    """
+    확장자에 맞는 빠른 리더로 EXIF 태그 읽기
+
+    Raises:
+        ExifFormatError: 특이 구조라 piexif로 폴백해야 하는 경우
+    """
+    suffix = file_path.suffix.lower()
+    if suffix in {".jpg", ".jpeg"}:
+        return read_jpeg_exif(file_path)
+    if suffix in {".tif", ".tiff"}:
+        return read_tiff_exif(file_path)
+    if suffix in {".heic", ".heif"}:
+        return read_heif_exif(file_path)
+    if suffix == ".png":
+        return read_png_exif(file_path)
+    raise ExifFormatError(f"빠른 리더가 지원하지 않는 형식: {suffix}")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Persistent ExifTool Session
+`exiftool -stay_open True -@ -` 프로세스 하나를 계속 띄워두고
+여러 영상 파일의 메타데이터를 묶어서 요청하는 세션
+"""
+
+import itertools
+import json
+import logging
+import queue
+import subprocess
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 영상 파일에서 읽는 태그 (필요한 태그만 요청하면 exiftool도 빨라짐)
+VIDEO_TAGS = [
+    "DateTimeOriginal",
+    "CreateDate",
+    "MediaCreateDate",
+    "GPSLatitude",
+    "GPSLongitude",
+]
+
+
+class ExifToolSession:
+    def __init__(self, executable="exiftool", timeout_per_file=30):
+        """
+        exiftool 상주 세션 초기화 (프로세스는 첫 요청 때 시작)
+
+        Args:
+            executable (str): exiftool 실행 파일 경로
+            timeout_per_file (float): 파일 하나당 허용 시간(초), 묶음 요청은 파일 수만큼 곱함
+        """
+        self.executable = executable
+        self.timeout_per_file = timeout_per_file
+        self._process = None
+        self._lines = None
+        self._counter = itertools.count(1)
+        # 스레드 백엔드에서 여러 스레드가 같은 세션을 쓰므로 요청 단위로 직렬화
+        self._lock = threading.Lock()
+
+    def _start(self):
+        """exiftool 프로세스 시작 (설치되어 있지 않으면 FileNotFoundError)"""
+        self._process = subprocess.Popen(
+            [self.executable, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # 파이프 읽기에 타임아웃을 걸 수 있도록 별도 스레드가 줄 단위로 큐에 넣음
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump_stdout,
+            args=(self._process.stdout, self._lines),
+            daemon=True,
+        ).start()
+        logger.info(f"exiftool 상주 세션 시작 (pid {self._process.pid})")
+
+    @staticmethod
+    def _pump_stdout(stream, lines):
+        for line in iter(stream.readline, b""):
+            lines.put(line)
+        lines.put(None)  # 프로세스 종료
+
+    def _kill(self):
+        """응답 없는/죽은 프로세스 정리"""
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+            self._process.wait(timeout=5)
+        except Exception:
+            pass
+        self._process = None
+
+    def execute(self, args, timeout):
+        """
+        상주 프로세스에 인자 목록을 보내고 {ready} 까지의 출력 반환
+
+        Raises:
+            FileNotFoundError: exiftool이 설치되어 있지 않음
+            subprocess.TimeoutExpired: 시간 안에 응답이 없음 (프로세스는 재시작 대상)
+            BrokenPipeError: 프로세스가 요청 도중 종료됨
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+
+            request_id = next(self._counter)
+            payload = "\n".join(list(args) + [f"-execute{request_id}", ""])
+            ready_marker = f"{{ready{request_id}}}".encode()
+
+            try:
+                self._process.stdin.write(payload.encode("utf-8"))
+                self._process.stdin.flush()
+            except OSError:
+                self._kill()
+                raise BrokenPipeError("exiftool 프로세스에 요청을 보내지 못했습니다")
+
+            output = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=timeout)
+                except queue.Empty:
+                    self._kill()
+                    raise subprocess.TimeoutExpired(self.executable, timeout)
+
+                if line is None:
+                    self._kill()
+                    raise BrokenPipeError("exiftool 프로세스가 응답 중 종료되었습니다")
+                if line.rstrip() == ready_marker:
+                    break
+                output.append(line)
+
+            return b"".join(output).decode("utf-8", errors="replace")
+
+    def get_metadata(self, file_paths, tags=None):
+        """
+        여러 파일의 메타데이터를 한 번의 요청으로 읽기
+
+        프로세스가 죽어 있으면 한 번 재시작해서 다시 시도한다.
+
+        Returns:
+            dict: {파일 경로 문자열: exiftool JSON dict} (읽지 못한 파일은 빠짐)
+        """
+        if not file_paths:
+            return {}
+
+        args = ["-j", "-charset", "filename=utf8"]
+        args += [f"-{tag}" for tag in (tags or VIDEO_TAGS)]
+        args += [str(p) for p in file_paths]
+        timeout = self.timeout_per_file * len(file_paths)
+
+        try:
+            output = self.execute(args, timeout)
+        except BrokenPipeError as e:
+            logger.warning(f"exiftool 세션 재시작: {e}")
+            output = self.execute(args, timeout)
+
+        if not output.strip():
+            return {}
+
+        # exiftool은 SourceFile의 역슬래시를 슬래시로 바꾸므로 원래 경로로 되돌림
+        original = {str(p).replace("\\", "/"): str(p) for p in file_paths}
+        results = {}
+        for item in json.loads(output):
+            source = item.get("SourceFile", "")
+            results[original.get(source.replace("\\", "/"), source)] = item
+        return results
+
+    def close(self):
+        """상주 프로세스 정상 종료"""
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                if self._process.poll() is None:
+                    self._process.stdin.write(b"-stay_open\nFalse\n")
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=5)
+            except Exception:
+                self._kill()
+            self._process = None
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Folder Watcher
+사진 폴더의 변경을 감시하는 모듈 (Linux inotify, 사용할 수 없으면 주기적 폴링)
+여러 파일이 한꺼번에 복사될 때는 잠잠해질 때까지 기다렸다가 한 번에 알려줌
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+# 쓰기가 끝난 파일 / 이동 / 삭제 / 새 폴더 (IN_CREATE는 폴더에만 사용)
+WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class FolderWatcher:
+    def __init__(
+        self,
+        folder,
+        debounce=2.0,
+        poll_interval=10.0,
+        use_inotify=True,
+        ignore=None,
+    ):
+        """
+        폴더 감시 초기화
+
+        Args:
+            folder (str | Path): 감시할 사진 폴더
+            debounce (float): 마지막 이벤트 후 이 시간(초) 동안 조용하면 변경을 알림
+            poll_interval (float): inotify를 쓸 수 없을 때 폴더를 다시 확인하는 간격(초)
+            use_inotify (bool): False면 항상 폴링 사용
+            ignore (IgnoreRules): 감시하지 않을 폴더 규칙 (None이면 모든 폴더 감시)
+        """
+        self.folder = Path(folder)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.ignore = ignore
+        self._fd = None
+        self._libc = None
+        self._watches = {}  # watch descriptor → 폴더 경로
+
+        if use_inotify:
+            try:
+                self._start_inotify()
+            except (OSError, AttributeError) as e:
+                self.close()
+                logger.warning(f"inotify를 사용할 수 없어 폴링으로 감시합니다: {e}")
+
+    @property
+    def mode(self):
+        return "inotify" if self._fd is not None else "polling"
+
+    def _start_inotify(self):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc를 찾을 수 없습니다")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+
+        fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._add_tree(self.folder)
+        logger.info(f"inotify로 폴더 {len(self._watches)}개를 감시합니다.")
+
+    def _add_watch(self, directory):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(str(directory)), WATCH_MASK
+        )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(directory))
+        self._watches[wd] = Path(directory)
+
+    def _is_ignored(self, path):
+        if self.ignore is None:
+            return False
+        rel_path = Path(path).relative_to(self.folder).as_posix()
+        return rel_path != "." and self.ignore.match_path(rel_path, True)
+
+    def _add_tree(self, root):
+        """
+        폴더와 모든 하위 폴더에 감시 추가 (감시 개수 한도 초과 시 OSError)
+
+        제외 규칙에 걸리는 폴더(썸네일 캐시 등)는 하위까지 감시하지 않는다.
+        """
+        if self._is_ignored(root):
+            return
+        self._add_watch(root)
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [
+                name for name in dirnames if not self._is_ignored(Path(dirpath) / name)
+            ]
+            for name in dirnames:
+                self._add_watch(Path(dirpath) / name)
+
+    def _read_events(self):
+        """
+        쌓인 inotify 이벤트 읽기
+
+        Returns:
+            tuple: (바뀐 경로 set, 전체 재검사 필요 여부)
+        """
+        changed = set()
+        overflow = False
+        data = os.read(self._fd, 64 * 1024)
+
+        pos = 0
+        while pos + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, pos)
+            name = data[pos + EVENT_HEADER.size : pos + EVENT_HEADER.size + length]
+            pos += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            name = os.fsdecode(name.rstrip(b"\0"))
+            path = directory / name if name else directory
+
+            if mask & IN_ISDIR and self._is_ignored(path):
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    self._add_tree(path)
+                except OSError as e:
+                    logger.warning(f"새 폴더 감시 추가 실패 {path}: {e}")
+                    overflow = True
+            elif mask & IN_CREATE:
+                # 파일은 쓰기가 끝날 때(IN_CLOSE_WRITE) 처리
+                continue
+
+            changed.add(str(path))
+
+        return changed, overflow
+
+    def wait(self):
+        """
+        변경이 생기고 debounce 시간 동안 조용해질 때까지 대기
+
+        inotify 모드에서는 이벤트가 올 때까지 블록되므로 대기 중 CPU를 쓰지 않는다.
+
+        Returns:
+            list | None: 바뀐 파일/폴더 경로 목록 (None이면 어디가 바뀌었는지 모름 → 전체 비교)
+        """
+        if self._fd is None:
+            time.sleep(self.poll_interval)
+            return None
+
+        select.select([self._fd], [], [])
+        changed = set()
+        overflow = False
+        while True:
+            events, lost = self._read_events()
+            changed |= events
+            overflow = overflow or lost
+
+            ready, _, _ = select.select([self._fd], [], [], self.debounce)
+            if not ready:
+                break
+
+        if overflow:
+            logger.warning("감시 이벤트가 넘쳐서 폴더 전체를 다시 비교합니다.")
+            return None
+        return sorted(changed)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches = {}
@@ -8,11 +8,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
 import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
 # 로컬 모듈 import
-from photo_exif_processor import PhotoExifProcessor
+from photo_exif_processor import PhotoExifProcessor, ProcessingCancelled
+from processing_events import BATCH_DONE, FILE_ERROR, FILES_FOUND, THROUGHPUT
 from manual_correction_gui import show_correction_menu
 from data_exporter import DataExporter
 
@@ -27,6 +31,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 백그라운드 작업이 보낸 이벤트를 GUI 스레드에서 확인하는 간격(ms)
+EVENT_POLL_MS = 100
+
+# 결과 창에 파일 이름까지 보여줄 추출 실패 수 (나머지는 개수만 표시)
+MAX_ERROR_LINES = 20
+
+
+def format_duration(seconds):
+    """남은 시간 표시용 문자열 (예: 1시간 5분, 3분 20초, 12초)"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
 
 class MainApplication:
     def __init__(self):
@@ -38,7 +60,28 @@ class MainApplication:
         self.exporter = None
         self.selected_folder = ""
 
+        # 처리/내보내기는 백그라운드 스레드 하나에서 실행
+        # Tk 위젯은 GUI 스레드에서만 다룰 수 있으므로 작업 스레드는 _post()로
+        # 이벤트 큐에 함수를 넣고, GUI 스레드가 after()로 꺼내서 실행한다.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="photo-exif"
+        )
+        self._events = queue.Queue()
+        self._busy = False
+        self._correcting = False  # 단계별 보정 창이 열려 있는 동안 True
+        self._correction_guis = []  # 추출 중에 열린 보정 창들
+
+        # 진행률 계산용 (전체 파일 수는 폴더 검색이 끝나야 알 수 있음)
+        self._progress_total = None
+        self._progress_found = 0  # 지금까지 찾은 파일 수 (files_found 이벤트)
+        self._progress_done = 0
+        self._progress_start = 0.0
+        self._progress_rate = None  # 최근 처리량 (throughput 이벤트)
+        self._progress_errors = 0
+
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(EVENT_POLL_MS, self._poll_events)
 
     def setup_ui(self):
         """메인 UI 설정"""
@@ -57,7 +100,7 @@ class MainApplication:
 연속된 날짜 덩어리(chunk) 기반으로 사진의 EXIF 데이터를 처리하여
 Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
 
-지원 파일: JPG, JPEG, PNG, MOV, MP4, HEIC, TIFF
+지원 파일: JPG, JPEG, PNG, MOV, MP4, HEIC, HEIF, TIFF
         """
         desc_label = ttk.Label(main_frame, text=desc_text, justify=tk.CENTER)
         desc_label.grid(row=1, column=0, columnspan=2, pady=10)
@@ -83,13 +126,29 @@ Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
         )
         step2_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
 
-        process_button = ttk.Button(
-            step2_frame,
+        button_frame = ttk.Frame(step2_frame)
+        button_frame.grid(row=0, column=0, pady=5)
+
+        self.process_button = ttk.Button(
+            button_frame,
             text="EXIF 데이터 처리 시작",
             command=self.process_exif_data,
             width=30,
         )
-        process_button.grid(row=0, column=0, pady=5)
+        self.process_button.grid(row=0, column=0, padx=5)
+
+        self.cancel_button = ttk.Button(
+            button_frame, text="취소", command=self.cancel_processing, state="disabled"
+        )
+        self.cancel_button.grid(row=0, column=1, padx=5)
+
+        # 진행률 (처리한 파일 수 / 전체, 초당 파일 수, 남은 시간)
+        self.progress_bar = ttk.Progressbar(step2_frame, mode="determinate")
+        self.progress_bar.grid(row=2, column=0, sticky=(tk.W, tk.E))
+        self.progress_var = tk.StringVar()
+        ttk.Label(step2_frame, textvariable=self.progress_var).grid(
+            row=3, column=0, sticky=tk.W
+        )
 
         # 결과 표시 영역
         self.result_text = tk.Text(step2_frame, height=8, width=70)
@@ -107,13 +166,13 @@ Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
         )
         step3_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
 
-        correction_button = ttk.Button(
+        self.correction_button = ttk.Button(
             step3_frame,
             text="단계별 보정 시작",
             command=self.start_manual_correction,
             width=30,
         )
-        correction_button.grid(row=0, column=0, pady=5)
+        self.correction_button.grid(row=0, column=0, pady=5)
 
         # 4단계: 내보내기
         step4_frame = ttk.LabelFrame(
@@ -124,15 +183,18 @@ Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
         export_frame = ttk.Frame(step4_frame)
         export_frame.grid(row=0, column=0)
 
-        ttk.Button(export_frame, text="CSV 내보내기", command=self.export_csv).grid(
-            row=0, column=0, padx=5
-        )
-        ttk.Button(export_frame, text="KML 내보내기", command=self.export_kml).grid(
-            row=0, column=1, padx=5
-        )
-        ttk.Button(export_frame, text="전체 내보내기", command=self.export_all).grid(
-            row=0, column=2, padx=5
-        )
+        # 처리/내보내기 중이거나 보정 창이 열려 있으면 막음 (_update_actions)
+        self.export_buttons = []
+        for column, (text, command) in enumerate(
+            [
+                ("CSV 내보내기", self.export_csv),
+                ("KML 내보내기", self.export_kml),
+                ("전체 내보내기", self.export_all),
+            ]
+        ):
+            button = ttk.Button(export_frame, text=text, command=command)
+            button.grid(row=0, column=column, padx=5)
+            self.export_buttons.append(button)
 
         # 상태바
         self.status_var = tk.StringVar()
@@ -158,137 +220,339 @@ Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
             self.status_var.set(f"선택된 폴더: {folder}")
             logger.info(f"사진 폴더 선택: {folder}")
 
+    def _post(self, func, *args):
+        """작업 스레드에서 GUI 스레드로 실행할 함수 보내기"""
+        self._events.put((func, args))
+
+    def _poll_events(self):
+        """작업 스레드가 보낸 이벤트를 GUI 스레드에서 실행 (EVENT_POLL_MS마다 반복)"""
+        while True:
+            try:
+                func, args = self._events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"GUI 이벤트 처리 중 오류: {e}")
+        self.root.after(EVENT_POLL_MS, self._poll_events)
+
+    def _set_busy(self, busy, cancellable=False):
+        """백그라운드 작업 중에는 처리 버튼을 막고, 취소할 수 있는 작업이면 취소 버튼을 켬"""
+        self._busy = busy
+        self.cancel_button.config(
+            state="normal" if busy and cancellable else "disabled"
+        )
+        self._update_actions()
+
+    def _update_actions(self):
+        """작업/보정 상태에 맞게 처리/보정/내보내기 버튼 켜고 끄기"""
+        self.process_button.config(state="disabled" if self._busy else "normal")
+        self.correction_button.config(
+            state="disabled" if self._correcting else "normal"
+        )
+        # 보정 중에 내보내면 고치는 도중의 표가 파일로 나가므로 보정이 끝날 때까지 막음
+        export_state = "disabled" if self._busy or self._correcting else "normal"
+        for button in self.export_buttons:
+            button.config(state=export_state)
+
     def process_exif_data(self):
-        """EXIF 데이터 처리"""
+        """EXIF 데이터 처리 시작 (백그라운드에서 실행, 부분 결과와 진행률을 표시)"""
         if not self.selected_folder:
             messagebox.showwarning("경고", "먼저 사진 폴더를 선택해주세요.")
             return
+        if self._busy:
+            messagebox.showinfo("알림", "다른 작업이 진행 중입니다.")
+            return
 
         try:
             self.status_var.set("EXIF 데이터 처리 중...")
-            self.root.update()
 
             # 처리기 초기화
             self.processor = PhotoExifProcessor(self.selected_folder)
+            self.exporter = None
 
             # EXIF 데이터 추출
             self.result_text.delete(1.0, tk.END)
             self.result_text.insert(tk.END, "사진 파일 스캔 중...\n")
-            self.root.update()
-
-            df = self.processor.process_all_photos()
-            self.result_text.insert(
-                tk.END, f"✓ {len(df)}개 파일의 EXIF 데이터 추출 완료\n"
-            )
-            self.root.update()
 
-            # 날짜 덩어리 탐지
-            self.result_text.insert(tk.END, "연속 날짜 덩어리 탐지 중...\n")
-            self.root.update()
+        except Exception as e:
+            self._show_processing_error(e)
+            return
 
-            self.processor.detect_date_chunks()
-            self.result_text.insert(tk.END, "✓ 날짜 덩어리 탐지 완료\n")
-            self.root.update()
+        self._progress_total = None
+        self._progress_found = 0
+        self._progress_done = 0
+        self._progress_start = time.perf_counter()
+        self._progress_rate = None
+        self._progress_errors = 0
+        self.progress_bar.config(value=0, maximum=1)
+        self.progress_var.set("파일 검색 중...")
+
+        self._set_busy(True, cancellable=True)
+        self._executor.submit(self._run_processing, self.processor)
+
+    def cancel_processing(self):
+        """진행 중인 EXIF 처리 중단 요청 (지금 읽는 묶음까지만 마치고 멈춤)"""
+        if self.processor is not None and self._busy:
+            self.processor.cancel()
+            self.cancel_button.config(state="disabled")
+            self.status_var.set("취소하는 중...")
+
+    def _run_processing(self, processor):
+        """
+        작업 스레드: 처리 단계를 실행하고 진행 상황을 이벤트로 보냄
 
-            # 분류 결과
-            auto_df, manual_date_df, manual_gps_df, manual_both_df = (
-                self.processor.classify_processing_type()
+        Tk 위젯은 건드리지 않고, 화면 갱신은 모두 _post()로 GUI 스레드에 넘긴다.
+        """
+        listener = processor.subscribe(
+            lambda event: self._post(self._on_processing_event, processor, event)
+        )
+        try:
+            df = processor.process_all_photos(
+                on_partial=lambda new_df: self._post(self._show_partial_result, new_df)
+            )
+            self._post(
+                self._append_result, f"✓ {len(df)}개 파일의 EXIF 데이터 추출 완료\n"
             )
 
-            # 순서 컬럼 추가
-            self.processor.add_order_column()
+            # 날짜 덩어리 탐지 (부분 결과로 계산한 덩어리를 전체 기준으로 확정)
+            self._post(self._append_result, "연속 날짜 덩어리 탐지 중...\n")
+            with processor.lock:
+                processor.detect_date_chunks()
+            self._post(self._append_result, "✓ 날짜 덩어리 탐지 완료\n")
 
-            # 결과 요약 표시
-            summary = self.processor.get_summary()
-            self.result_text.insert(tk.END, "\n" + summary)
+            with processor.lock:
+                # 분류 결과
+                processor.classify_processing_index()
 
-            # 내보내기 준비
-            self.exporter = DataExporter(self.processor)
-            self.status_var.set("EXIF 데이터 처리 완료!")
+                # 순서 컬럼 추가
+                processor.add_order_column()
 
-            logger.info("EXIF 데이터 처리 완료")
+                # 결과 요약
+                summary = processor.get_summary()
+            self._post(self._finish_processing, summary)
 
+        except ProcessingCancelled:
+            self._post(self._cancel_finished)
         except Exception as e:
-            error_msg = f"EXIF 처리 중 오류 발생: {e}"
-            self.result_text.insert(tk.END, f"\n❌ {error_msg}\n")
-            self.status_var.set("처리 실패")
-            logger.error(error_msg)
-            messagebox.showerror("오류", error_msg)
+            self._post(self._show_processing_error, e)
+        finally:
+            processor.unsubscribe(listener)
+
+    def _on_processing_event(self, processor, event):
+        """
+        처리기 진행 이벤트 반영 (찾은 파일 수 → 전체 파일 수, 묶음 완료 → 진행률,
+        처리량 → 남은 시간, 파일 오류 → 결과 창)
+        """
+        if processor is not self.processor:
+            return
+        if event["type"] == FILES_FOUND and event["stage"] == "extract":
+            # 추출과 같은 검색에서 센 값이므로 파일 수를 따로 세지 않음
+            self._progress_found = event["found"]
+            if event["finished"]:
+                self._progress_total = event["found"]
+            self._update_progress(self._progress_done)
+        elif event["type"] == BATCH_DONE and event["stage"] == "extract":
+            self._update_progress(event["done"])
+        elif event["type"] == THROUGHPUT and event["stage"] == "extract":
+            self._progress_rate = event["rate"]
+        elif event["type"] == FILE_ERROR:
+            self._progress_errors += 1
+            if self._progress_errors <= MAX_ERROR_LINES:
+                name = Path(event["path"]).name
+                self._append_result(f"⚠ EXIF 추출 실패: {name} ({event['error']})\n")
+
+    def _update_progress(self, done):
+        """진행률 막대와 초당 파일 수 / 남은 시간 표시 갱신"""
+        self._progress_done = done
+        elapsed = time.perf_counter() - self._progress_start
+        average = done / elapsed if elapsed > 0 else 0.0
+        # 남은 시간은 최근 처리량 기준 (캐시 적중 구간 등으로 속도가 바뀌므로)
+        rate = self._progress_rate or average
+        failed = (
+            f" · 실패 {self._progress_errors:,}개" if self._progress_errors else ""
+        )
+
+        total = self._progress_total
+        if total is None:
+            # 검색이 끝나기 전에는 지금까지 찾은 파일 수 기준
+            found = max(self._progress_found, done)
+            self.progress_bar.config(maximum=max(found, 1), value=done)
+            self.progress_var.set(
+                f"{done:,}/{found:,}개+ · {average:.1f} 파일/초{failed} "
+                f"(파일 검색 중)"
+            )
+            return
+
+        total = max(total, done)
+        self.progress_bar.config(maximum=max(total, 1), value=done)
+        text = f"{done:,}/{total:,}개 · {average:.1f} 파일/초{failed}"
+        if rate > 0 and done < total:
+            text += f" · 남은 시간 약 {format_duration((total - done) / rate)}"
+        self.progress_var.set(text)
+
+    def _append_result(self, text):
+        self.result_text.insert(tk.END, text)
+        self.result_text.see(tk.END)
+
+    def _finish_processing(self, summary):
+        self._set_busy(False)
+        if self._progress_errors > MAX_ERROR_LINES:
+            self._append_result(
+                f"⚠ EXIF 추출 실패 {self._progress_errors:,}개 "
+                f"(처음 {MAX_ERROR_LINES}개만 표시)\n"
+            )
+        self._append_result("\n" + summary)
+        self._update_progress(self._progress_done)
+
+        # 내보내기 준비
+        self.exporter = DataExporter(self.processor)
+        self.status_var.set("EXIF 데이터 처리 완료!")
+        logger.info("EXIF 데이터 처리 완료")
+
+    def _cancel_finished(self):
+        self._set_busy(False)
+        done = len(self.processor.df) if self.processor is not None else 0
+        self._append_result(f"\n⏹ 처리를 취소했습니다. ({done}개까지 처리됨)\n")
+        self.status_var.set("처리 취소됨")
+        logger.info("EXIF 데이터 처리 취소")
+
+    def _show_partial_result(self, new_df):
+        """부분 결과 한 묶음을 결과 창에 표시하고 열려 있는 보정 창의 대기열에 추가"""
+        df = self.processor.df
+        chunks = df["chunk_id"].dropna().nunique() if "chunk_id" in df.columns else 0
+        needs_correction = (
+            new_df["DateTimeOriginal"].isna()
+            | new_df["GPSLat"].isna()
+            | new_df["GPSLong"].isna()
+        ).sum()
+        self._append_result(
+            f"… {len(df)}개 처리됨 (날짜 덩어리 {chunks}개, "
+            f"이번 묶음의 보정 대상 {needs_correction}개)\n"
+        )
+        self.status_var.set("EXIF 데이터 처리 중... (처리 중에도 단계별 보정 가능)")
+
+        for gui in list(self._correction_guis):
+            try:
+                gui.root.winfo_exists()
+            except tk.TclError:
+                # 이미 닫힌 보정 창
+                self._correction_guis.remove(gui)
+                continue
+            gui.extend_correction(new_df)
+
+    def _show_processing_error(self, error):
+        self._set_busy(False)
+        error_msg = f"EXIF 처리 중 오류 발생: {error}"
+        self._append_result(f"\n❌ {error_msg}\n")
+        self.status_var.set("처리 실패")
+        logger.error(error_msg)
+        messagebox.showerror("오류", error_msg)
 
     def start_manual_correction(self):
         """단계별 보정 시작"""
         if not self.processor:
             messagebox.showwarning("경고", "먼저 EXIF 데이터 처리를 완료해주세요.")
             return
+        if self.processor.df.empty:
+            messagebox.showinfo("알림", "아직 추출된 결과가 없습니다. 잠시 후 다시 시도해주세요.")
+            return
 
+        self._correcting = True
+        self._update_actions()
         try:
             self.status_var.set("단계별 보정 GUI 실행 중...")
-            show_correction_menu(self.processor)
+            # 추출이 진행 중이면 보정 창이 열려 있는 동안 새 부분 결과를 대기열에 추가
+            show_correction_menu(self.processor, on_open=self._correction_guis.append)
             self.status_var.set("단계별 보정 완료")
 
             # 보정 후 순서 재계산
-            self.processor.add_order_column()
+            with self.processor.lock:
+                self.processor.add_order_column()
 
         except Exception as e:
             error_msg = f"단계별 보정 중 오류 발생: {e}"
             self.status_var.set("단계별 보정 실패")
             logger.error(error_msg)
             messagebox.showerror("오류", error_msg)
+        finally:
+            self._correcting = False
+            self._update_actions()
 
-    def export_csv(self):
-        """CSV 내보내기"""
+    def _run_export(self, label, job, on_done):
+        """
+        내보내기를 백그라운드에서 실행하고 끝나면 GUI 스레드에서 on_done(결과) 호출
+
+        Args:
+            label (str): 상태바/오류 메시지에 쓸 이름 (예: "CSV")
+            job: 작업 스레드에서 실행할 함수
+            on_done: 결과를 받아 완료 메시지를 보여줄 함수
+        """
         if not self.exporter:
             messagebox.showwarning("경고", "먼저 EXIF 데이터 처리를 완료해주세요.")
             return
+        if self._busy:
+            messagebox.showinfo("알림", "다른 작업이 진행 중입니다.")
+            return
+        if self._correcting:
+            messagebox.showinfo("알림", "단계별 보정 창을 닫은 뒤에 내보내주세요.")
+            return
 
-        try:
-            self.status_var.set("CSV 파일 생성 중...")
-            csv_path = self.exporter.export_csv()
-            self.status_var.set("CSV 내보내기 완료!")
+        self._set_busy(True)
+        self.status_var.set(f"{label} 파일 생성 중...")
 
-            messagebox.showinfo("완료", f"CSV 파일이 생성되었습니다:\n{csv_path}")
+        def run():
+            try:
+                result = job()
+            except Exception as e:
+                self._post(self._export_failed, label, e)
+            else:
+                self._post(self._export_finished, label, on_done, result)
 
-        except Exception as e:
-            error_msg = f"CSV 내보내기 중 오류 발생: {e}"
-            self.status_var.set("CSV 내보내기 실패")
-            logger.error(error_msg)
-            messagebox.showerror("오류", error_msg)
+        self._executor.submit(run)
 
-    def export_kml(self):
-        """KML 내보내기"""
-        if not self.exporter:
-            messagebox.showwarning("경고", "먼저 EXIF 데이터 처리를 완료해주세요.")
-            return
+    def _export_finished(self, label, on_done, result):
+        self._set_busy(False)
+        self.status_var.set(f"{label} 내보내기 완료!")
+        on_done(result)
 
-        try:
-            self.status_var.set("KML 파일 생성 중...")
-            kml_path = self.exporter.export_kml()
-            self.status_var.set("KML 내보내기 완료!")
+    def _export_failed(self, label, error):
+        self._set_busy(False)
+        error_msg = f"{label} 내보내기 중 오류 발생: {error}"
+        self.status_var.set(f"{label} 내보내기 실패")
+        logger.error(error_msg)
+        messagebox.showerror("오류", error_msg)
 
-            messagebox.showinfo("완료", f"KML 파일이 생성되었습니다:\n{kml_path}")
+    def export_csv(self):
+        """CSV 내보내기"""
+        self._run_export(
+            "CSV",
+            lambda: self.exporter.export_csv(),
+            lambda csv_path: messagebox.showinfo(
+                "완료", f"CSV 파일이 생성되었습니다:\n{csv_path}"
+            ),
+        )
 
-        except Exception as e:
-            error_msg = f"KML 내보내기 중 오류 발생: {e}"
-            self.status_var.set("KML 내보내기 실패")
-            logger.error(error_msg)
-            messagebox.showerror("오류", error_msg)
+    def export_kml(self):
+        """KML 내보내기"""
+        self._run_export(
+            "KML",
+            lambda: self.exporter.export_kml(),
+            lambda kml_path: messagebox.showinfo(
+                "완료", f"KML 파일이 생성되었습니다:\n{kml_path}"
+            ),
+        )
 
     def export_all(self):
         """모든 형식으로 내보내기"""
-        if not self.exporter:
-            messagebox.showwarning("경고", "먼저 EXIF 데이터 처리를 완료해주세요.")
-            return
-
-        try:
-            self.status_var.set("모든 파일 생성 중...")
-            self.root.update()
-
-            results = self.exporter.export_all()
-
-            self.status_var.set("모든 파일 내보내기 완료!")
+        self._run_export(
+            "전체", lambda: self.exporter.export_all(), self._show_export_all
+        )
 
-            # 결과 표시
-            result_msg = f"""
+    def _show_export_all(self, results):
+        """전체 내보내기 결과 표시"""
+        result_msg = f"""
 내보내기 완료!
 
 생성된 파일:
@@ -302,17 +566,11 @@ Google My Maps에 업로드할 수 있는 CSV/KML 파일을 생성합니다.
 Google My Maps 업로드 가이드를 참조하세요.
 """
 
-            messagebox.showinfo("완료", result_msg)
+        messagebox.showinfo("완료", result_msg)
 
-            # output 폴더 열기 (운영체제별)
-            if messagebox.askyesno("폴더 열기", "생성된 파일들이 있는 폴더를 열까요?"):
-                self.open_output_folder()
-
-        except Exception as e:
-            error_msg = f"파일 내보내기 중 오류 발생: {e}"
-            self.status_var.set("내보내기 실패")
-            logger.error(error_msg)
-            messagebox.showerror("오류", error_msg)
+        # output 폴더 열기 (운영체제별)
+        if messagebox.askyesno("폴더 열기", "생성된 파일들이 있는 폴더를 열까요?"):
+            self.open_output_folder()
 
     def open_output_folder(self):
         """output 폴더 열기"""
@@ -327,6 +585,13 @@ Google My Maps 업로드 가이드를 참조하세요.
         except Exception as e:
             logger.warning(f"폴더 열기 실패: {e}")
 
+    def on_close(self):
+        """창 닫기: 진행 중인 처리를 중단하고 종료"""
+        if self.processor is not None and self._busy:
+            self.processor.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def run(self):
         """애플리케이션 실행"""
         self.root.mainloop()
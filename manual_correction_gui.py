@@ -21,6 +21,13 @@ from flask import Flask, request, send_file
 
 logger = logging.getLogger(__name__)
 
+# 보정 종류별 대상 처리 상태 (processor.df의 status 컬럼)
+CORRECTION_STATUSES = {
+    "date": ("need_date", "need_both"),
+    "gps": ("need_gps", "need_both"),
+    "both": ("need_both",),
+}
+
 
 class ManualCorrectionGUI:
     def __init__(self, processor):
@@ -416,6 +423,37 @@ class ManualCorrectionGUI:
 
         self.root.mainloop()
 
+    def extend_correction(self, data):
+        """
+        EXIF 추출이 아직 진행 중일 때 새로 들어온 부분 결과 중 보정 대상만 대기열 뒤에 추가
+
+        Args:
+            data: 새 부분 결과 DataFrame (보정 종류에 맞지 않거나 이미 있는 행은 무시)
+        """
+        if self.correction_type is None:
+            # 아직 start_correction 전
+            return
+
+        needed = data["status"].isin(CORRECTION_STATUSES[self.correction_type])
+
+        new_rows = data[
+            needed & ~data["FilePath"].isin(set(self.correction_data["FilePath"]))
+        ]
+        if new_rows.empty:
+            return
+
+        # validate_and_save가 인덱스로 행을 찾으므로 위치와 같은 인덱스로 다시 매김
+        self.correction_data = pd.concat(
+            [self.correction_data, new_rows], ignore_index=True
+        )
+        self.progress_bar["maximum"] = len(self.correction_data)
+        self.progress_label.config(
+            text=f"진행 상황: {self.current_index + 1}/{len(self.correction_data)}"
+        )
+        logger.info(
+            f"보정 대기열에 {len(new_rows)}개 추가 (전체 {len(self.correction_data)}개)"
+        )
+
     def update_display(self):
         """현재 사진과 정보 표시 업데이트"""
         if self.current_index >= len(self.correction_data):
@@ -618,33 +656,9 @@ class ManualCorrectionGUI:
     def use_prev_plus_one(self):
         """이전 사진 + 1초 사용"""
         try:
-            current_row = self.correction_data.iloc[self.current_index]
-            current_filename = Path(current_row["FilePath"]).name
-
-            # 전체 데이터에서 날짜가 있는 파일들만 가져오기
-            all_df = self.processor.df
-            dated_df = all_df[all_df["DateTimeOriginal"].notna()].copy()
-            dated_df = dated_df.sort_values("FileName")
-
-            # 이전 파일 찾기
-            prev_files = dated_df[dated_df["FileName"] < current_filename]
-
-            if not prev_files.empty:
-                prev_file = prev_files.iloc[-1]
-                prev_date = prev_file["DateTimeOriginal"]
-
-                # 안전한 날짜 파싱 및 1초 추가
-                if isinstance(prev_date, str):
-                    from datetime import datetime
-
-                    prev_dt = datetime.strptime(prev_date, "%Y:%m:%d %H:%M:%S")
-                    suggested_dt = prev_dt.replace(second=prev_dt.second + 1)
-                    suggested_date = suggested_dt.strftime("%Y:%m:%d %H:%M:%S")
-                else:
-                    prev_dt = pd.to_datetime(prev_date)
-                    suggested_dt = prev_dt + pd.Timedelta(seconds=1)
-                    suggested_date = suggested_dt.strftime("%Y:%m:%d %H:%M:%S")
+            suggested_date, _, _ = self._suggested_times()
 
+            if suggested_date is not None:
                 self.set_date_value(suggested_date)
                 # UI 강제 업데이트 (여러 방법 시도)
                 self.date_entry.delete(0, tk.END)
@@ -662,42 +676,9 @@ class ManualCorrectionGUI:
     def use_middle_time(self):
         """앞뒤 사진의 중간값 사용"""
         try:
-            current_row = self.correction_data.iloc[self.current_index]
-            current_filename = Path(current_row["FilePath"]).name
-
-            # 전체 데이터에서 날짜가 있는 파일들만 가져오기
-            all_df = self.processor.df
-            dated_df = all_df[all_df["DateTimeOriginal"].notna()].copy()
-            dated_df = dated_df.sort_values("FileName")
-
-            # 앞뒤 파일 찾기
-            prev_files = dated_df[dated_df["FileName"] < current_filename]
-            next_files = dated_df[dated_df["FileName"] > current_filename]
-
-            if not prev_files.empty and not next_files.empty:
-                prev_file = prev_files.iloc[-1]
-                next_file = next_files.iloc[0]
-                prev_date = prev_file["DateTimeOriginal"]
-                next_date = next_file["DateTimeOriginal"]
-
-                # 안전한 날짜 파싱 및 중간값 계산
-                from datetime import datetime
-
-                if isinstance(prev_date, str):
-                    prev_dt = datetime.strptime(prev_date, "%Y:%m:%d %H:%M:%S")
-                else:
-                    prev_dt = pd.to_datetime(prev_date).to_pydatetime()
-
-                if isinstance(next_date, str):
-                    next_dt = datetime.strptime(next_date, "%Y:%m:%d %H:%M:%S")
-                else:
-                    next_dt = pd.to_datetime(next_date).to_pydatetime()
-
-                # 중간값 계산
-                time_diff = next_dt - prev_dt
-                middle_dt = prev_dt + time_diff / 2
-                suggested_date = middle_dt.strftime("%Y:%m:%d %H:%M:%S")
+            _, suggested_date, _ = self._suggested_times()
 
+            if suggested_date is not None:
                 self.set_date_value(suggested_date)
                 # UI 강제 업데이트 (여러 방법 시도)
                 self.date_entry.delete(0, tk.END)
@@ -715,33 +696,9 @@ class ManualCorrectionGUI:
     def use_next_minus_one(self):
         """다음 사진 - 1초 사용"""
         try:
-            current_row = self.correction_data.iloc[self.current_index]
-            current_filename = Path(current_row["FilePath"]).name
-
-            # 전체 데이터에서 날짜가 있는 파일들만 가져오기
-            all_df = self.processor.df
-            dated_df = all_df[all_df["DateTimeOriginal"].notna()].copy()
-            dated_df = dated_df.sort_values("FileName")
-
-            # 다음 파일 찾기
-            next_files = dated_df[dated_df["FileName"] > current_filename]
-
-            if not next_files.empty:
-                next_file = next_files.iloc[0]
-                next_date = next_file["DateTimeOriginal"]
-
-                # 안전한 날짜 파싱 및 1초 빼기
-                if isinstance(next_date, str):
-                    from datetime import datetime
-
-                    next_dt = datetime.strptime(next_date, "%Y:%m:%d %H:%M:%S")
-                    suggested_dt = next_dt.replace(second=next_dt.second - 1)
-                    suggested_date = suggested_dt.strftime("%Y:%m:%d %H:%M:%S")
-                else:
-                    next_dt = pd.to_datetime(next_date)
-                    suggested_dt = next_dt - pd.Timedelta(seconds=1)
-                    suggested_date = suggested_dt.strftime("%Y:%m:%d %H:%M:%S")
+            _, _, suggested_date = self._suggested_times()
 
+            if suggested_date is not None:
                 self.set_date_value(suggested_date)
                 # UI 강제 업데이트 (여러 방법 시도)
                 self.date_entry.delete(0, tk.END)
@@ -1186,23 +1143,37 @@ class ManualCorrectionGUI:
         """보정 완료"""
         try:
             # 보정된 데이터를 원본 processor에 반영
+            # (추출이 아직 진행 중이면 부분 결과 갱신과 겹치지 않도록 잠금)
             if not self.correction_data.empty:
-                for idx, row in self.correction_data.iterrows():
-                    # processor의 df에서 해당 행 찾아서 업데이트
-                    mask = self.processor.df["FilePath"] == row["FilePath"]
-
-                    if self.correction_type in ["date", "both"] and pd.notna(
-                        row["DateTimeOriginal"]
-                    ):
-                        self.processor.df.loc[mask, "DateTimeOriginal"] = row[
-                            "DateTimeOriginal"
-                        ]
-
-                    if self.correction_type in ["gps", "both"]:
-                        if pd.notna(row["GPSLat"]):
-                            self.processor.df.loc[mask, "GPSLat"] = row["GPSLat"]
-                        if pd.notna(row["GPSLong"]):
-                            self.processor.df.loc[mask, "GPSLong"] = row["GPSLong"]
+                with self.processor.lock:
+                    dated = []
+                    corrected = []
+                    for idx, row in self.correction_data.iterrows():
+                        # processor의 df에서 해당 행 찾아서 업데이트
+                        mask = self.processor.df["FilePath"] == row["FilePath"]
+                        corrected.extend(self.processor.df.index[mask])
+
+                        if self.correction_type in ["date", "both"] and pd.notna(
+                            row["DateTimeOriginal"]
+                        ):
+                            self.processor.df.loc[mask, "DateTimeOriginal"] = row[
+                                "DateTimeOriginal"
+                            ]
+                            dated.extend(self.processor.df.index[mask])
+
+                        if self.correction_type in ["gps", "both"]:
+                            if pd.notna(row["GPSLat"]):
+                                self.processor.df.loc[mask, "GPSLat"] = row["GPSLat"]
+                            if pd.notna(row["GPSLong"]):
+                                self.processor.df.loc[mask, "GPSLong"] = row[
+                                    "GPSLong"
+                                ]
+
+                    # 고친 날짜의 datetime 컬럼(닿는 덩어리 포함)과 고친 행의 status도 갱신
+                    if dated:
+                        self.processor.refresh_capture_times(dated)
+                    if corrected:
+                        self.processor.refresh_status(corrected)
 
             messagebox.showinfo("완료", "수동 보정이 완료되었습니다.")
             self.root.destroy()
@@ -1214,7 +1185,11 @@ class ManualCorrectionGUI:
     # 추가: 날짜 제안 및 하이라이트 로직
     # ------------------------------------------------------------------
     def _compute_prev_next_dates(self):
-        """이전/다음 사진의 DateTimeOriginal을 datetime으로 반환"""
+        """
+        이전/다음 사진(파일명 순)의 촬영 시각을 datetime으로 반환
+
+        문자열을 다시 파싱하지 않고 추출할 때 만든 processor.df의 datetime 컬럼을 쓴다.
+        """
         if (
             not isinstance(self.correction_data, pd.DataFrame)
             or self.correction_data.empty
@@ -1224,35 +1199,24 @@ class ManualCorrectionGUI:
         current_row = self.correction_data.iloc[self.current_index]
         current_filename = Path(current_row["FilePath"]).name
 
-        dated_df = self.processor.df[
-            self.processor.df["DateTimeOriginal"].notna()
-        ].copy()
+        df = self.processor.df
+        if "datetime" not in df.columns:
+            return None, None
+        dated_df = df.loc[df["datetime"].notna(), ["FileName", "datetime"]]
         if dated_df.empty:
             return None, None
-        dated_df = dated_df.sort_values("FileName")
 
         prev_row = dated_df[dated_df["FileName"] < current_filename]
         next_row = dated_df[dated_df["FileName"] > current_filename]
 
         prev_dt = None
         next_dt = None
-        try:
-            if not prev_row.empty:
-                prev_val = prev_row.iloc[-1]["DateTimeOriginal"]
-                prev_dt = (
-                    datetime.strptime(prev_val, "%Y:%m:%d %H:%M:%S")
-                    if isinstance(prev_val, str)
-                    else pd.to_datetime(prev_val).to_pydatetime()
-                )
-            if not next_row.empty:
-                next_val = next_row.iloc[0]["DateTimeOriginal"]
-                next_dt = (
-                    datetime.strptime(next_val, "%Y:%m:%d %H:%M:%S")
-                    if isinstance(next_val, str)
-                    else pd.to_datetime(next_val).to_pydatetime()
-                )
-        except Exception:
-            pass
+        if not prev_row.empty:
+            prev_val = prev_row.loc[prev_row["FileName"].idxmax(), "datetime"]
+            prev_dt = prev_val.to_pydatetime(warn=False)
+        if not next_row.empty:
+            next_val = next_row.loc[next_row["FileName"].idxmin(), "datetime"]
+            next_dt = next_val.to_pydatetime(warn=False)
         return prev_dt, next_dt
 
     def _suggested_times(self):
@@ -1396,24 +1360,37 @@ class ManualCorrectionGUI:
         self._update_widgets_visibility()
 
 
-def show_correction_menu(processor):
-    """단계별 보정 메뉴 표시"""
-    auto_df, manual_date_df, manual_gps_df, manual_both_df = (
-        processor.classify_processing_type()
-    )
+def _correction_rows(processor, correction_type):
+    """
+    보정 종류의 대상 행 (status 순서대로, 예: 날짜만 없음 → 둘 다 없음)
 
-    # 단계별 보정 필요 파일 계산
-    step1_files = (
-        pd.concat([manual_date_df, manual_both_df])
-        if not manual_date_df.empty or not manual_both_df.empty
-        else pd.DataFrame()
-    )
-    step2_files = (
-        pd.concat([manual_gps_df, manual_both_df])
-        if not manual_gps_df.empty or not manual_both_df.empty
-        else pd.DataFrame()
+    보정 창을 열 때 꺼내므로 추출 중 부분 결과로 표가 바뀌었어도 지금 표 기준이다.
+    """
+    with processor.lock:
+        first, *rest = [
+            processor.status_index(status)
+            for status in CORRECTION_STATUSES[correction_type]
+        ]
+        return processor.df.loc[first.append(rest)]
+
+
+def show_correction_menu(processor, on_open=None):
+    """
+    단계별 보정 메뉴 표시
+
+    Args:
+        processor: PhotoExifProcessor 인스턴스 (추출 중이면 지금까지의 부분 결과로 시작)
+        on_open: 보정 창이 열릴 때 ManualCorrectionGUI를 받는 함수
+            (추출이 끝나지 않았을 때 새 부분 결과를 extend_correction으로 넘기는 데 사용)
+    """
+    auto_index, manual_date_index, manual_gps_index, manual_both_index = (
+        processor.classify_processing_index()
     )
 
+    # 단계별 보정 필요 파일 수 (행은 보정 창을 열 때 _correction_rows로 꺼냄)
+    step1_index = manual_date_index.append(manual_both_index)
+    step2_index = manual_gps_index.append(manual_both_index)
+
     root = tk.Tk()
     root.title("단계별 수동 보정")
     root.geometry("500x400")
@@ -1424,13 +1401,13 @@ def show_correction_menu(processor):
     info_frame = ttk.Frame(root)
     info_frame.pack(pady=10, padx=20, fill="x")
 
-    step1_text = f"""📅 1단계: 시간 보정 → {len(step1_files)}개 파일
-• GPS는 있지만 날짜 없음: {len(manual_date_df)}개
-• 날짜와 GPS 둘 다 없음: {len(manual_both_df)}개"""
+    step1_text = f"""📅 1단계: 시간 보정 → {len(step1_index)}개 파일
+• GPS는 있지만 날짜 없음: {len(manual_date_index)}개
+• 날짜와 GPS 둘 다 없음: {len(manual_both_index)}개"""
 
-    step2_text = f"""🗺️ 2단계: 장소 보정 → {len(step2_files)}개 파일  
-• 날짜는 있지만 GPS 없음: {len(manual_gps_df)}개
-• 1단계 완료 후 GPS 입력 필요: {len(manual_both_df)}개"""
+    step2_text = f"""🗺️ 2단계: 장소 보정 → {len(step2_index)}개 파일  
+• 날짜는 있지만 GPS 없음: {len(manual_gps_index)}개
+• 1단계 완료 후 GPS 입력 필요: {len(manual_both_index)}개"""
 
     ttk.Label(info_frame, text=step1_text, justify=tk.LEFT, font=("", 10)).pack(
         anchor="w", pady=5
@@ -1453,16 +1430,22 @@ def show_correction_menu(processor):
 
     def start_step1_correction():
         root.destroy()
+        step1_files = _correction_rows(processor, "date")
         if not step1_files.empty:
             gui = ManualCorrectionGUI(processor)
+            if on_open is not None:
+                on_open(gui)
             gui.start_correction(step1_files, "date")
         else:
             messagebox.showinfo("알림", "1단계 시간 보정이 필요한 파일이 없습니다.")
 
     def start_step2_correction():
         root.destroy()
+        step2_files = _correction_rows(processor, "gps")
         if not step2_files.empty:
             gui = ManualCorrectionGUI(processor)
+            if on_open is not None:
+                on_open(gui)
             gui.start_correction(step2_files, "gps")
         else:
             messagebox.showinfo("알림", "2단계 장소 보정이 필요한 파일이 없습니다.")
@@ -1472,7 +1455,7 @@ def show_correction_menu(processor):
         button_frame, text="1단계: 시간 보정", command=start_step1_correction
     )
     step1_btn.pack(pady=8, ipadx=20)
-    if len(step1_files) == 0:
+    if len(step1_index) == 0:
         step1_btn.config(state="disabled")
         step1_btn.config(text="✅ 1단계: 시간 보정 완료")
 
@@ -1481,7 +1464,7 @@ def show_correction_menu(processor):
         button_frame, text="2단계: 장소 보정", command=start_step2_correction
     )
     step2_btn.pack(pady=8, ipadx=20)
-    if len(step2_files) == 0:
+    if len(step2_index) == 0:
         step2_btn.config(state="disabled")
         step2_btn.config(text="✅ 2단계: 장소 보정 완료")
 
@@ -1489,7 +1472,7 @@ def show_correction_menu(processor):
     ttk.Button(button_frame, text="취소", command=root.destroy).pack(pady=15)
 
     # 진행 상황 표시
-    if len(step1_files) == 0 and len(step2_files) == 0:
+    if len(step1_index) == 0 and len(step2_index) == 0:
         ttk.Label(
             root,
             text="🎉 모든 보정이 완료되었습니다!",
@@ -6,13 +6,48 @@ Photo EXIF Processor for Google My Maps
 
 import os
 import json
+import math
+import random
+import re
+from array import array
 import pandas as pd
 import piexif
 from PIL import Image
 from datetime import datetime, timedelta
+import struct
 import subprocess
+import time
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 import logging
+import signal
+import threading
+from contextlib import contextmanager
+
+from compact_columns import CompactStringArray, CoordinateArray, PathArray
+from exif_cache import CACHED_FIELDS, ExifCache, file_signature
+from concurrency_controller import AdaptiveExecutor, AimdController
+from directory_walker import IgnoreRules, walk_files
+from exif_header_reader import (
+    GPS_TAG_NAMES,
+    TIME_DETAIL_TAG_NAMES,
+    ExifFormatError,
+    read_exif_tags,
+)
+from exiftool_session import ExifToolSession
+from processing_events import (
+    BATCH_DONE,
+    FILE_ERROR,
+    FILES_FOUND,
+    STAGE_END,
+    STAGE_START,
+    EventEmitter,
+    ThroughputMeter,
+)
+from read_scheduler import READ_ORDERS, ReadScheduler
+from scan_journal import ScanJournal
+from stream_pipeline import StreamPipeline, batched
+from video_atom_reader import VideoFormatError, read_video_metadata
 
 # 로그 설정
 logging.basicConfig(
@@ -20,16 +55,168 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 병렬 추출 백엔드: thread(I/O 위주 헤더 읽기), process(GIL을 피하는 CPU 위주 파싱)
+EXTRACTION_BACKENDS = ("thread", "process")
+
+# 워커 수 대신 지정하면 AIMD 컨트롤러가 동시 처리 수를 조절
+ADAPTIVE_WORKERS = "auto"
+
+# 프로세스 워커 한 번에 넘기는 최대 파일 수
+PROCESS_BATCH_SIZE = 256
+
+# 스트리밍 파이프라인 한 묶음의 파일 수 / 단계 사이 큐에 쌓아둘 최대 묶음 수
+STREAM_BATCH_SIZE = 512
+STREAM_QUEUE_SIZE = 4
+
+# 부분 결과를 알리는 간격: 묶음 하나와 지금까지 알린 행 수의 이 비율 중 큰 쪽
+# (알릴 때마다 표를 다시 정렬하므로 간격을 점점 늘려 전체 비용을 행 수에 비례하게 유지)
+PARTIAL_RESULT_GROWTH = 0.25
+
+# DateTimeOriginal 문자열 형식 (앞에서부터 시도, 어디에도 맞지 않으면 일반 파싱)
+EXIF_DATE_FORMATS = (
+    "%Y:%m:%d %H:%M:%S",  # 표준 EXIF 형식
+    "%Y-%m-%d %H:%M:%S",  # ISO 형식
+    "%Y:%m:%d",  # 날짜만
+    "%Y-%m-%d",  # ISO 날짜만
+)
+
+# 추출해서 캐시/저널에는 두지만 표에는 datetime/utc_offset으로만 남기는 촬영 시각 필드
+TIME_DETAIL_FIELDS = ("SubSecTimeOriginal", "OffsetTimeOriginal")
+
+# 처리 상태(status 컬럼의 범주): 날짜/GPS 모두 있음, 날짜만 없음, GPS만 없음, 둘 다 없음
+PROCESSING_STATUSES = ("complete", "need_date", "need_gps", "need_both")
+
+# OffsetTimeOriginal 형식 (예: +09:00)
+EXIF_OFFSET_PATTERN = re.compile(r"^\s*([+-])(\d{2}):?(\d{2})\s*$")
+
+# exiftool이 -n 없이 내보내는 도/분/초 좌표 (예: 37 deg 33' 59.40" N)
+DMS_COORDINATE_PATTERN = re.compile(
+    r"^\s*([\d.]+)\s*deg\s*([\d.]+)'\s*([\d.]+)\"\s*([NSEW])?\s*$"
+)
+
+# 추정 모드에서 폴더마다 무작위로 골라 추출할 최대 파일 수
+ESTIMATE_SAMPLE_PER_DIR = 20
+
+VIDEO_EXTENSIONS = {".mov", ".mp4"}
+
+# EXIF(TIFF 구조)를 담는 이미지 형식 / 그중 piexif로 폴백할 수 있는 형식
+EXIF_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".tiff", ".heic", ".heif", ".png"}
+PIEXIF_EXTENSIONS = {".jpg", ".jpeg", ".tiff"}
+EMPTY_VIDEO_METADATA = {"DateTimeOriginal": None, "GPSLat": None, "GPSLong": None}
+
+# exiftool 상주 세션에 한 번에 요청하는 영상 파일 수 / 파일당 타임아웃(초)
+VIDEO_BATCH_SIZE = 64
+EXIFTOOL_TIMEOUT = 30
+
+# 프로세스 워커마다 한 번만 만들어 재사용하는 처리기 / 부모로 돌려보낼 파일별 오류
+_worker_processor = None
+_worker_errors = []
+
+
+class ProcessingCancelled(Exception):
+    """cancel()로 처리가 중단됨"""
+
+
+def _init_process_worker(photo_folder, fast_exif):
+    """프로세스 풀 워커 초기화 (워커 프로세스당 1회)"""
+    global _worker_processor
+    # Ctrl+C(일시 중지)는 부모 프로세스가 처리하므로 워커는 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_processor = PhotoExifProcessor(photo_folder, fast_exif=fast_exif)
+    _worker_processor.subscribe(_collect_worker_error)
+
+
+def _collect_worker_error(event):
+    """워커 처리기의 파일별 오류를 모아뒀다가 묶음 결과와 함께 부모에 넘김"""
+    if event["type"] == FILE_ERROR:
+        _worker_errors.append((event["path"], event["error"]))
+
+
+def _extract_batch_columnar(paths):
+    """
+    프로세스 워커에서 파일 묶음의 EXIF를 추출하여 열 단위로 반환
+
+    파일마다 dict를 피클링하지 않도록 날짜/시각 필드는 문자열 리스트, 좌표는 float 배열
+    (없으면 NaN)로 묶어서 보낸다. 숫자가 아닌 좌표(exiftool 문자열 등)는
+    extras에 (행, 컬럼) 키로 따로 담는다. 추출에 실패한 행 번호는 failed에,
+    워커에서 난 파일별 오류 (경로, 내용)은 errors에 담는다.
+
+    Returns:
+        tuple: (texts, lats, lons, extras, failed, errors)
+            (texts는 {DateTimeOriginal/SubSecTimeOriginal/OffsetTimeOriginal: 리스트})
+    """
+    texts = {key: [] for key in ("DateTimeOriginal", *TIME_DETAIL_FIELDS)}
+    lats = array("d")
+    lons = array("d")
+    extras = {}
+    failed = []
+    del _worker_errors[:]
+
+    paths = [Path(p) for p in paths]
+    _worker_processor._prefetch_video_metadata(paths)
+
+    for i, path in enumerate(paths):
+        row, ok = _worker_processor._extract_exif_row(path)
+        if not ok:
+            failed.append(i)
+        for key, column in texts.items():
+            column.append(row[key])
+
+        for key, column in (("GPSLat", lats), ("GPSLong", lons)):
+            value = row[key]
+            if value is None:
+                column.append(math.nan)
+            elif isinstance(value, (int, float)):
+                column.append(float(value))
+            else:
+                column.append(math.nan)
+                extras[(i, key)] = value
+
+    return texts, lats, lons, extras, failed, list(_worker_errors)
+
 
 class PhotoExifProcessor:
-    def __init__(self, photo_folder):
+    def __init__(
+        self,
+        photo_folder,
+        workers=1,
+        backend="thread",
+        fast_exif=True,
+        cache_path=None,
+        ignore_defaults=True,
+        follow_symlinks=False,
+        read_order="path",
+        journal_path=None,
+    ):
         """
         사진 폴더를 지정하여 EXIF 처리기 초기화
 
         Args:
             photo_folder (str): 사진이 저장된 폴더 경로
+            workers (int | str): EXIF 추출에 사용할 워커 수 (1이면 순차 처리,
+                "auto"면 처리 시간을 보면서 동시 처리 수를 자동 조절)
+            backend (str): 병렬 추출 백엔드 ("thread" 또는 "process")
+            fast_exif (bool): 헤더만 읽는 빠른 EXIF 리더 사용 여부 (False면 항상 piexif)
+            cache_path (str | Path): EXIF 캐시(SQLite) 파일 경로 (None이면 캐시 사용 안 함)
+            ignore_defaults (bool): 기본 제외 규칙(숨김 폴더, @eaDir, Lightroom 미리보기 등) 사용 여부
+            follow_symlinks (bool): 심볼릭 링크 폴더로도 내려갈지 여부 (순환은 자동으로 막음)
+            read_order (str): 파일 읽기 순서 ("path": 경로 순, "inode"/"extent": 디스크 위치 순 +
+                미리 읽기). 어느 순서로 읽어도 결과는 경로 순으로 정리됨
+            journal_path (str | Path): 체크포인트 저널(SQLite) 파일 경로
+                (None이면 사용 안 함, 있으면 process_all_photos(resume=True)로 이어서 처리)
         """
+        if backend not in EXTRACTION_BACKENDS:
+            raise ValueError(f"지원하지 않는 추출 백엔드입니다: {backend}")
+        if read_order not in READ_ORDERS:
+            raise ValueError(f"지원하지 않는 읽기 순서입니다: {read_order}")
+
         self.photo_folder = Path(photo_folder)
+        self.workers = self._normalize_workers(workers)
+        self.backend = backend
+        self.fast_exif = fast_exif
+        self._exiftool = None
+        self._exiftool_missing = False
+        self._video_metadata = {}
         self.supported_extensions = {
             ".jpg",
             ".jpeg",
@@ -37,6 +224,7 @@ class PhotoExifProcessor:
             ".mov",
             ".mp4",
             ".heic",
+            ".heif",
             ".tiff",
         }
         self.df = pd.DataFrame()
@@ -44,6 +232,75 @@ class PhotoExifProcessor:
         if not self.photo_folder.exists():
             raise ValueError(f"사진 폴더가 존재하지 않습니다: {photo_folder}")
 
+        self.cache = ExifCache(cache_path) if cache_path else None
+        self.journal = ScanJournal(journal_path) if journal_path else None
+        # 기본 제외 규칙 + 사진 폴더의 .photoexifignore
+        self.ignore_rules = IgnoreRules.load(self.photo_folder, ignore_defaults)
+        self.follow_symlinks = follow_symlinks
+        self.read_scheduler = (
+            ReadScheduler(read_order) if read_order != "path" else None
+        )
+        self._file_state = {}
+        # 부분 결과로 self.df를 바꾸는 동안 다른 스레드(보정 GUI 등)가 self.df를 고치지 않도록 잠금
+        self.lock = threading.RLock()
+        self._cancel = threading.Event()
+        self.events = EventEmitter()
+
+    def subscribe(self, listener):
+        """
+        진행 이벤트 구독 (종류와 필드는 processing_events 참고)
+
+        이벤트는 처리 스레드에서 바로 호출되므로 오래 걸리는 일이나 GUI 갱신은
+        큐 등으로 넘겨서 해야 한다.
+
+        Args:
+            listener: 이벤트 dict 하나를 받는 함수
+
+        Returns:
+            listener (unsubscribe에 그대로 넘기면 됨)
+        """
+        return self.events.subscribe(listener)
+
+    def unsubscribe(self, listener):
+        """진행 이벤트 구독 해제"""
+        self.events.unsubscribe(listener)
+
+    def _file_error(self, file_path, error):
+        """파일 하나의 추출 실패 알림 (로그는 DEBUG만, 개수는 실행 끝에 한 번 경고)"""
+        logger.debug(f"EXIF 추출 실패 {file_path.name}: {error}")
+        self.events.emit(FILE_ERROR, path=str(file_path), error=str(error))
+
+    def iter_photos(self, root=None):
+        """
+        폴더 내 이미지/영상 파일을 찾는 대로 반환 (순서 없음)
+
+        os.scandir로 하위 폴더를 스레드 여러 개가 나눠서 읽으므로
+        전체 탐색이 끝나기 전에 처리를 시작할 수 있다. 제외 규칙에 걸리는
+        폴더는 내려가지 않는다.
+
+        Args:
+            root (Path): 탐색할 폴더 (None이면 사진 폴더 전체)
+
+        Yields:
+            Path: 지원되는 파일 확장자의 파일 경로
+        """
+        for path in walk_files(
+            root or self.photo_folder,
+            self.supported_extensions,
+            ignore=self.ignore_rules,
+            base=self.photo_folder,
+            follow_symlinks=self.follow_symlinks,
+        ):
+            yield Path(path)
+
+    def cancel(self):
+        """
+        진행 중인 process_all_photos()/rescan() 중단 요청 (다른 스레드에서 호출)
+
+        지금 읽고 있는 파일들까지만 마치고 ProcessingCancelled를 발생시킨다.
+        """
+        self._cancel.set()
+
     def scan_photos(self):
         """
         폴더 내 모든 이미지/영상 파일 검색
@@ -51,17 +308,10 @@ class PhotoExifProcessor:
         Returns:
             list: 지원되는 파일 확장자의 파일 경로 리스트
         """
-        photo_files = []
-
-        for file_path in self.photo_folder.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.suffix.lower() in self.supported_extensions
-            ):
-                photo_files.append(file_path)
+        photo_files = sorted(self.iter_photos())
 
         logger.info(f"총 {len(photo_files)}개의 파일을 발견했습니다.")
-        return sorted(photo_files)
+        return photo_files
 
     def extract_exif_data(self, file_path):
         """
@@ -71,48 +321,126 @@ class PhotoExifProcessor:
             file_path (Path): 파일 경로
 
         Returns:
-            dict: EXIF 데이터 (FileName, DateTimeOriginal, GPSLat, GPSLong)
+            dict: EXIF 데이터 (FileName, FilePath, DateTimeOriginal, SubSecTimeOriginal,
+                OffsetTimeOriginal, GPSLat, GPSLong)
+        """
+        return self._extract_exif_row(file_path)[0]
+
+    def _extract_exif_row(self, file_path):
+        """
+        extract_exif_data와 같지만 추출 성공 여부도 함께 반환 (실패한 결과는 캐시하지 않음)
+
+        Returns:
+            tuple: (EXIF 데이터 dict, 성공 여부)
+        """
+        return self._decode_exif_tags(file_path, self._read_exif_raw(file_path))
+
+    def _read_exif_raw(self, file_path):
+        """
+        헤더 읽기 단계: 파일에서 디코딩 전 태그 읽기
+
+        Returns:
+            dict | None: 이미지는 _read_image_exif_tags 결과, 영상은 날짜/GPS 메타데이터,
+                그 외 형식은 빈 dict (읽기 실패는 None)
+        """
+        try:
+            # 이미지 파일인 경우 헤더만 읽는 빠른 리더 사용 (특이 구조는 piexif)
+            if file_path.suffix.lower() in EXIF_IMAGE_EXTENSIONS:
+                return self._read_image_exif_tags(file_path)
+
+            # 영상 파일은 MP4/MOV 박스를 직접 읽고 부족하면 exiftool 사용 (있는 경우)
+            if file_path.suffix.lower() in VIDEO_EXTENSIONS:
+                return self._extract_video_exif(file_path)
+
+        except Exception as e:
+            self._file_error(file_path, e)
+            return None
+
+        return {}
+
+    def _decode_exif_tags(self, file_path, tags):
+        """
+        태그 디코딩 단계: _read_exif_raw 결과를 날짜/시각 문자열 / 십진수 GPS 행으로 변환
+
+        Returns:
+            tuple: (EXIF 데이터 dict, 성공 여부)
         """
         result = {
             "FileName": file_path.name,
             "FilePath": str(file_path),
             "DateTimeOriginal": None,
+            "SubSecTimeOriginal": None,
+            "OffsetTimeOriginal": None,
             "GPSLat": None,
             "GPSLong": None,
         }
+        if tags is None:
+            return result, False
 
         try:
-            # 이미지 파일인 경우 piexif 사용
-            if file_path.suffix.lower() in {".jpg", ".jpeg", ".tiff"}:
-                exif_dict = piexif.load(str(file_path))
-
+            if file_path.suffix.lower() in EXIF_IMAGE_EXTENSIONS:
                 # 날짜 정보 추출
-                if piexif.ExifIFD.DateTimeOriginal in exif_dict.get("Exif", {}):
-                    date_bytes = exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal]
-                    result["DateTimeOriginal"] = date_bytes.decode("utf-8")
+                date = None
+                if "DateTimeOriginal" in tags:
+                    date = tags["DateTimeOriginal"].decode("utf-8")
+                result["DateTimeOriginal"] = date
+                for key in TIME_DETAIL_FIELDS:
+                    if key in tags:
+                        value = tags[key].decode("utf-8").strip("\x00 ")
+                        result[key] = value or None
 
                 # GPS 정보 추출
-                gps_info = exif_dict.get("GPS", {})
-                if gps_info:
-                    lat = self._convert_gps_to_decimal(
-                        gps_info.get(piexif.GPSIFD.GPSLatitude),
-                        gps_info.get(piexif.GPSIFD.GPSLatitudeRef),
-                    )
-                    lon = self._convert_gps_to_decimal(
-                        gps_info.get(piexif.GPSIFD.GPSLongitude),
-                        gps_info.get(piexif.GPSIFD.GPSLongitudeRef),
-                    )
-                    result["GPSLat"] = lat
-                    result["GPSLong"] = lon
+                result["GPSLat"] = self._convert_gps_to_decimal(
+                    tags.get("GPSLatitude"), tags.get("GPSLatitudeRef")
+                )
+                result["GPSLong"] = self._convert_gps_to_decimal(
+                    tags.get("GPSLongitude"), tags.get("GPSLongitudeRef")
+                )
 
-            # 영상 파일의 경우 exiftool 사용 (있는 경우)
-            elif file_path.suffix.lower() in {".mov", ".mp4"}:
-                result.update(self._extract_video_exif(file_path))
+            elif file_path.suffix.lower() in VIDEO_EXTENSIONS:
+                result.update(tags)
 
         except Exception as e:
-            logger.warning(f"EXIF 추출 실패 {file_path.name}: {e}")
+            self._file_error(file_path, e)
+            return result, False
 
-        return result
+        return result, True
+
+    def _read_image_exif_tags(self, file_path):
+        """
+        JPEG/TIFF/HEIC/PNG에서 필요한 EXIF 태그만 읽기
+
+        Returns:
+            dict: DateTimeOriginal / SubSecTimeOriginal / OffsetTimeOriginal /
+                GPSLatitude(Ref) / GPSLongitude(Ref) 중 존재하는 태그
+        """
+        is_piexif_format = file_path.suffix.lower() in PIEXIF_EXTENSIONS
+
+        if self.fast_exif or not is_piexif_format:
+            try:
+                return read_exif_tags(file_path)
+            except (ExifFormatError, struct.error, ValueError, IndexError) as e:
+                if not is_piexif_format:
+                    raise
+                logger.debug(f"빠른 EXIF 리더 실패, piexif로 재시도 {file_path.name}: {e}")
+
+        exif_dict = piexif.load(str(file_path))
+        tags = {}
+
+        exif_ifd = exif_dict.get("Exif", {})
+        if piexif.ExifIFD.DateTimeOriginal in exif_ifd:
+            tags["DateTimeOriginal"] = exif_ifd[piexif.ExifIFD.DateTimeOriginal]
+        for tag, name in TIME_DETAIL_TAG_NAMES.items():
+            if tag in exif_ifd:
+                tags[name] = exif_ifd[tag]
+
+        gps_info = exif_dict.get("GPS", {})
+        for name in GPS_TAG_NAMES.values():
+            tag = getattr(piexif.GPSIFD, name)
+            if tag in gps_info:
+                tags[name] = gps_info[tag]
+
+        return tags
 
     def _convert_gps_to_decimal(self, gps_coord, gps_ref):
         """
@@ -135,105 +463,1258 @@ class PhotoExifProcessor:
         except:
             return None
 
-    def _extract_video_exif(self, file_path):
+    def _get_exiftool_session(self):
+        """exiftool 상주 세션 (처리기당 하나, 첫 사용 시 생성)"""
+        if self._exiftool is None:
+            self._exiftool = ExifToolSession(timeout_per_file=EXIFTOOL_TIMEOUT)
+        return self._exiftool
+
+    def _parse_exiftool_data(self, data):
+        """exiftool JSON 한 항목에서 날짜/GPS 추출"""
+        result = dict(EMPTY_VIDEO_METADATA)
+
+        # 날짜 정보
+        for date_field in ["DateTimeOriginal", "CreateDate", "MediaCreateDate"]:
+            if date_field in data:
+                result["DateTimeOriginal"] = data[date_field]
+                break
+
+        # GPS 정보
+        if "GPSLatitude" in data and "GPSLongitude" in data:
+            result["GPSLat"] = data["GPSLatitude"]
+            result["GPSLong"] = data["GPSLongitude"]
+
+        return result
+
+    def _read_native_video_metadata(self, file_path):
+        """MP4/MOV 박스를 직접 읽어서 날짜/GPS 추출 (읽을 수 없으면 None)"""
+        try:
+            return read_video_metadata(file_path)
+        except (VideoFormatError, struct.error, ValueError, IndexError) as e:
+            logger.debug(f"영상 박스 파싱 실패, exiftool로 재시도 {file_path.name}: {e}")
+            return None
+
+    @staticmethod
+    def _merge_video_metadata(native, fallback):
+        """네이티브 결과의 빈 값(날짜 / GPS 쌍)만 exiftool 결과로 채움"""
+        result = dict(native or EMPTY_VIDEO_METADATA)
+        if fallback:
+            if result["DateTimeOriginal"] is None:
+                result["DateTimeOriginal"] = fallback["DateTimeOriginal"]
+            if result["GPSLat"] is None or result["GPSLong"] is None:
+                result["GPSLat"] = fallback["GPSLat"]
+                result["GPSLong"] = fallback["GPSLong"]
+        return result
+
+    @staticmethod
+    def _is_complete_video_metadata(metadata):
+        return metadata is not None and all(
+            metadata[key] is not None for key in EMPTY_VIDEO_METADATA
+        )
+
+    def _prefetch_video_metadata(self, file_paths):
         """
-        영상 파일에서 exiftool을 사용하여 메타데이터 추출
+        영상 파일들의 메타데이터를 미리 읽어서 _video_metadata에 저장
+
+        먼저 MP4/MOV 박스를 직접 읽고, 날짜나 GPS가 빠진 파일만
+        VIDEO_BATCH_SIZE개씩 묶어서 exiftool 세션에 요청한다.
+        결과는 _extract_video_exif에서 꺼내 쓴다. 묶음 요청이 실패한 파일은
+        저장되지 않으므로 파일별 요청으로 다시 처리된다.
         """
-        result = {"DateTimeOriginal": None, "GPSLat": None, "GPSLong": None}
+        native = {}
+        pending = []
+        for file_path in file_paths:
+            if file_path.suffix.lower() not in VIDEO_EXTENSIONS:
+                continue
+            metadata = self._read_native_video_metadata(file_path)
+            if self._is_complete_video_metadata(metadata) or self._exiftool_missing:
+                self._video_metadata[str(file_path)] = self._merge_video_metadata(
+                    metadata, None
+                )
+            else:
+                native[str(file_path)] = metadata
+                pending.append(file_path)
 
-        try:
-            # exiftool이 설치되어 있는지 확인
-            cmd = ["exiftool", "-j", str(file_path)]
-            output = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if not pending:
+            return
 
-            if output.returncode == 0:
-                data = json.loads(output.stdout)[0]
+        session = self._get_exiftool_session()
+        for i in range(0, len(pending), VIDEO_BATCH_SIZE):
+            batch = pending[i : i + VIDEO_BATCH_SIZE]
+            try:
+                metadata = session.get_metadata(batch)
+            except FileNotFoundError as e:
+                self._exiftool_missing = True
+                logger.warning(f"exiftool을 찾을 수 없어 영상 박스 정보만 사용합니다: {e}")
+                for file_path in pending[i:]:
+                    self._video_metadata[str(file_path)] = self._merge_video_metadata(
+                        native[str(file_path)], None
+                    )
+                return
+            except (
+                subprocess.TimeoutExpired,
+                BrokenPipeError,
+                json.JSONDecodeError,
+            ) as e:
+                logger.warning(f"exiftool 묶음 처리 실패 ({len(batch)}개), 파일별로 재시도: {e}")
+                continue
+
+            for file_path in batch:
+                data = metadata.get(str(file_path))
+                self._video_metadata[str(file_path)] = self._merge_video_metadata(
+                    native[str(file_path)],
+                    self._parse_exiftool_data(data) if data else None,
+                )
+
+    def _extract_video_exif(self, file_path):
+        """
+        영상 파일 메타데이터 추출
+
+        MP4/MOV 박스를 직접 읽고, 날짜나 GPS가 빠졌으면 exiftool 상주 세션으로 보완
+        """
+        cached = self._video_metadata.pop(str(file_path), None)
+        if cached is not None:
+            return cached
 
-                # 날짜 정보
-                for date_field in ["DateTimeOriginal", "CreateDate", "MediaCreateDate"]:
-                    if date_field in data:
-                        result["DateTimeOriginal"] = data[date_field]
-                        break
+        native = self._read_native_video_metadata(file_path)
+        if self._is_complete_video_metadata(native) or self._exiftool_missing:
+            return self._merge_video_metadata(native, None)
 
-                # GPS 정보
-                if "GPSLatitude" in data and "GPSLongitude" in data:
-                    result["GPSLat"] = data["GPSLatitude"]
-                    result["GPSLong"] = data["GPSLongitude"]
+        fallback = None
+        try:
+            data = self._get_exiftool_session().get_metadata([file_path])
+            if str(file_path) in data:
+                fallback = self._parse_exiftool_data(data[str(file_path)])
 
+        except FileNotFoundError as e:
+            self._exiftool_missing = True
+            logger.warning(f"exiftool 처리 실패 {file_path.name}: {e}")
         except (
             subprocess.TimeoutExpired,
-            FileNotFoundError,
+            BrokenPipeError,
             json.JSONDecodeError,
         ) as e:
             logger.warning(f"exiftool 처리 실패 {file_path.name}: {e}")
 
-        return result
+        return self._merge_video_metadata(native, fallback)
+
+    def close(self):
+        """exiftool 상주 세션, EXIF 캐시 등 외부 자원 정리"""
+        if self._exiftool is not None:
+            self._exiftool.close()
+            self._exiftool = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def _read_with_process_pool(self, executor, workers, photo_files):
+        """
+        프로세스 풀에 파일 경로 묶음을 보내 열 단위 결과를 받아 합침
+        (워커 프로세스에서 헤더 읽기와 태그 디코딩을 함께 하고, 파일별 오류는 여기서 알림)
+
+        Returns:
+            tuple: (날짜/시각/위도/경도 컬럼 dict, 추출 실패한 행 번호 set)
+        """
+        batch_size = min(
+            PROCESS_BATCH_SIZE, max(1, math.ceil(len(photo_files) / (workers * 4)))
+        )
+        batches = [
+            [str(p) for p in photo_files[i : i + batch_size]]
+            for i in range(0, len(photo_files), batch_size)
+        ]
+
+        texts = {key: [] for key in ("DateTimeOriginal", *TIME_DETAIL_FIELDS)}
+        lats = []
+        lons = []
+        failed = set()
+
+        for b_texts, b_lats, b_lons, extras, b_failed, errors in executor.map(
+            _extract_batch_columnar, batches
+        ):
+            offset = len(lats)
+            for key, values in b_texts.items():
+                texts[key].extend(values)
+            # NaN은 순차 처리 결과와 같도록 None으로 되돌림
+            lats.extend(None if math.isnan(v) else v for v in b_lats)
+            lons.extend(None if math.isnan(v) else v for v in b_lons)
+            for (i, key), value in extras.items():
+                (lats if key == "GPSLat" else lons)[offset + i] = value
+            failed.update(offset + i for i in b_failed)
+            for path, error in errors:
+                self.events.emit(FILE_ERROR, path=path, error=error)
+
+        return {**texts, "GPSLat": lats, "GPSLong": lons}, failed
+
+    def _read_headers(self, photo_files, stats, run):
+        """
+        묶음 하나의 헤더 읽기 (입력 순서로 결과 반환)
+
+        읽기 스케줄러가 설정되어 있으면 디스크 위치 순으로 읽은 뒤
+        결과를 입력 순서로 되돌린다.
+
+        Args:
+            stats (list): photo_files와 같은 순서의 os.stat 결과 (읽기 순서 계산용)
+            run: (위치 → (결과, 읽기 시간) 함수, 파일 수) → 위치 순서의 결과
+                (또는 결과 Future) 목록을 만드는 실행기
+
+        Returns:
+            list: 파일별 _read_exif_raw 결과 (적응형 동시성이면 그 Future)
+        """
+        order = list(range(len(photo_files)))
+        if self.read_scheduler is not None and len(photo_files) > 1:
+            order = self.read_scheduler.order(photo_files, stats)
+        ordered = [photo_files[i] for i in order]
+        self._prefetch_video_metadata(ordered)
+
+        def read(position):
+            if self._cancel.is_set():
+                # 중단 요청 이후의 파일은 읽지 않음 (묶음은 버려짐)
+                return None, None
+            if self.read_scheduler is not None:
+                # 곧 읽을 파일의 헤더를 미리 읽어두도록 요청
+                self.read_scheduler.prefetch(ordered, position)
+            # 적응형 동시성의 지연은 파일 읽기 호출만 잼
+            start = time.perf_counter()
+            tags = self._read_exif_raw(ordered[position])
+            return tags, time.perf_counter() - start
+
+        # 읽은 순서 → 입력 순서
+        tags = [None] * len(photo_files)
+        for i, result in zip(order, run(read, len(ordered))):
+            tags[i] = result
+        return tags
+
+    @contextmanager
+    def _header_reader(self, workers, backend):
+        """
+        실행 동안 한 번만 만드는 워커 풀로 헤더 읽기 단계를 준비
+
+        Yields:
+            함수: (파일 목록, stat 목록) → (결과, 디코딩 여부).
+                프로세스 풀은 워커에서 디코딩까지 마친 (컬럼 dict, 실패 set)을,
+                나머지는 파일별 _read_exif_raw 결과 목록을 돌려줌
+        """
+        if backend == "process" and workers > 1:
+            # CPU 위주 파싱은 GIL 영향을 받지 않도록 프로세스 풀 사용
+            logger.info(f"프로세스 {workers}개로 EXIF 추출을 시작합니다.")
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_process_worker,
+                initargs=(str(self.photo_folder), self.fast_exif),
+            ) as executor:
+                yield lambda photo_files, stats: (
+                    self._read_with_process_pool(executor, workers, photo_files),
+                    True,
+                )
+            return
+
+        if workers == ADAPTIVE_WORKERS:
+            # 저장소에 맞게 동시 처리 수를 실행 중에 조절 (묶음이 바뀌어도 이어서 학습)
+            controller = AimdController()
+            logger.info(
+                f"적응형 동시성으로 EXIF 추출을 시작합니다. "
+                f"(시작 {controller.level}, 최대 {controller.max_level})"
+            )
+            with AdaptiveExecutor(controller) as executor:
+
+                def run(read, count):
+                    # 기다리지 않고 Future만 넘김 → 디코딩 단계가 결과를 기다리는 동안
+                    # 읽기 단계는 다음 묶음을 제출하므로 묶음 사이에 읽기가 멈추지 않음
+                    return [executor.submit(read, i) for i in range(count)]
+
+                yield lambda photo_files, stats: (
+                    self._read_headers(photo_files, stats, run),
+                    False,
+                )
+            logger.info(controller.summary())
+            return
+
+        if workers > 1:
+            # 헤더 읽기는 I/O 위주이므로 스레드 풀로 병렬 처리
+            # executor.map은 입력 순서대로 결과를 돌려주므로 행 순서가 순차 처리와 같음
+            logger.info(f"스레드 {workers}개로 EXIF 추출을 시작합니다.")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+
+                def run(read, count):
+                    return [tags for tags, _ in executor.map(read, range(count))]
+
+                yield lambda photo_files, stats: (
+                    self._read_headers(photo_files, stats, run),
+                    False,
+                )
+            return
+
+        def run(read, count):
+            return [read(position)[0] for position in range(count)]
+
+        yield lambda photo_files, stats: (
+            self._read_headers(photo_files, stats, run),
+            False,
+        )
+
+    @staticmethod
+    def _stat_files(photo_files):
+        """
+        파일별 os.stat 결과 (stat에 실패한 파일은 빠짐)
+
+        Returns:
+            dict: 행 번호 → os.stat 결과
+        """
+        stats = {}
+        for i, file_path in enumerate(photo_files):
+            try:
+                stats[i] = os.stat(file_path)
+            except OSError:
+                continue
+        return stats
+
+    def _lookup_cache(self, entries, photo_files, stats):
+        """
+        캐시에서 바뀌지 않은 파일의 결과 찾기
+
+        Args:
+            entries (dict): ExifCache.load_folder 결과
+
+        Returns:
+            dict: 행 번호 → 캐시 결과 dict
+        """
+        cached = {}
+        for i, file_path in enumerate(photo_files):
+            if i not in stats:
+                self.cache.misses += 1
+                continue
+            result = self.cache.lookup(entries, file_path, stats[i])
+            if result is not None:
+                cached[i] = result
+        return cached
+
+    def _read_batch(self, photo_files, entries, read_headers):
+        """
+        헤더 읽기 단계: 묶음의 파일을 stat하고 캐시에 없는 파일만 헤더 읽기
+
+        Returns:
+            dict: 다음 단계(_decode_batch)로 넘길 묶음
+        """
+        stats = self._stat_files(photo_files)
+        cached = {}
+        if self.cache is not None:
+            cached = self._lookup_cache(entries, photo_files, stats)
+
+        pending = [i for i in range(len(photo_files)) if i not in cached]
+        results, decoded = read_headers(
+            [photo_files[i] for i in pending], [stats.get(i) for i in pending]
+        )
+        return {
+            "files": photo_files,
+            "stats": stats,
+            "cached": cached,
+            "pending": pending,
+            "results": results,
+            "decoded": decoded,
+        }
+
+    def _decode_batch(self, batch):
+        """
+        태그 디코딩 단계: 읽은 태그를 디코딩하고 캐시 결과와 합쳐 열 묶음으로 만듦
+
+        Returns:
+            dict: {"columns": DataFrame용 컬럼 dict (묶음의 파일 순서),
+                   "to_cache": 캐시에 저장할 (경로, stat, 결과) 목록,
+                   "state": {경로: 파일 상태},
+                   "cached"/"failed": 캐시에서 가져온 / 추출에 실패한 파일 수,
+                   "failed_paths": 추출에 실패한 파일 경로 목록}
+        """
+        photo_files = batch["files"]
+        stats = batch["stats"]
+        pending = batch["pending"]
+
+        if batch["decoded"]:
+            extracted, failed = batch["results"]
+        else:
+            results = batch["results"]
+            if results and isinstance(results[0], Future):
+                # 적응형 동시성은 읽기가 끝나기 전에 Future로 넘어옴
+                results = [future.result() for future in results]
+            extracted = {key: [] for key in CACHED_FIELDS}
+            failed = set()
+            for j, (i, tags) in enumerate(zip(pending, results)):
+                row, ok = self._decode_exif_tags(photo_files[i], tags)
+                for key in CACHED_FIELDS:
+                    extracted[key].append(row[key])
+                if not ok:
+                    failed.add(j)
+
+        columns = {
+            "FileName": [p.name for p in photo_files],
+            "FilePath": [str(p) for p in photo_files],
+        }
+        for key in CACHED_FIELDS:
+            column = [None] * len(photo_files)
+            for i, result in batch["cached"].items():
+                column[i] = result[key]
+            for i, value in zip(pending, extracted[key]):
+                column[i] = value
+            columns[key] = column
+
+        to_cache = [
+            (
+                photo_files[i],
+                stats[i],
+                {key: extracted[key][j] for key in CACHED_FIELDS},
+            )
+            for j, i in enumerate(pending)
+            if j not in failed and i in stats
+        ]
+        state = {
+            str(file_path): file_signature(stats[i]) if i in stats else None
+            for i, file_path in enumerate(photo_files)
+        }
+        return {
+            "columns": columns,
+            "to_cache": to_cache,
+            "state": state,
+            "cached": len(batch["cached"]),
+            "failed": len(failed),
+            "failed_paths": [str(photo_files[pending[j]]) for j in sorted(failed)],
+        }
 
-    def process_all_photos(self):
+    def _extract_columns(
+        self, photo_files, workers, backend, on_batch=None, seed=None, stage="extract"
+    ):
+        """
+        파일 검색 → 헤더 읽기 → 태그 디코딩 → 표 만들기 단계를 크기가 정해진 큐로 이어서 실행
+
+        STREAM_BATCH_SIZE개씩 묶어서 흘려보내므로 파일별 중간 결과(태그, 행 dict)는
+        큐에 들어 있는 묶음만큼만 메모리에 있고, 표는 묶음 단위로 컬럼에 이어 붙인다.
+        앞 묶음을 디코딩하는 동안 다음 묶음의 헤더를 읽고 폴더 검색도 계속된다.
+        진행 상황은 extract 단계와 파이프라인 단계(walk/read/decode)의 시작/끝,
+        묶음 완료, 처리량, 찾은 파일 수 이벤트로 알린다.
+
+        Args:
+            photo_files (list): 처리할 파일 (None이면 폴더를 검색하면서 찾는 대로 처리)
+            on_batch: 묶음을 이어 붙일 때마다 on_batch(지금까지의 컬럼 dict, 묶음)를 부르는 함수
+            seed (tuple): 이미 끝난 (컬럼 dict, {경로: 파일 상태}). 결과에 먼저 넣고
+                이 경로들은 다시 처리하지 않음 (저널에서 이어서 처리할 때)
+            stage (str): 단계 이벤트에 쓸 이름
+
+        Returns:
+            tuple: (DataFrame 생성용 컬럼 dict, {경로: 파일 상태}, 추출에 실패한 경로 목록)
+                photo_files를 주면 그 순서, 아니면 찾은 순서
+        """
+        source = self._count_found(
+            self.iter_photos() if photo_files is None else photo_files, stage
+        )
+        entries = None
+        if self.cache is not None:
+            entries = self.cache.load_folder(self.photo_folder)
+
+        columns = {key: [] for key in ("FileName", "FilePath", *CACHED_FIELDS)}
+        state = {}
+        if seed is not None:
+            for key, values in seed[0].items():
+                columns[key].extend(values)
+            state.update(seed[1])
+            source = (path for path in source if str(path) not in seed[1])
+        seeded = len(state)
+        failed_paths = []
+        start = time.perf_counter()
+        self.events.emit(STAGE_START, stage=stage)
+        meter = ThroughputMeter(self.events, stage=stage)
+
+        def on_stage(name, finished):
+            if not finished:
+                self.events.emit(STAGE_START, stage=name)
+                return
+            self.events.emit(
+                STAGE_END,
+                stage=name,
+                seconds=pipeline.busy[name],
+                batches=pipeline.counts[name],
+            )
+
+        with self._header_reader(workers, backend) as read_headers:
+            pipeline = StreamPipeline(
+                ("walk", batched(source, STREAM_BATCH_SIZE)),
+                [
+                    (
+                        "read",
+                        lambda files: self._read_batch(files, entries, read_headers),
+                    ),
+                    ("decode", self._decode_batch),
+                ],
+                queue_size=STREAM_QUEUE_SIZE,
+                on_stage=on_stage,
+            )
+            # 표 만들기 단계 (호출한 스레드): 캐시 저장 후 열 묶음을 이어 붙임
+            for batch in pipeline:
+                if self._cancel.is_set():
+                    raise ProcessingCancelled("사용자가 처리를 중단했습니다.")
+                if self.cache is not None:
+                    self.cache.put_many(batch["to_cache"])
+                for key, values in batch["columns"].items():
+                    columns[key].extend(values)
+                state.update(batch["state"])
+                failed_paths.extend(batch["failed_paths"])
+                logger.debug(f"처리 중 ({len(state)}개 완료)")
+                self.events.emit(
+                    BATCH_DONE,
+                    stage=stage,
+                    done=len(state),
+                    size=len(batch["state"]),
+                    cached=batch["cached"],
+                    failed=batch["failed"],
+                )
+                meter.update(len(state) - seeded)
+                if on_batch is not None:
+                    on_batch(columns, batch)
+
+        meter.update(len(state) - seeded, force=True)
+        self.events.emit(
+            STAGE_END,
+            stage=stage,
+            seconds=time.perf_counter() - start,
+            files=len(state),
+            failed=len(failed_paths),
+        )
+        logger.info(pipeline.report())
+        return columns, state, failed_paths
+
+    def _count_found(self, paths, stage):
+        """
+        검색 단계에서 찾은 파일 수를 FILES_FOUND 이벤트로 알리면서 그대로 넘김
+
+        전체 파일 수를 따로 세는 검색 없이 진행률을 표시할 수 있도록
+        STREAM_BATCH_SIZE개마다, 그리고 검색이 끝나면 finished=True로 보낸다.
+        """
+        found = 0
+        for path in paths:
+            found += 1
+            if found % STREAM_BATCH_SIZE == 0:
+                self.events.emit(FILES_FOUND, stage=stage, found=found, finished=False)
+            yield path
+        self.events.emit(FILES_FOUND, stage=stage, found=found, finished=True)
+
+    @staticmethod
+    def _path_sort_key(path):
+        """Path 객체 정렬과 같은 순서가 되는 경로 문자열 키 (행마다 Path를 만들지 않음)"""
+        return os.path.normcase(path).split(os.sep)
+
+    @staticmethod
+    def _normalize_workers(workers):
+        """워커 수 정리 ("auto"는 그대로, 나머지는 1 이상의 정수)"""
+        if workers == ADAPTIVE_WORKERS:
+            return ADAPTIVE_WORKERS
+        return max(1, int(workers or 1))
+
+    def _resolve_run_options(self, workers, backend):
+        """이번 실행의 워커 수/백엔드 결정 (None이면 처리기 기본값)"""
+        workers = self.workers if workers is None else self._normalize_workers(workers)
+        backend = backend or self.backend
+        if backend not in EXTRACTION_BACKENDS:
+            raise ValueError(f"지원하지 않는 추출 백엔드입니다: {backend}")
+        if workers == ADAPTIVE_WORKERS and backend == "process":
+            # 프로세스 풀은 CPU 위주이므로 CPU 수에 맞춤
+            workers = os.cpu_count() or 1
+        return workers, backend
+
+    def process_all_photos(
+        self, workers=None, backend=None, on_partial=None, resume=False
+    ):
         """
         모든 사진의 EXIF 데이터를 추출하여 DataFrame 생성
+
+        폴더 검색과 추출을 스트리밍 파이프라인으로 겹쳐서 실행하고,
+        결과는 scan_photos()와 같은 경로 순으로 정렬한다.
+        캐시가 설정되어 있으면 크기/mtime/inode가 그대로인 파일은 캐시된 결과를 쓰고
+        나머지만 추출한 뒤 캐시에 저장한다. 추출에 실패한 파일은 마지막에 한 번 더 시도한다.
+        저널이 설정되어 있으면 끝낸 묶음을 주기적으로 기록하고, 다 끝나면 기록을 비운다.
+
+        Args:
+            workers (int | str): 이번 실행에서 사용할 워커 수 또는 "auto" (None이면 self.workers)
+            backend (str): 이번 실행의 병렬 백엔드 (None이면 self.backend)
+            on_partial: 부분 결과를 받을 함수 on_partial(new_df). 지정하면 추출 중에도
+                self.df에 지금까지의 결과를 경로 순으로 채우고 새 행 근처의 날짜 덩어리만
+                다시 계산한 뒤, 새로 들어온 행(datetime/chunk_id 포함)을 넘겨준다.
+                이 메서드를 호출한 스레드에서 불린다.
+                (진행률/오류는 subscribe()로 받는 이벤트 사용)
+            resume (bool): 저널에 이 폴더의 끝나지 않은 기록이 있으면 기록된 결과 중
+                파일이 그대로인 것은 다시 읽지 않고 나머지만 처리 (실패로 기록된 파일은 다시 시도)
+
+        Raises:
+            ProcessingCancelled: 처리 중 cancel()이 호출됨 (저널이 있으면 그때까지의 결과를
+                저장하므로 resume=True로 이어서 처리할 수 있음)
         """
-        photo_files = self.scan_photos()
-        exif_data = []
+        workers, backend = self._resolve_run_options(workers, backend)
+        self._cancel.clear()
+
+        if self.cache is not None:
+            self.cache.reset_stats()
+
+        seed = None
+        if self.journal is not None:
+            seed = self._resume_rows(self.journal.start(self.photo_folder, resume))
+
+        published = 0
+        if on_partial is not None:
+            with self.lock:
+                self.df = pd.DataFrame()
+
+        def on_batch(columns, batch):
+            nonlocal published
+            if self.journal is not None:
+                self.journal.record(self._journal_rows(batch))
+            if on_partial is None:
+                return
+            done = len(columns["FilePath"])
+            if done - published >= max(
+                STREAM_BATCH_SIZE, published * PARTIAL_RESULT_GROWTH
+            ):
+                self._publish_partial(columns, published, on_partial)
+                published = done
 
-        for i, file_path in enumerate(photo_files, 1):
-            logger.info(f"처리 중 ({i}/{len(photo_files)}): {file_path.name}")
-            exif_data.append(self.extract_exif_data(file_path))
+        try:
+            columns, state, failed_paths = self._extract_columns(
+                None, workers, backend, on_batch, seed=seed
+            )
+            logger.info(f"총 {len(state)}개의 파일을 발견했습니다.")
 
-        self.df = pd.DataFrame(exif_data)
+            if on_partial is not None and len(columns["FilePath"]) > published:
+                self._publish_partial(columns, published, on_partial)
+            if failed_paths:
+                failed_paths = self._retry_failed(
+                    failed_paths, workers, backend, columns, on_partial
+                )
+        except ProcessingCancelled:
+            if self.journal is not None:
+                self.journal.pause()
+                logger.info("지금까지의 결과를 저널에 저장했습니다. (resume으로 이어서 처리)")
+            raise
+        except Exception:
+            if self.journal is not None:
+                self.journal.checkpoint()
+            raise
+
+        if self.journal is not None:
+            self.journal.finish()
+        if failed_paths:
+            logger.warning(
+                f"EXIF 추출 실패 {len(failed_paths)}개 "
+                f"(파일별 내용은 DEBUG 로그 또는 file_error 이벤트)"
+            )
+
+        if on_partial is not None:
+            with self.lock:
+                # 묶음별로 만든 컬럼을 한 번에 만든 것과 같은 dtype으로 맞춤
+                self.df = self.df.infer_objects()
+                paths = self.df["FilePath"].tolist() if not self.df.empty else []
+            self._file_state = {path: state[path] for path in paths}
+        else:
+            # 찾은 순서 → scan_photos 순서(Path 정렬)
+            paths = columns["FilePath"]
+            keys = [self._path_sort_key(path) for path in paths]
+            order = sorted(range(len(paths)), key=keys.__getitem__)
+            df = self._build_frame(columns)
+            self.df = df.iloc[order].reset_index(drop=True)
+
+            # rescan()에서 바뀐 파일을 찾기 위한 파일 상태
+            self._file_state = {paths[i]: state[paths[i]] for i in order}
+
+        if self.cache is not None:
+            logger.info(self.cache.report())
         logger.info(f"총 {len(self.df)}개 파일의 EXIF 데이터를 추출했습니다.")
 
         return self.df
 
-    def detect_date_chunks(self):
+    def _resume_rows(self, entries):
         """
-        연속된 날짜 덩어리(chunk) 자동 탐지
+        저널의 성공 기록 중 파일이 그대로(크기/mtime/inode)인 것만 골라 시작 결과로 만듦
+
+        Args:
+            entries (dict): ScanJournal.start 결과
+
+        Returns:
+            tuple: _extract_columns의 seed (컬럼 dict, {경로: 파일 상태}) (기록이 없으면 None)
         """
-        if self.df.empty:
-            raise ValueError("먼저 process_all_photos()를 실행해주세요.")
+        if not entries:
+            return None
 
-        # 날짜가 있는 데이터만 필터링
-        date_df = self.df[self.df["DateTimeOriginal"].notna()].copy()
+        columns = {key: [] for key in ("FileName", "FilePath", *CACHED_FIELDS)}
+        state = {}
+        for path, (signature, result) in entries.items():
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                # 그 사이에 지워진 파일
+                continue
+            if signature != file_signature(stat_result):
+                continue
+            columns["FileName"].append(os.path.basename(path))
+            columns["FilePath"].append(path)
+            for key in CACHED_FIELDS:
+                columns[key].append(result.get(key))
+            state[path] = signature
+
+        logger.info(f"저널에서 {len(state)}개 파일의 결과를 가져왔습니다.")
+        return columns, state
+
+    @staticmethod
+    def _journal_rows(batch):
+        """_decode_batch 묶음 → ScanJournal.record에 넘길 (경로, 상태, 결과, 실패 여부) 목록"""
+        failed = set(batch["failed_paths"])
+        columns = batch["columns"]
+        return [
+            (
+                path,
+                batch["state"][path],
+                {key: columns[key][i] for key in CACHED_FIELDS},
+                path in failed,
+            )
+            for i, path in enumerate(columns["FilePath"])
+        ]
 
-        if date_df.empty:
-            logger.warning("날짜 정보가 있는 사진이 없습니다.")
-            return self.df
+    def _retry_failed(self, failed_paths, workers, backend, columns, on_partial):
+        """
+        추출에 실패한 파일을 마지막에 한 번 더 추출 (NAS 일시 오류 등)
 
-        # 날짜 파싱 및 정렬 (일반적인 EXIF 날짜 형식들 시도)
-        def parse_exif_date(date_str):
-            """EXIF 날짜 형식을 파싱"""
-            if pd.isna(date_str):
-                return pd.NaT
+        다시 읽은 값은 columns에 반영하고, 부분 결과를 이미 알렸다면 self.df의 행과
+        그 근처의 날짜 덩어리도 고친 뒤 고친 행을 on_partial로 다시 알린다.
 
-            # 일반적인 EXIF 날짜 형식들
-            formats = [
-                "%Y:%m:%d %H:%M:%S",  # 표준 EXIF 형식
-                "%Y-%m-%d %H:%M:%S",  # ISO 형식
-                "%Y:%m:%d",  # 날짜만
-                "%Y-%m-%d",  # ISO 날짜만
-            ]
-
-            for fmt in formats:
-                try:
-                    return pd.to_datetime(date_str, format=fmt)
-                except:
-                    continue
-
-            # 모든 형식 실패 시 일반 파싱 시도
+        Returns:
+            list: 다시 시도해도 실패한 파일 경로
+        """
+        logger.info(f"추출에 실패한 {len(failed_paths)}개 파일을 다시 시도합니다.")
+
+        def on_batch(_, batch):
+            if self.journal is not None:
+                self.journal.record(self._journal_rows(batch))
+
+        retry_columns, _, still_failed = self._extract_columns(
+            [Path(path) for path in failed_paths],
+            workers,
+            backend,
+            on_batch,
+            stage="retry",
+        )
+        still = set(still_failed)
+        recovered = {
+            path: j
+            for j, path in enumerate(retry_columns["FilePath"])
+            if path not in still
+        }
+        if not recovered:
+            return still_failed
+
+        for i, path in enumerate(columns["FilePath"]):
+            j = recovered.get(path)
+            if j is not None:
+                for key in CACHED_FIELDS:
+                    columns[key][i] = retry_columns[key][j]
+
+        if on_partial is not None:
+            retried = self._build_frame(retry_columns)
+            retried.index = retried["FilePath"].astype(object)
+            retried = retried.loc[list(recovered)]
+            retried = retried.drop(columns=["FileName", "FilePath"])
+            with self.lock:
+                mask = self.df["FilePath"].isin(retried.index)
+                paths = self.df.loc[mask, "FilePath"].astype(object)
+                for key in retried.columns:
+                    self.df.loc[mask, key] = paths.map(retried[key]).to_numpy()
+                self._update_date_chunks(self.df.loc[mask, "datetime"].dropna())
+                partial = self.df[mask].copy()
+            on_partial(partial)
+
+        logger.info(f"다시 시도해서 {len(recovered)}개 파일을 읽었습니다.")
+        return still_failed
+
+    def _publish_partial(self, columns, start, on_partial):
+        """
+        columns[start:]의 새 행을 self.df에 경로 순으로 끼워 넣고,
+        새 날짜에서 1일 이내에 걸친 덩어리만 다시 계산한 뒤 on_partial로 알림
+        """
+        new_df = self._build_frame(columns, start)
+
+        with self.lock:
+            if self.df.empty:
+                new_df["chunk"] = math.nan
+                new_df["chunk_id"] = pd.Series(index=new_df.index, dtype="category")
+                df = new_df
+            else:
+                df = pd.concat([self.df, new_df], ignore_index=True)
+
+            keys = [self._path_sort_key(path) for path in df["FilePath"]]
+            order = sorted(range(len(df)), key=keys.__getitem__)
+            self.df = df.iloc[order].reset_index(drop=True)
+            self._update_date_chunks(new_df["datetime"].dropna())
+
+            partial = self.df[self.df["FilePath"].isin(set(new_df["FilePath"]))].copy()
+
+        on_partial(partial)
+
+    def _scan_paths(self, paths):
+        """
+        지정한 경로들(파일 또는 폴더)만 다시 검색 (폴더는 하위까지)
+
+        Returns:
+            list: 지원되는 파일 확장자의 파일 경로 리스트 (scan_photos와 같은 순서)
+        """
+        photo_files = set()
+        for path in map(Path, paths):
+            if self._is_ignored(path):
+                continue
+            if path.is_dir():
+                photo_files.update(self.iter_photos(path))
+            elif path.is_file() and path.suffix.lower() in self.supported_extensions:
+                photo_files.add(path)
+        return sorted(photo_files)
+
+    def _is_ignored(self, path):
+        """사진 폴더 밖이거나 제외 규칙에 걸리는 경로인지 확인"""
+        try:
+            rel_path = path.relative_to(self.photo_folder).as_posix()
+        except ValueError:
+            return True
+        if rel_path == ".":
+            return False
+        return self.ignore_rules.match_path(rel_path, path.is_dir())
+
+    def _state_under(self, paths):
+        """지정한 경로들(파일 또는 폴더 하위)에 속하는 이전 파일 상태"""
+        exact = {str(Path(p)) for p in paths}
+        prefixes = tuple(p + os.sep for p in exact)
+        return {
+            path: signature
+            for path, signature in self._file_state.items()
+            if path in exact or path.startswith(prefixes)
+        }
+
+    @staticmethod
+    def _insert_positions(sorted_paths, new_paths):
+        """새 경로들이 scan_photos 순서(Path 정렬)의 목록에서 들어갈 위치 (이진 탐색)"""
+        positions = []
+        for path in new_paths:
+            key = Path(path)
+            lo, hi = 0, len(sorted_paths)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if Path(sorted_paths[mid]) < key:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            positions.append(lo)
+        return positions
+
+    def rescan(self, workers=None, backend=None, paths=None):
+        """
+        폴더를 다시 스캔하여 추가/삭제/수정된 파일만 self.df에 반영
+
+        바뀌지 않은 행(수동 보정 값 포함)은 그대로 두고, detect_date_chunks()를
+        실행한 상태라면 바뀐 날짜 근처의 덩어리만 다시 계산한다.
+        아직 process_all_photos()를 실행하지 않았다면 전체 처리를 한다.
+
+        Args:
+            workers (int | str): 이번 실행에서 사용할 워커 수 또는 "auto" (None이면 self.workers)
+            backend (str): 이번 실행의 병렬 백엔드 (None이면 self.backend)
+            paths (list): 바뀐 것으로 알려진 파일/폴더 경로 (None이면 폴더 전체를 비교)
+
+        Returns:
+            dict: {"added", "removed", "modified": 파일 경로 문자열 목록,
+                   "chunks": 다시 계산된(없어진 것 포함) chunk_id 목록}
+        """
+        if self.df.empty or not self._file_state:
+            self.process_all_photos(workers, backend)
+            chunks = []
+            if "chunk_id" in self.df.columns:
+                chunks = sorted(self.df["chunk_id"].dropna().unique())
+            return {
+                "added": list(self._file_state),
+                "removed": [],
+                "modified": [],
+                "chunks": chunks,
+            }
+
+        workers, backend = self._resolve_run_options(workers, backend)
+        self._cancel.clear()
+        if paths is None:
+            photo_files = self.scan_photos()
+            previous = self._file_state
+        else:
+            photo_files = self._scan_paths(paths)
+            previous = self._state_under(paths)
+
+        stats = self._stat_files(photo_files)
+        state = {
+            str(file_path): file_signature(stats[i]) if i in stats else None
+            for i, file_path in enumerate(photo_files)
+        }
+
+        added = [path for path in state if path not in previous]
+        removed = [path for path in previous if path not in state]
+        modified = [
+            path
+            for path, signature in state.items()
+            if path in previous and (signature is None or signature != previous[path])
+        ]
+        changes = {"added": added, "removed": removed, "modified": modified, "chunks": []}
+
+        if paths is None:
+            self._file_state = state
+        else:
+            for path in removed:
+                del self._file_state[path]
+            self._file_state.update(state)
+
+        if not (added or removed or modified):
+            logger.info("바뀐 파일이 없습니다.")
+            return changes
+
+        logger.info(
+            f"변경 감지: 추가 {len(added)}개, 삭제 {len(removed)}개, 수정 {len(modified)}개"
+        )
+
+        # 바뀐 파일만 다시 추출
+        if self.cache is not None:
+            self.cache.reset_stats()
+        changed_paths = set(added) | set(modified)
+        changed_indices = [
+            i for i, file_path in enumerate(photo_files) if str(file_path) in changed_paths
+        ]
+        changed_files = [photo_files[i] for i in changed_indices]
+        new_df = self._build_frame(
+            self._extract_columns(changed_files, workers, backend)[0]
+        )
+        if self.cache is not None:
+            logger.info(self.cache.report())
+
+        # 삭제/수정된 행을 빼고 새 행을 scan_photos 순서의 제자리에 끼워 넣음
+        stale_mask = self.df["FilePath"].isin(set(removed) | set(modified))
+        has_chunks = "chunk_id" in self.df.columns
+        if has_chunks:
+            changed_dates = pd.concat(
+                [self.df.loc[stale_mask, "datetime"], new_df["datetime"]]
+            ).dropna()
+            # 행이 모두 빠져서 사라지는 덩어리도 바뀐 덩어리로 알림
+            stale_chunks = set(self.df.loc[stale_mask, "chunk_id"].dropna())
+
+        kept = self.df[~stale_mask]
+        inserts = self._insert_positions(
+            kept["FilePath"].tolist(), new_df["FilePath"].tolist()
+        )
+        position = list(range(len(kept)))
+        position += [
+            pos - 1 + (rank + 1) / (len(new_df) + 1) for rank, pos in enumerate(inserts)
+        ]
+        df = pd.concat([kept, new_df], ignore_index=True)
+        df = df.iloc[pd.Series(position).argsort(kind="stable")]
+        self.df = df.reset_index(drop=True)
+
+        if has_chunks:
+            changes["chunks"] = sorted(
+                self._update_date_chunks(changed_dates) | stale_chunks
+            )
+
+        return changes
+
+    # 같은 동작의 별칭
+    update = rescan
+
+    @staticmethod
+    def _parse_exif_dates(date_series):
+        """
+        DateTimeOriginal 문자열 컬럼을 datetime으로 파싱 (일반적인 EXIF 날짜 형식들 시도)
+
+        EXIF_DATE_FORMATS의 형식마다 아직 파싱되지 않은 행만 모아 한 번에 변환하고,
+        어느 형식에도 맞지 않는 값만 서로 다른 값별로 일반 파싱을 시도한다.
+        (값마다 형식을 하나씩 시도하던 방식과 결과 값/dtype이 같음)
+
+        Returns:
+            pd.Series: datetime (파싱 실패/없는 값은 NaT)
+        """
+
+        def parse_other(value):
+            """형식에 맞지 않는 값의 일반 파싱"""
+            if pd.isna(value):
+                return pd.NaT
             try:
-                return pd.to_datetime(date_str, errors="coerce")
-            except:
+                return pd.to_datetime(value, errors="coerce")
+            except Exception:
                 return pd.NaT
 
-        date_df["datetime"] = date_df["DateTimeOriginal"].apply(parse_exif_date)
+        # 행 위치로 다루고 마지막에 원래 인덱스를 붙임
+        values = date_series.reset_index(drop=True)
+        is_text = values.map(lambda value: isinstance(value, str)).astype(bool)
+        pending = values[is_text]
+        # 값 하나씩 형식을 맞출 때는 끝의 NUL 채움("...:00\x00")이 무시되므로 똑같이 떼고 시도
+        # (형식에 맞지 않는 값의 일반 파싱은 원래 값으로)
+        trimmed = pending.str.rstrip("\x00")
+        parsed = []
+        for fmt in EXIF_DATE_FORMATS:
+            if pending.empty:
+                break
+            dates = pd.to_datetime(trimmed, format=fmt, errors="coerce")
+            matched = dates.notna()
+            parsed.append(dates[matched])
+            pending = pending[~matched]
+            trimmed = trimmed[~matched]
+
+        # 문자열이 아니거나 어느 형식에도 맞지 않는 값 (없는 값은 NaT)
+        # (0000:00:00 00:00:00처럼 같은 값이 반복되므로 서로 다른 값마다 한 번만 파싱)
+        others = pd.concat([pending, values[~is_text]])
+        others = others[others.notna()]
+        others = others.map({value: parse_other(value) for value in others.unique()})
+        dates = pd.concat(parsed) if parsed else pd.Series(dtype=object)
+        if not dates.empty:
+            if others.empty or others.isna().all():
+                return dates.reindex(values.index).set_axis(date_series.index)
+            if others.dtype == dates.dtype:
+                dates = pd.concat([dates, others])
+                return dates.reindex(values.index).set_axis(date_series.index)
+
+        # 시간대가 있는 값 등이 섞이면 값마다 파싱할 때와 같은 dtype이 되도록 한 번에 추론
+        result = pd.Series(pd.NaT, index=values.index, dtype=object)
+        for part in [*parsed, others]:
+            result[part.index] = part.astype(object)
+        return result.apply(lambda value: value).set_axis(date_series.index)
+
+    @classmethod
+    def _capture_times(cls, date_series, subsec=None, offsets=None):
+        """
+        촬영 시각 문자열을 datetime64[ns] 컬럼과 UTC 오프셋(분) 컬럼으로 한 번에 변환
 
-        # NaT 값 제거 (파싱 실패한 날짜들)
-        date_df = date_df[date_df["datetime"].notna()].copy()
+        datetime은 사진에 적힌 현지 시각이며 SubSecTimeOriginal의 초 이하 자릿수를 더한다.
+        오프셋은 OffsetTimeOriginal(예: +09:00)이나 날짜 문자열 자체의 시간대에서 가져오며,
+        UTC 시각은 datetime - utc_offset분이다. pandas 범위(1677~2262년) 밖의 날짜는
+        파싱 실패와 같이 NaT로 둔다.
 
-        if date_df.empty:
-            logger.warning("유효한 날짜 정보가 있는 사진이 없습니다.")
-            return self.df
+        Args:
+            date_series (pd.Series): DateTimeOriginal 문자열
+            subsec (pd.Series): SubSecTimeOriginal 문자열 (같은 인덱스, 없으면 None)
+            offsets (pd.Series): OffsetTimeOriginal 문자열 (같은 인덱스, 없으면 None)
+
+        Returns:
+            tuple: (datetime64[ns] Series, Int16 utc_offset Series)
+        """
+        index = date_series.index
+        parsed = cls._parse_exif_dates(date_series.astype(object))
+        utc_offset = pd.Series(math.nan, index=index)
+
+        if not pd.api.types.is_datetime64_dtype(parsed.dtype):
+            # 시간대가 있는 값(+09:00 등)이 섞인 경우: 현지 시각만 남기고 오프셋은 따로 보관
+            def local_time(value):
+                if pd.isna(value) or not isinstance(value, datetime):
+                    return pd.NaT
+                return value.replace(tzinfo=None)
+
+            def offset_minutes(value):
+                if pd.isna(value) or not isinstance(value, datetime):
+                    return math.nan
+                if value.utcoffset() is None:
+                    return math.nan
+                return value.utcoffset().total_seconds() / 60
+
+            utc_offset = parsed.map(offset_minutes).astype(float)
+            parsed = pd.to_datetime(parsed.map(local_time))
+
+        lo, hi = pd.Timestamp.min, pd.Timestamp.max
+        times = parsed.where((parsed >= lo) & (parsed <= hi)).astype("datetime64[ns]")
+
+        def subsec_nanos(value):
+            """SubSecTimeOriginal(초 이하 자릿수, 예: '25' → 0.25초) → 나노초"""
+            text = str(value).strip()
+            if not (text.isascii() and text.isdigit()):
+                return 0
+            return int(text[:9].ljust(9, "0"))
+
+        def offset_minutes(value):
+            """OffsetTimeOriginal(예: '+09:00') → 분"""
+            match = EXIF_OFFSET_PATTERN.match(str(value))
+            if not match:
+                return math.nan
+            sign, hours, minutes = match.groups()
+            return (1 if sign == "+" else -1) * (int(hours) * 60 + int(minutes))
+
+        # 두 필드 모두 값의 종류가 적으므로 서로 다른 값마다 한 번만 변환
+        if subsec is not None:
+            values = subsec.dropna()
+            nanos = values.map({text: subsec_nanos(text) for text in values.unique()})
+            nanos = nanos.reindex(index, fill_value=0).astype("int64")
+            # 날짜 문자열에 이미 초 이하 값이 있으면 그대로 둠
+            nanos = nanos.where(times == times.dt.floor("s"), 0)
+            times = times + pd.to_timedelta(nanos, unit="ns")
+
+        if offsets is not None:
+            values = offsets[offsets.notna() & utc_offset.isna()]
+            minutes = {text: offset_minutes(text) for text in values.unique()}
+            utc_offset = utc_offset.fillna(values.map(minutes).astype(float))
+
+        utc_offset = utc_offset.where(times.notna())
+        return times, utc_offset.round().astype("Int16")
+
+    @staticmethod
+    def _coordinates(values):
+        """
+        위도/경도 값 목록을 CoordinateArray(int32 마이크로도)로 변환 (없거나 읽을 수 없는 값은 NaN)
+
+        exiftool의 도/분/초 문자열(예: 37 deg 33' 59.40" S)도 십진수 좌표로 바꾼다.
+        """
+        values = pd.Series(values, dtype=object)
+        numbers = pd.to_numeric(values, errors="coerce").astype(float)
+
+        def parse_dms(text):
+            match = DMS_COORDINATE_PATTERN.match(text)
+            if not match:
+                return math.nan
+            degrees, minutes, seconds, ref = match.groups()
+            try:
+                value = float(degrees) + float(minutes) / 60 + float(seconds) / 3600
+            except ValueError:
+                return math.nan
+            return -value if ref in ("S", "W") else value
+
+        texts = values[numbers.isna()]
+        texts = texts[texts.map(lambda value: isinstance(value, str)).astype(bool)]
+        if not texts.empty:
+            numbers[texts.index] = texts.map(parse_dms)
+        return CoordinateArray._from_floats(numbers.to_numpy(dtype=float))
+
+    def _build_frame(self, columns, start=0):
+        """
+        추출 컬럼 dict(columns[start:])로 표 만들기
+
+        촬영 시각은 여기서 한 번만 datetime/utc_offset 컬럼으로 변환하고,
+        이후 단계(날짜 덩어리, 내보내기, 보정 창)는 이 컬럼을 그대로 쓴다.
+        행이 수백만 개여도 메모리가 작도록 문자열은 compact_columns의 확장 배열
+        (FilePath는 폴더 사전 + 파일 이름), 좌표는 int32 마이크로도로 담는다.
+        처리 상태(status)도 여기서 한 번 계산해 둔다.
+
+        Returns:
+            pd.DataFrame: FileName, FilePath, DateTimeOriginal, GPSLat, GPSLong,
+                datetime, utc_offset, status
+        """
+        dates = pd.Series(columns["DateTimeOriginal"][start:], dtype=object)
+        details = [
+            pd.Series(columns[key][start:], dtype=object) for key in TIME_DETAIL_FIELDS
+        ]
+        times, utc_offset = self._capture_times(dates, *details)
+        df = pd.DataFrame(
+            {
+                "FileName": CompactStringArray._from_sequence(
+                    columns["FileName"][start:]
+                ),
+                "FilePath": PathArray._from_sequence(columns["FilePath"][start:]),
+                "DateTimeOriginal": CompactStringArray._from_sequence(dates),
+                "GPSLat": self._coordinates(columns["GPSLat"][start:]),
+                "GPSLong": self._coordinates(columns["GPSLong"][start:]),
+                "datetime": times,
+                "utc_offset": utc_offset,
+            }
+        )
+        df["status"] = self._status_of(df)
+        return df
+
+    def refresh_capture_times(self, index=None):
+        """
+        DateTimeOriginal 문자열에서 datetime/utc_offset 다시 계산
+
+        수동 보정 등으로 self.df의 DateTimeOriginal을 직접 고친 뒤 호출한다.
+        (고친 날짜에는 초 이하 자릿수/오프셋 정보가 없으므로 날짜 문자열만 사용)
+        이미 날짜 덩어리를 탐지했다면 시각이 바뀐 행이 닿는 덩어리만 다시 계산한다.
+
+        Args:
+            index: 다시 계산할 행 인덱스 (None이면 전체)
+        """
+        with self.lock:
+            if "datetime" not in self.df.columns:
+                self.df["datetime"], self.df["utc_offset"] = self._capture_times(
+                    self.df["DateTimeOriginal"]
+                )
+                return
+            if index is None:
+                index = self.df.index
+            before = self.df.loc[index, "datetime"]
+            times, utc_offset = self._capture_times(
+                self.df.loc[index, "DateTimeOriginal"]
+            )
+            self.df.loc[index, "datetime"] = times
+            self.df.loc[index, "utc_offset"] = utc_offset
+
+            if "chunk_id" in self.df.columns:
+                moved = (before != times) & (before.notna() | times.notna())
+                if moved.any():
+                    self._update_date_chunks(
+                        pd.concat([before[moved], times[moved]]).dropna()
+                    )
+
+    @staticmethod
+    def _status_of(df):
+        """
+        DateTimeOriginal/GPS 유무로 처리 상태 계산
 
+        Returns:
+            pd.Series: PROCESSING_STATUSES 범주형 (df와 같은 인덱스)
+        """
+        no_date = df["DateTimeOriginal"].isna().to_numpy()
+        no_gps = (df["GPSLat"].isna() | df["GPSLong"].isna()).to_numpy()
+        codes = no_date.astype("int8") + 2 * no_gps.astype("int8")
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=PROCESSING_STATUSES),
+            index=df.index,
+        )
+
+    def refresh_status(self, index=None):
+        """
+        status 컬럼 다시 계산
+
+        수동 보정 등으로 self.df의 DateTimeOriginal/GPSLat/GPSLong을 직접 고친 뒤 호출한다.
+
+        Args:
+            index: 다시 계산할 행 인덱스 (None이면 전체)
+        """
+        with self.lock:
+            if index is None or "status" not in self.df.columns:
+                self.df["status"] = self._status_of(self.df)
+                return
+            rows = self.df.loc[index, ["DateTimeOriginal", "GPSLat", "GPSLong"]]
+            self.df.loc[index, "status"] = self._status_of(rows)
+
+    def _statuses(self):
+        """status 컬럼 (직접 만든 표처럼 없거나 빈 행이 있으면 그 행만 계산해서 채움)"""
+        if "status" not in self.df.columns:
+            self.refresh_status()
+        else:
+            missing = self.df["status"].isna()
+            if missing.any():
+                self.refresh_status(self.df.index[missing])
+        return self.df["status"]
+
+    def status_index(self, *statuses):
+        """
+        status가 statuses 중 하나인 행의 인덱스
+
+        표를 복사하지 않으므로 개수만 필요하면 len()을, 행이 필요하면 self.df.loc[index]를 쓴다.
+
+        Args:
+            *statuses: PROCESSING_STATUSES 중 하나 이상
+
+        Returns:
+            pd.Index: self.df의 행 인덱스 (self.df 순서)
+        """
+        # 추출 중 부분 결과가 self.df를 바꿔 끼울 수 있으므로 잠금 안에서 한 번에 읽음
+        with self.lock:
+            return self.df.index[self._statuses().isin(statuses)]
+
+    @staticmethod
+    def _assign_chunks(date_df):
+        """
+        datetime 컬럼이 있는 행들에 연속된 날짜 덩어리(chunk, chunk_id) 부여
+
+        Returns:
+            pd.DataFrame: datetime 순으로 정렬되고 date/chunk/chunk_id가 추가된 DataFrame
+        """
+        date_df = date_df.copy()
         date_df["date"] = date_df["datetime"].dt.date
         date_df = date_df.sort_values("datetime")
 
@@ -252,12 +1733,66 @@ class PhotoExifProcessor:
                 return "unknown"
 
         date_df["chunk_id"] = date_df.groupby("chunk")["date"].transform(safe_strftime)
+        return date_df
+
+    def detect_date_chunks(self):
+        """
+        연속된 날짜 덩어리(chunk) 자동 탐지
+        """
+        if self.df.empty:
+            raise ValueError("먼저 process_all_photos()를 실행해주세요.")
 
-        # 원본 DataFrame에 병합
-        self.df = self.df.merge(
-            date_df[["FilePath", "chunk", "chunk_id", "datetime"]],
-            on="FilePath",
-            how="left",
+        start = time.perf_counter()
+        self.events.emit(STAGE_START, stage="chunks")
+        try:
+            return self._detect_date_chunks()
+        finally:
+            self.events.emit(
+                STAGE_END, stage="chunks", seconds=time.perf_counter() - start
+            )
+
+    def _clear_date_chunks(self, rows):
+        """
+        날짜가 없는 행을 덩어리에서 빼기 (chunk/chunk_id는 비우고 order는 0)
+
+        Args:
+            rows (pd.Series): 뺄 행을 고르는 bool 마스크
+        """
+        if "chunk_id" not in self.df.columns:
+            return
+        rows = rows & self.df["chunk_id"].notna()
+        if not rows.any():
+            return
+        self.df.loc[rows, ["chunk", "chunk_id"]] = math.nan
+        if "order" in self.df.columns:
+            self.df.loc[rows, "order"] = 0
+
+    def _detect_date_chunks(self):
+        """detect_date_chunks 본체 (단계 이벤트 없이)"""
+        if not self.df["DateTimeOriginal"].notna().any():
+            logger.warning("날짜 정보가 있는 사진이 없습니다.")
+            self._clear_date_chunks(pd.Series(True, index=self.df.index))
+            return self.df
+
+        # 추출할 때 만든 datetime 컬럼 사용 (직접 만든 표라면 여기서 한 번 계산)
+        if "datetime" not in self.df.columns:
+            self.refresh_capture_times()
+
+        # 유효한 날짜가 있는 행만 (파싱 실패한 날짜는 NaT)
+        date_df = self.df.loc[self.df["datetime"].notna(), ["datetime"]]
+
+        if date_df.empty:
+            logger.warning("유효한 날짜 정보가 있는 사진이 없습니다.")
+            self._clear_date_chunks(pd.Series(True, index=self.df.index))
+            return self.df
+
+        date_df = self._assign_chunks(date_df)
+
+        # 인덱스로 제자리에 기록 (부분 결과 등으로 이미 계산된 덩어리는 새 값으로 바꾸고,
+        # 날짜가 없는 행은 비움 → 여러 번 불러도 같은 결과)
+        self.df["chunk"] = date_df["chunk"].reindex(self.df.index)
+        self.df["chunk_id"] = (
+            date_df["chunk_id"].reindex(self.df.index).astype("category")
         )
 
         # 유효한 chunk_id 개수 계산
@@ -267,57 +1802,138 @@ class PhotoExifProcessor:
         logger.info(f"총 {valid_chunks}개의 날짜 덩어리를 탐지했습니다.")
         return self.df
 
-    def classify_processing_type(self):
+    def _update_date_chunks(self, changed_dates):
         """
-        자동 처리 vs 수동 보정 그룹 분류
+        바뀐 날짜에서 1일 이내에 걸친 덩어리와 새 행만 다시 묶기
+        (rescan(), 부분 결과, 수동 보정 후 refresh_capture_times()용)
+
+        덩어리는 하루보다 큰 간격으로 나뉘므로, 바뀐 날짜와 1일 넘게 떨어진
+        덩어리는 그대로 유지된다. chunk 번호는 덩어리 시작 시각 순으로 다시 매긴다.
+        날짜가 없어진 행은 덩어리에서 뺀다.
+
+        Args:
+            changed_dates (pd.Series): 삭제/수정 전 날짜와 추가/수정 후 날짜
 
         Returns:
-            tuple: (자동_처리_df, 수동_날짜_df, 수동_GPS_df)
+            set: 다시 계산된 chunk_id (없어진 덩어리 포함)
+        """
+        valid = self.df["datetime"].notna()
+        self._clear_date_chunks(~valid)
+        if not valid.any():
+            return set()
+
+        one_day = pd.Timedelta(days=1)
+        changed = pd.DatetimeIndex(changed_dates).normalize().unique().sort_values()
+
+        # 기존 덩어리 중 바뀐 날짜와 1일 이내로 닿는 덩어리
+        spans = (
+            self.df[valid & self.df["chunk_id"].notna()]
+            .groupby("chunk_id", observed=True)["datetime"]
+            .agg(["min", "max"])
+        )
+        affected = []
+        if len(changed) and not spans.empty:
+            lo = spans["min"].dt.normalize() - one_day
+            hi = spans["max"].dt.normalize() + one_day
+            pos = changed.searchsorted(lo)
+            hit = pos < len(changed)
+            hit[hit] = changed[pos[hit]] <= hi.to_numpy()[hit]
+            affected = spans.index[hit]
+
+        redo = valid & (self.df["chunk_id"].isna() | self.df["chunk_id"].isin(affected))
+        touched = set(affected)
+        if redo.any():
+            date_df = self._assign_chunks(self.df.loc[redo, ["datetime"]])
+            self._set_chunk_ids(date_df["chunk_id"])
+            touched.update(date_df["chunk_id"].unique())
+
+            if "order" in self.df.columns:
+                order = date_df.groupby("chunk_id")["datetime"].rank(
+                    method="dense", ascending=True
+                )
+                self.df.loc[order.index, "order"] = order
+                self.df["order"] = self.df["order"].fillna(0).astype("int32")
+
+        # chunk 번호를 덩어리 시작 시각 순으로 다시 매김
+        starts = self.df[valid].groupby("chunk_id", observed=True)["datetime"].min()
+        numbers = starts.rank(method="first").astype(int) - 1
+        self.df.loc[valid, "chunk"] = self.df.loc[valid, "chunk_id"].map(numbers)
+
+        logger.info(
+            f"바뀐 날짜 근처의 사진 {int(redo.sum())}개만 덩어리를 다시 계산했습니다. "
+            f"(기존 덩어리 {len(affected)}개 영향, 전체 {len(starts)}개)"
+        )
+        return touched
+
+    def _set_chunk_ids(self, chunk_ids):
+        """
+        self.df의 chunk_id(범주형 컬럼)를 chunk_ids 인덱스의 행만 바꾸기
+
+        범주형 컬럼에는 범주에 없는 값을 바로 넣을 수 없으므로 새 chunk_id를 먼저 범주에
+        추가한다. 범주는 정렬해 두어 chunk_id 정렬 순서가 문자열 순서와 같다.
+
+        Args:
+            chunk_ids (pd.Series): self.df 인덱스를 가진 새 chunk_id
+        """
+        column = self.df["chunk_id"]
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype("category")
+        categories = column.cat.categories
+        added = pd.Index(chunk_ids.dropna().unique()).difference(categories)
+        if len(added):
+            column = column.cat.set_categories(categories.append(added).sort_values())
+        self.df["chunk_id"] = column
+        self.df.loc[chunk_ids.index, "chunk_id"] = chunk_ids
+
+    def classify_processing_index(self):
+        """
+        자동 처리 vs 수동 보정 그룹 분류 (status 컬럼 기준, 표를 복사하지 않음)
+
+        개수만 필요하거나 행을 나중에 꺼내는 경우(보정 메뉴, CLI 요약)에 쓴다.
+        (행이 필요하면 self.df.loc[index])
+
+        Returns:
+            tuple: (자동_처리, 수동_날짜, 수동_GPS, 수동_전체) pd.Index
         """
         if self.df.empty:
             raise ValueError(
                 "먼저 process_all_photos()와 detect_date_chunks()를 실행해주세요."
             )
 
-        # 자동 처리: 날짜와 GPS 모두 있음
-        auto_df = self.df[
-            (self.df["DateTimeOriginal"].notna())
-            & (self.df["GPSLat"].notna())
-            & (self.df["GPSLong"].notna())
-        ].copy()
-
-        # 수동 날짜 보정: GPS는 있지만 날짜 없음
-        manual_date_df = self.df[
-            (self.df["DateTimeOriginal"].isna())
-            & (self.df["GPSLat"].notna())
-            & (self.df["GPSLong"].notna())
-        ].copy()
-
-        # 수동 GPS 보정: 날짜는 있지만 GPS 없음
-        manual_gps_df = self.df[
-            (self.df["DateTimeOriginal"].notna())
-            & ((self.df["GPSLat"].isna()) | (self.df["GPSLong"].isna()))
-        ].copy()
-
-        # 둘 다 없는 경우
-        manual_both_df = self.df[
-            (self.df["DateTimeOriginal"].isna())
-            & ((self.df["GPSLat"].isna()) | (self.df["GPSLong"].isna()))
-        ].copy()
+        # 네 그룹이 같은 표에서 나오도록 잠금 안에서 분류
+        with self.lock:
+            auto_index, manual_date_index, manual_gps_index, manual_both_index = (
+                self.status_index(status) for status in PROCESSING_STATUSES
+            )
 
         logger.info(f"분류 결과:")
-        logger.info(f"  자동 처리: {len(auto_df)}개")
-        logger.info(f"  수동 날짜 보정: {len(manual_date_df)}개")
-        logger.info(f"  수동 GPS 보정: {len(manual_gps_df)}개")
-        logger.info(f"  수동 전체 보정: {len(manual_both_df)}개")
+        logger.info(f"  자동 처리: {len(auto_index)}개")
+        logger.info(f"  수동 날짜 보정: {len(manual_date_index)}개")
+        logger.info(f"  수동 GPS 보정: {len(manual_gps_index)}개")
+        logger.info(f"  수동 전체 보정: {len(manual_both_index)}개")
+
+        return auto_index, manual_date_index, manual_gps_index, manual_both_index
+
+    def classify_processing_type(self):
+        """
+        자동 처리 vs 수동 보정 그룹 분류
 
-        return auto_df, manual_date_df, manual_gps_df, manual_both_df
+        그룹마다 행을 복사한 DataFrame을 돌려준다. (인덱스만 필요하면
+        classify_processing_index())
+
+        Returns:
+            tuple: (자동_처리_df, 수동_날짜_df, 수동_GPS_df, 수동_전체_df)
+        """
+        with self.lock:
+            return tuple(
+                self.df.loc[index] for index in self.classify_processing_index()
+            )
 
     def add_order_column(self):
         """
         같은 chunk_id 내에서 시간순 order 컬럼 추가
         """
-        if "datetime" not in self.df.columns:
+        if "chunk_id" not in self.df.columns:
             self.detect_date_chunks()
 
         # chunk_id가 있는 행들만 order 부여
@@ -330,7 +1946,9 @@ class PhotoExifProcessor:
             if valid_mask.any():
                 # 유효한 chunk_id가 있는 행들에 대해서만 order 부여
                 valid_df = self.df[valid_mask].copy()
-                valid_df["order"] = valid_df.groupby("chunk_id")["datetime"].rank(
+                valid_df["order"] = valid_df.groupby("chunk_id", observed=True)[
+                    "datetime"
+                ].rank(
                     method="dense", ascending=True
                 )
 
@@ -347,7 +1965,7 @@ class PhotoExifProcessor:
             self.df["order"] = 0
 
         # order 컬럼을 정수형으로 변환
-        self.df["order"] = self.df["order"].fillna(0).astype(int)
+        self.df["order"] = self.df["order"].fillna(0).astype("int32")
 
         return self.df
 
@@ -359,13 +1977,10 @@ class PhotoExifProcessor:
             return "데이터가 없습니다. process_all_photos()를 먼저 실행해주세요."
 
         total_files = len(self.df)
-        with_date = self.df["DateTimeOriginal"].notna().sum()
-        with_gps = (self.df["GPSLat"].notna() & self.df["GPSLong"].notna()).sum()
-        with_both = (
-            self.df["DateTimeOriginal"].notna()
-            & self.df["GPSLat"].notna()
-            & self.df["GPSLong"].notna()
-        ).sum()
+        counts = self._statuses().value_counts()
+        with_both = counts["complete"]
+        with_date = with_both + counts["need_gps"]
+        with_gps = with_both + counts["need_date"]
 
         # 유효한 chunk_id 개수 계산
         if "chunk_id" in self.df.columns:
@@ -387,5 +2002,139 @@ GPS 정보 있음: {with_gps}개 ({with_gps/total_files*100:.1f}%)
 - 날짜만 없음: {with_gps - with_both}개
 - GPS만 없음: {with_date - with_both}개
 - 둘 다 없음: {total_files - with_date - with_gps + with_both}개
+"""
+        return summary
+
+    def estimate_library(
+        self,
+        per_directory=ESTIMATE_SAMPLE_PER_DIR,
+        workers=None,
+        backend=None,
+        seed=None,
+    ):
+        """
+        전체 처리 전에 폴더별 무작위 표본만 추출해서 파일 수, 날짜/GPS 누락 비율, 처리 시간 추정
+
+        폴더를 끝까지 검색하면서 폴더별 파일 수를 세고, 폴더마다 per_directory개를
+        무작위로 골라둔 뒤(저수지 표본) 표본만 추출한다. 표본 하나는 그 폴더의
+        (파일 수 / 표본 수)개를 대표하는 것으로 보고 합산한다 (층화 추정).
+        처리 시간은 같은 워커 설정으로 표본을 추출한 파일당 시간에 전체 파일 수를 곱한 값이다.
+        self.df는 바꾸지 않는다.
+
+        Args:
+            per_directory (int): 폴더마다 추출할 최대 파일 수
+            workers (int | str): 표본 추출에 사용할 워커 수 (None이면 self.workers)
+            backend (str): 표본 추출의 병렬 백엔드 (None이면 self.backend)
+            seed (int): 표본 선택 난수 시드 (None이면 매번 다름)
+
+        Returns:
+            dict: {"files", "directories", "sampled": 파일/폴더/표본 수,
+                   "with_date", "with_gps", "with_both": 예상 파일 수,
+                   "walk_seconds", "sample_seconds": 검색/표본 추출 시간(초),
+                   "seconds_per_file", "projected_seconds": 파일당/전체 예상 시간(초)}
+        """
+        if per_directory < 1:
+            raise ValueError(f"폴더당 표본 수는 1 이상이어야 합니다: {per_directory}")
+        workers, backend = self._resolve_run_options(workers, backend)
+        self._cancel.clear()
+        rng = random.Random(seed)
+
+        counts = {}
+        samples = {}
+        start = time.perf_counter()
+        for path in self.iter_photos():
+            if self._cancel.is_set():
+                raise ProcessingCancelled("사용자가 처리를 중단했습니다.")
+            directory = path.parent
+            count = counts.get(directory, 0) + 1
+            counts[directory] = count
+            reservoir = samples.setdefault(directory, [])
+            if count <= per_directory:
+                reservoir.append(path)
+            else:
+                j = rng.randrange(count)
+                if j < per_directory:
+                    reservoir[j] = path
+        walk_seconds = time.perf_counter() - start
+
+        sample_files = [path for files in samples.values() for path in files]
+        weights = [
+            counts[directory] / len(files)
+            for directory, files in samples.items()
+            for _ in files
+        ]
+
+        if self.cache is not None:
+            self.cache.reset_stats()
+        start = time.perf_counter()
+        columns = self._extract_columns(
+            sample_files, workers, backend, stage="estimate"
+        )[0]
+        sample_seconds = time.perf_counter() - start
+
+        sample_df = pd.DataFrame(columns)
+        has_date = sample_df["DateTimeOriginal"].notna() if sample_files else []
+        has_gps = (
+            sample_df["GPSLat"].notna() & sample_df["GPSLong"].notna()
+            if sample_files
+            else []
+        )
+        total_files = sum(counts.values())
+        seconds_per_file = sample_seconds / len(sample_files) if sample_files else 0.0
+
+        def projected(mask):
+            return round(sum(w for w, hit in zip(weights, mask) if hit))
+
+        estimate = {
+            "files": total_files,
+            "directories": len(counts),
+            "sampled": len(sample_files),
+            "with_date": projected(has_date),
+            "with_gps": projected(has_gps),
+            "with_both": projected(
+                [date and gps for date, gps in zip(has_date, has_gps)]
+            ),
+            "walk_seconds": walk_seconds,
+            "sample_seconds": sample_seconds,
+            "seconds_per_file": seconds_per_file,
+            "projected_seconds": seconds_per_file * total_files,
+        }
+        logger.info(
+            f"표본 {len(sample_files)}개로 추정했습니다. "
+            f"(전체 {total_files}개, 폴더 {len(counts)}개)"
+        )
+        return estimate
+
+    @staticmethod
+    def get_estimate_summary(estimate):
+        """
+        estimate_library() 결과 요약 (get_summary와 같은 형식의 예상 값)
+        """
+        total_files = estimate["files"]
+        if total_files == 0:
+            return "처리할 사진이 없습니다."
+
+        with_date = estimate["with_date"]
+        with_gps = estimate["with_gps"]
+        with_both = estimate["with_both"]
+        directories = estimate["directories"]
+        walk_seconds = estimate["walk_seconds"]
+        seconds = estimate["projected_seconds"]
+        duration = f"{seconds / 60:.1f}분" if seconds >= 60 else f"{seconds:.1f}초"
+
+        summary = f"""
+=== 사진 라이브러리 추정 (표본 기반) ===
+전체 파일 수: {total_files}개 (폴더 {directories}개, 검색 {walk_seconds:.1f}초)
+추출한 표본: {estimate['sampled']}개 ({estimate['sample_seconds']:.1f}초)
+날짜 정보 있음: 약 {with_date}개 ({with_date/total_files*100:.1f}%)
+GPS 정보 있음: 약 {with_gps}개 ({with_gps/total_files*100:.1f}%)
+완전 자동 처리 가능: 약 {with_both}개 ({with_both/total_files*100:.1f}%)
+
+수동 보정 필요 (예상):
+- 날짜만 없음: 약 {with_gps - with_both}개
+- GPS만 없음: 약 {with_date - with_both}개
+- 둘 다 없음: 약 {total_files - with_date - with_gps + with_both}개
+
+예상 처리 시간: 약 {duration} (파일당 {estimate['seconds_per_file'] * 1000:.2f}ms, 같은 워커 설정 기준)
 """
         return summary
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Processing Events
+PhotoExifProcessor가 처리 중에 보내는 진행 이벤트
+(단계 시작/끝, 묶음 완료, 파일별 오류, 처리량, 찾은 파일 수)
+GUI/CLI/다른 서비스는 로그를 읽는 대신 subscribe()로 이벤트를 받음
+
+이벤트는 {"type": 이벤트 종류, "time": time.time(), ...필드} 형태의 dict이며,
+처리 스레드(파이프라인 단계 스레드 포함)에서 바로 호출되므로 GUI는 큐로 넘겨서 써야 함
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류와 필드
+STAGE_START = "stage_start"  # stage
+STAGE_END = "stage_end"  # stage, seconds (+ 단계별 추가 필드)
+BATCH_DONE = "batch_done"  # stage, done(누적 파일 수), size, cached, failed
+FILE_ERROR = "file_error"  # path, error
+THROUGHPUT = "throughput"  # stage, done, rate(최근 구간 파일/초), average, elapsed
+FILES_FOUND = "files_found"  # stage, found(지금까지 찾은 파일 수), finished(검색 끝)
+
+EVENT_TYPES = (STAGE_START, STAGE_END, BATCH_DONE, FILE_ERROR, THROUGHPUT, FILES_FOUND)
+
+# 처리량 이벤트를 보내는 최소 간격(초)
+THROUGHPUT_SAMPLE_SECONDS = 1.0
+
+
+class EventEmitter:
+    def __init__(self):
+        """이벤트 구독자 목록 (여러 스레드에서 emit해도 안전)"""
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener):
+        """
+        이벤트 구독
+
+        Args:
+            listener: 이벤트 dict 하나를 받는 함수
+
+        Returns:
+            listener (unsubscribe에 그대로 넘기면 됨)
+        """
+        with self._lock:
+            self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def emit(self, event_type, **fields):
+        """구독자들에게 이벤트 보내기 (구독자 오류는 처리를 멈추지 않고 경고만 남김)"""
+        with self._lock:
+            listeners = list(self._listeners)
+        if not listeners:
+            return
+
+        event = {"type": event_type, "time": time.time(), **fields}
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"이벤트 구독자 처리 실패 ({event_type}): {e}")
+
+
+class ThroughputMeter:
+    def __init__(self, emitter, interval=THROUGHPUT_SAMPLE_SECONDS, **fields):
+        """
+        누적 처리 수를 받아 일정 간격으로 THROUGHPUT 이벤트 보내기
+
+        Args:
+            emitter (EventEmitter): 이벤트를 보낼 곳
+            interval (float): 이벤트 최소 간격(초)
+            **fields: 이벤트마다 함께 보낼 필드 (stage 등)
+        """
+        self.emitter = emitter
+        self.interval = interval
+        self.fields = fields
+        self.start = time.perf_counter()
+        self._last_time = self.start
+        self._last_done = 0
+
+    def update(self, done, force=False):
+        """
+        Args:
+            done (int): 지금까지 처리한 파일 수
+            force (bool): 간격과 상관없이 보내기 (마지막 샘플용)
+        """
+        now = time.perf_counter()
+        if not force and now - self._last_time < self.interval:
+            return
+
+        window = now - self._last_time
+        elapsed = now - self.start
+        self.emitter.emit(
+            THROUGHPUT,
+            done=done,
+            rate=(done - self._last_done) / window if window > 0 else 0.0,
+            average=done / elapsed if elapsed > 0 else 0.0,
+            elapsed=elapsed,
+            **self.fields,
+        )
+        self._last_time = now
+        self._last_done = done
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Read Scheduler
+HDD 기반 NAS 등에서 랜덤 탐색을 줄이기 위해 EXIF 헤더를 읽는 순서를 디스크 위치 순으로 정하고,
+곧 읽을 파일의 앞부분을 posix_fadvise(WILLNEED)로 미리 읽어두게 하는 스케줄러
+결과를 원래(경로) 순서로 되돌리는 것은 호출하는 쪽에서 한다.
+"""
+
+import logging
+import os
+import struct
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 읽기 순서 전략: path(기존 경로 순), inode(inode 번호 순), extent(FIEMAP 물리 위치 순)
+READ_ORDERS = ("path", "inode", "extent")
+
+# 몇 개 앞의 파일까지 미리 읽기를 요청할지 / 파일당 미리 읽을 크기 (헤더 부분)
+READAHEAD_FILES = 16
+READAHEAD_BYTES = 128 * 1024
+
+# FIEMAP ioctl (linux/fiemap.h): 첫 extent 하나의 물리 위치만 요청
+FS_IOC_FIEMAP = 0xC020660B
+FIEMAP_HEADER = struct.Struct("=QQIIII")  # start, length, flags, mapped, count, reserved
+FIEMAP_EXTENT_SIZE = 56  # logical, physical, length, reserved64[2], flags, reserved[3]
+FIEMAP_MAX_OFFSET = 0xFFFFFFFFFFFFFFFF
+
+
+def physical_offset(file_path):
+    """
+    파일 첫 extent의 디스크 물리 위치 (FIEMAP)
+
+    Returns:
+        int: 물리 바이트 위치 (extent가 없는 빈 파일은 0)
+
+    Raises:
+        OSError: 파일 시스템이 FIEMAP을 지원하지 않음 (NFS/SMB 등)
+    """
+    if fcntl is None:
+        raise OSError("FIEMAP은 Linux에서만 사용할 수 있습니다")
+
+    request = FIEMAP_HEADER.pack(0, FIEMAP_MAX_OFFSET, 0, 0, 1, 0)
+    request += bytes(FIEMAP_EXTENT_SIZE)
+    with open(file_path, "rb", buffering=0) as f:
+        result = fcntl.ioctl(f.fileno(), FS_IOC_FIEMAP, request)
+
+    mapped = FIEMAP_HEADER.unpack_from(result)[3]
+    if mapped == 0:
+        return 0
+    (physical,) = struct.unpack_from("=Q", result, FIEMAP_HEADER.size + 8)
+    return physical
+
+
+class ReadScheduler:
+    def __init__(
+        self,
+        strategy="inode",
+        readahead_files=READAHEAD_FILES,
+        readahead_bytes=READAHEAD_BYTES,
+    ):
+        """
+        읽기 순서 스케줄러 초기화
+
+        Args:
+            strategy (str): "path", "inode", "extent" 중 하나
+            readahead_files (int): 몇 개 앞의 파일까지 미리 읽기 요청 (0이면 사용 안 함)
+            readahead_bytes (int): 파일당 미리 읽을 앞부분 크기
+        """
+        if strategy not in READ_ORDERS:
+            raise ValueError(f"지원하지 않는 읽기 순서입니다: {strategy}")
+        self.strategy = strategy
+        self.readahead_files = readahead_files if hasattr(os, "posix_fadvise") else 0
+        self.readahead_bytes = readahead_bytes
+        self._extent_supported = True
+
+    def order(self, photo_files, stats=None):
+        """
+        파일을 읽을 순서 계산
+
+        Args:
+            photo_files (list): 파일 경로 목록
+            stats (list): photo_files와 같은 순서의 os.stat 결과 (None이면 직접 stat)
+
+        Returns:
+            list: photo_files의 인덱스를 읽을 순서대로 나열한 목록
+        """
+        indices = list(range(len(photo_files)))
+        if self.strategy == "path":
+            return indices
+
+        if stats is None:
+            stats = []
+            for file_path in photo_files:
+                try:
+                    stats.append(os.stat(file_path))
+                except OSError:
+                    stats.append(None)
+
+        # 같은 장치끼리 모아서 inode 순 (stat 실패한 파일은 맨 뒤)
+        keys = [
+            (st.st_dev, st.st_ino) if st is not None else (float("inf"), 0)
+            for st in stats
+        ]
+
+        if self.strategy == "extent" and self._extent_supported:
+            try:
+                keys = [
+                    (key[0], physical_offset(file_path))
+                    for key, file_path in zip(keys, photo_files)
+                ]
+            except OSError as e:
+                # 한 번 실패하면 같은 볼륨의 나머지도 지원하지 않으므로 inode 순으로
+                self._extent_supported = False
+                logger.info(f"FIEMAP을 사용할 수 없어 inode 순으로 읽습니다: {e}")
+
+        return sorted(indices, key=keys.__getitem__)
+
+    def prefetch(self, photo_files, position):
+        """
+        position번째 파일을 읽기 직전에 readahead_files개 앞 파일의 헤더 미리 읽기 요청
+
+        Args:
+            photo_files (list): 읽는 순서대로 정렬된 파일 경로 목록
+            position (int): 지금 읽으려는 파일의 위치
+        """
+        if not self.readahead_files:
+            return
+
+        # 처음에는 창 전체, 이후에는 창 끝에 새로 들어오는 파일 하나만 요청
+        if position == 0:
+            targets = photo_files[: self.readahead_files + 1]
+        else:
+            ahead = position + self.readahead_files
+            targets = photo_files[ahead : ahead + 1]
+        for file_path in targets:
+            advise_willneed(file_path, self.readahead_bytes)
+
+
+def advise_willneed(file_path, length=READAHEAD_BYTES):
+    """파일 앞부분을 비동기로 미리 읽어두도록 커널에 요청 (실패는 무시)"""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
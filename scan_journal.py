@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Scan Journal
+process_all_photos()가 끝낸 묶음의 결과를 주기적으로 SQLite에 기록하는 체크포인트 저널
+중간에 멈추거나(일시 중지, 프로세스 종료) 실패해도 다음 실행에서 기록된 곳부터 이어서 처리함
+추출에 실패한 파일은 실패로 기록해 두었다가 이어서 처리할 때 다시 시도함
+기록은 사진 폴더마다 따로 두므로 다른 폴더를 처리해도 일시 중지된 기록은 남음
+"""
+
+import json
+import os
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from exif_cache import CACHED_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 기본 저널 위치 (EXIF 캐시와 같은 output 폴더)
+DEFAULT_JOURNAL_PATH = Path("output") / "scan_journal.sqlite3"
+
+# 기록을 모아 두었다가 디스크에 쓰는 간격(초)
+CHECKPOINT_SECONDS = 5.0
+
+# 저널 상태: running(처리 중 또는 비정상 종료), paused(일시 중지), complete(완료)
+RUNNING = "running"
+PAUSED = "paused"
+COMPLETE = "complete"
+
+
+class ScanJournal:
+    def __init__(self, db_path=DEFAULT_JOURNAL_PATH, interval=CHECKPOINT_SECONDS):
+        """
+        SQLite 저널 열기 (없으면 생성)
+
+        Args:
+            db_path (str | Path): 저널 파일 경로
+            interval (float): 체크포인트 간격(초)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [
+            row[1] for row in self._conn.execute("PRAGMA table_info(scan_rows)")
+        ]
+        if columns and "folder" not in columns:
+            # 폴더 구분 없이 하나만 기록하던 예전 저널은 버리고 새로 만듦
+            logger.info("예전 형식의 체크포인트 저널을 비우고 새로 만듭니다.")
+            self._conn.execute("DROP TABLE scan_rows")
+            self._conn.execute("DROP TABLE IF EXISTS scan_meta")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scan_runs (
+                folder TEXT PRIMARY KEY,
+                status TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scan_rows (
+                folder TEXT NOT NULL,
+                path TEXT NOT NULL,
+                signature TEXT,
+                result TEXT NOT NULL,
+                failed INTEGER NOT NULL,
+                PRIMARY KEY (folder, path)
+            )
+            """
+        )
+        self._conn.commit()
+
+        # 지금 기록 중인 사진 폴더 (start()에서 정함)
+        self._folder = None
+        self._pending = []
+        self._last_checkpoint = time.perf_counter()
+
+    @staticmethod
+    def _folder_key(folder):
+        """저널에서 폴더를 구분하는 키 (심볼릭 링크 등을 푼 절대 경로)"""
+        return os.path.realpath(folder)
+
+    def _set_status(self, folder, status):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scan_runs (folder, status) VALUES (?, ?)",
+            (folder, status),
+        )
+
+    def status(self, folder):
+        """
+        폴더의 이어서 처리할 기록 상태
+
+        Returns:
+            dict | None: {"status", "done", "failed"} (이 폴더의 끝나지 않은 기록이 없으면 None)
+        """
+        folder = self._folder_key(folder)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM scan_runs WHERE folder = ?", (folder,)
+            ).fetchone()
+            if row is None or row[0] not in (RUNNING, PAUSED):
+                return None
+            done, failed = self._conn.execute(
+                "SELECT COUNT(*) - COALESCE(SUM(failed), 0), COALESCE(SUM(failed), 0) "
+                "FROM scan_rows WHERE folder = ?",
+                (folder,),
+            ).fetchone()
+        return {"status": row[0], "done": done, "failed": failed}
+
+    def start(self, folder, resume=False):
+        """
+        새 실행 시작
+
+        Args:
+            folder (str | Path): 사진 폴더
+            resume (bool): 같은 폴더의 끝나지 않은 기록이 있으면 이어서 처리
+
+        Returns:
+            dict: 이어서 쓸 성공 기록 {경로: ((size, mtime_ns, inode) | None, 결과 dict)}
+                (실패로 기록된 파일은 빠지므로 다시 추출됨)
+        """
+        previous = self.status(folder) if resume else None
+        if resume and previous is None:
+            logger.info("이어서 처리할 기록이 없어 처음부터 처리합니다.")
+
+        with self._lock:
+            self._folder = self._folder_key(folder)
+            self._pending = []
+            self._last_checkpoint = time.perf_counter()
+            with self._conn:
+                if previous is None:
+                    # 이 폴더의 기록만 비움 (다른 폴더의 일시 중지된 기록은 그대로)
+                    self._conn.execute(
+                        "DELETE FROM scan_rows WHERE folder = ?", (self._folder,)
+                    )
+                self._set_status(self._folder, RUNNING)
+            if previous is None:
+                return {}
+
+            rows = self._conn.execute(
+                "SELECT path, signature, result FROM scan_rows "
+                "WHERE folder = ? AND failed = 0",
+                (self._folder,),
+            ).fetchall()
+
+        logger.info(
+            f"이전 기록에서 이어서 처리합니다. "
+            f"(완료 {previous['done']}개, 다시 시도할 실패 {previous['failed']}개)"
+        )
+        return {
+            path: (
+                tuple(json.loads(signature)) if signature else None,
+                json.loads(result),
+            )
+            for path, signature, result in rows
+        }
+
+    def record(self, rows):
+        """
+        끝낸 파일들의 결과 기록 (CHECKPOINT_SECONDS마다 모아서 디스크에 씀)
+
+        Args:
+            rows: (경로, 파일 상태 (size, mtime_ns, inode) | None, 결과 dict, 실패 여부) 목록
+        """
+        with self._lock:
+            self._pending.extend(rows)
+            due = time.perf_counter() - self._last_checkpoint >= self.interval
+        if due:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """모아 둔 기록을 한 트랜잭션으로 저장"""
+        with self._lock:
+            rows = [
+                (
+                    self._folder,
+                    path,
+                    json.dumps(signature) if signature is not None else None,
+                    json.dumps({key: result.get(key) for key in CACHED_FIELDS}),
+                    int(failed),
+                )
+                for path, signature, result, failed in self._pending
+            ]
+            self._pending = []
+            self._last_checkpoint = time.perf_counter()
+            if not rows:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scan_rows "
+                    "(folder, path, signature, result, failed) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+        logger.debug(f"체크포인트 저장: {len(rows)}개")
+
+    def pause(self):
+        """남은 기록을 저장하고 일시 중지 상태로 표시 (다음 실행에서 이어서 처리 가능)"""
+        self.checkpoint()
+        with self._lock:
+            with self._conn:
+                self._set_status(self._folder, PAUSED)
+
+    def finish(self):
+        """처리가 끝나면 이 폴더의 기록을 비움 (다음 실행은 처음부터)"""
+        with self._lock:
+            self._pending = []
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM scan_rows WHERE folder = ?", (self._folder,)
+                )
+                self._set_status(self._folder, COMPLETE)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
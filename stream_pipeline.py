@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Stream Pipeline
+단계(stage)마다 스레드 하나를 두고 크기가 정해진 큐로 이어 묶음(batch)을 흘려보내는 파이프라인
+뒤 단계가 느리면 큐가 차서 앞 단계가 기다리므로(backpressure) 메모리에 올라가는 묶음 수가 일정하고,
+앞 묶음을 디코딩하는 동안 다음 묶음을 읽는 식으로 단계들이 동시에 진행됨
+"""
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 단계 사이 큐에 쌓아둘 수 있는 최대 묶음 수
+QUEUE_SIZE = 4
+
+# 큐에서 기다리는 중에도 중단 요청을 확인하는 간격(초)
+POLL_INTERVAL = 0.1
+
+# 마지막 묶음 다음에 보내는 표시
+_END = object()
+
+
+def batched(items, size):
+    """iterable을 size개씩 리스트로 묶어서 반환 (마지막 묶음은 더 작을 수 있음)"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class StreamPipeline:
+    def __init__(self, source, stages, queue_size=QUEUE_SIZE, on_stage=None):
+        """
+        스트리밍 파이프라인 구성 (반복을 시작할 때 스레드가 뜸)
+
+        Args:
+            source (tuple): (단계 이름, 묶음을 차례로 내놓는 iterable)
+            stages (list): [(단계 이름, 묶음 → 묶음 함수), ...]
+                마지막 단계의 결과는 이 객체를 반복하는 쪽(호출한 스레드)이 받음
+            queue_size (int): 단계 사이 큐 크기
+            on_stage: 단계 스레드가 시작/끝날 때 on_stage(단계 이름, 끝났는지 여부)를
+                부르는 함수 (그 단계의 스레드에서 불림)
+        """
+        self.source = source
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.on_stage = on_stage
+
+        self._stop = threading.Event()
+        self._error = None
+        self._threads = []
+
+        # 단계별 실제 작업 시간(초)과 처리한 묶음 수
+        self.busy = {name: 0.0 for name, _ in [source, *self.stages]}
+        self.counts = dict.fromkeys(self.busy, 0)
+        self.elapsed = 0.0
+
+    def _put(self, q, item):
+        """큐가 차 있으면 자리가 날 때까지 대기 (중단되면 False)"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q):
+        """다음 묶음 꺼내기 (중단되면 _END)"""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _fail(self, name, error):
+        if self._error is None:
+            self._error = error
+            logger.warning(f"파이프라인 단계 '{name}' 실패: {error}")
+        self._stop.set()
+
+    def _notify(self, name, finished):
+        if self.on_stage is not None:
+            self.on_stage(name, finished)
+
+    def _run_source(self, name, items, out):
+        try:
+            self._notify(name, False)
+            iterator = iter(items)
+            while True:
+                start = time.perf_counter()
+                try:
+                    batch = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    self.busy[name] += time.perf_counter() - start
+                self.counts[name] += 1
+                if not self._put(out, batch):
+                    return
+            self._put(out, _END)
+        except Exception as e:
+            self._fail(name, e)
+        finally:
+            self._notify(name, True)
+
+    def _run_stage(self, name, func, inp, out):
+        try:
+            self._notify(name, False)
+            while True:
+                batch = self._get(inp)
+                if batch is _END:
+                    break
+                start = time.perf_counter()
+                result = func(batch)
+                self.busy[name] += time.perf_counter() - start
+                self.counts[name] += 1
+                if not self._put(out, result):
+                    return
+            self._put(out, _END)
+        except Exception as e:
+            self._fail(name, e)
+        finally:
+            self._notify(name, True)
+
+    def __iter__(self):
+        """
+        파이프라인을 실행하면서 마지막 단계의 결과 묶음을 차례로 반환
+
+        어느 단계에서든 예외가 나면 나머지 단계를 멈추고 같은 예외를 다시 던진다.
+        반복을 중간에 그만두면(break, 예외) 모든 단계를 멈춘다.
+        """
+        queues = [queue.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        name, items = self.source
+        self._threads = [
+            threading.Thread(
+                target=self._run_source,
+                args=(name, items, queues[0]),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+        ]
+        for i, (name, func) in enumerate(self.stages):
+            self._threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(name, func, queues[i], queues[i + 1]),
+                    name=f"pipeline-{name}",
+                    daemon=True,
+                )
+            )
+
+        start = time.perf_counter()
+        for thread in self._threads:
+            thread.start()
+        try:
+            while True:
+                batch = self._get(queues[-1])
+                if batch is _END:
+                    break
+                yield batch
+        finally:
+            self.close()
+            self.elapsed = time.perf_counter() - start
+
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        """모든 단계를 멈추고 스레드가 끝날 때까지 대기"""
+        self._stop.set()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def report(self):
+        """단계별 작업 시간 요약 (합이 전체 시간보다 크면 그만큼 단계들이 겹쳐서 실행된 것)"""
+        stages = ", ".join(
+            f"{name} {seconds:.2f}초/{self.counts[name]}묶음"
+            for name, seconds in self.busy.items()
+        )
+        return f"파이프라인 단계별 작업 시간: {stages} (전체 {self.elapsed:.2f}초)"
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+MP4/MOV Atom Reader
+ISO-BMFF(QuickTime) 박스 헤더만 따라가서 촬영 날짜와 위치를 읽는 순수 Python 리더
+mdat(영상 데이터)와 trak(샘플 테이블)은 seek로 건너뛰므로 파일당 작은 read 몇 번이면 충분함
+"""
+
+import re
+import struct
+from datetime import datetime, timedelta
+
+# QuickTime 시간 기준점 (1904-01-01 UTC)
+QUICKTIME_EPOCH = datetime(1904, 1, 1)
+
+# 박스 하나의 payload를 통째로 읽어도 되는 최대 크기 (mvhd, ©xyz, keys, ilst 등)
+MAX_SMALL_BOX_SIZE = 1024 * 1024
+
+# moov 안에서 내려가 볼 컨테이너 박스 (meta는 별도 처리)
+CONTAINER_BOXES = {b"udta"}
+
+KEY_CREATION_DATE = "com.apple.quicktime.creationdate"
+KEY_LOCATION = "com.apple.quicktime.location.ISO6709"
+
+# ISO 6709 좌표 한 성분 (±DD.D / ±DDMM.M / ±DDMMSS.S, 경도는 자리수 +1)
+ISO6709_PATTERN = re.compile(r"([+-])(\d+)(\.\d+)?")
+
+
+class VideoFormatError(Exception):
+    """ISO-BMFF 구조로 읽을 수 없는 파일 (exiftool로 폴백해야 함)"""
+
+
+def iter_boxes(f, start, end):
+    """
+    [start, end) 구간의 박스 헤더를 순서대로 읽기 (payload는 읽지 않음)
+
+    Yields:
+        tuple: (box_type, payload_start, box_end)
+    """
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+
+        size, box_type = struct.unpack(">L4s", header)
+        header_size = 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                raise VideoFormatError("64비트 박스 크기를 읽을 수 없습니다")
+            (size,) = struct.unpack(">Q", large)
+            header_size = 16
+        elif size == 0:
+            size = end - pos  # 구간 끝까지
+
+        if size < header_size or pos + size > end:
+            raise VideoFormatError(f"잘못된 박스 크기: {box_type!r} {size}")
+
+        yield box_type, pos + header_size, pos + size
+        pos += size
+
+
+def _read_payload(f, payload_start, box_end):
+    """작은 박스의 payload 읽기"""
+    size = box_end - payload_start
+    if size > MAX_SMALL_BOX_SIZE:
+        raise VideoFormatError(f"메타데이터 박스가 너무 큽니다: {size}")
+    f.seek(payload_start)
+    return f.read(size)
+
+
+def _parse_mvhd(payload):
+    """mvhd의 creation_time → 'YYYY:MM:DD HH:MM:SS' (UTC, 0이면 None)"""
+    version = payload[0]
+    if version == 1:
+        (creation_time,) = struct.unpack(">Q", payload[4:12])
+    else:
+        (creation_time,) = struct.unpack(">L", payload[4:8])
+
+    if creation_time == 0:
+        return None
+    created = QUICKTIME_EPOCH + timedelta(seconds=creation_time)
+    return created.strftime("%Y:%m:%d %H:%M:%S")
+
+
+def _parse_iso6709_component(sign, digits, fraction, degree_digits):
+    """ISO 6709 한 성분을 십진수 도(degree)로 변환"""
+    fraction = float(fraction) if fraction else 0.0
+    if len(digits) == degree_digits:
+        value = int(digits) + fraction
+    elif len(digits) == degree_digits + 2:
+        value = int(digits[:degree_digits]) + (int(digits[degree_digits:]) + fraction) / 60
+    elif len(digits) == degree_digits + 4:
+        value = (
+            int(digits[:degree_digits])
+            + int(digits[degree_digits : degree_digits + 2]) / 60
+            + (int(digits[degree_digits + 2 :]) + fraction) / 3600
+        )
+    else:
+        raise ValueError(f"ISO 6709 자리수 해석 불가: {digits}")
+    return -value if sign == "-" else value
+
+
+def parse_iso6709(text):
+    """
+    ISO 6709 위치 문자열(예: '+37.5665+126.9780+012.345/')을 (위도, 경도)로 변환
+
+    Returns:
+        tuple: (lat, lon) 또는 해석할 수 없으면 (None, None)
+    """
+    parts = ISO6709_PATTERN.findall(text or "")
+    if len(parts) < 2:
+        return None, None
+    try:
+        lat = _parse_iso6709_component(*parts[0], degree_digits=2)
+        lon = _parse_iso6709_component(*parts[1], degree_digits=3)
+    except ValueError:
+        return None, None
+    if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+        return None, None
+    return lat, lon
+
+
+def _parse_xyz(payload):
+    """udta/©xyz: u16 문자열 길이 + u16 언어 코드 + ISO 6709 문자열"""
+    if len(payload) < 4:
+        return None
+    (length,) = struct.unpack(">H", payload[:2])
+    return payload[4 : 4 + length].decode("utf-8", errors="ignore")
+
+
+def _parse_keys(payload):
+    """meta/keys: 1부터 시작하는 키 인덱스 → 키 이름"""
+    (count,) = struct.unpack(">L", payload[4:8])
+    keys = {}
+    pos = 8
+    for index in range(1, count + 1):
+        if pos + 8 > len(payload):
+            break
+        (size,) = struct.unpack(">L", payload[pos : pos + 4])
+        if size < 8:
+            break
+        keys[index] = payload[pos + 8 : pos + size].decode("utf-8", errors="ignore")
+        pos += size
+    return keys
+
+
+def _parse_ilst(payload):
+    """meta/ilst: 키 인덱스 → UTF-8 문자열 값 (data 박스의 타입 1만 사용)"""
+    values = {}
+    pos = 0
+    while pos + 8 <= len(payload):
+        size, index = struct.unpack(">LL", payload[pos : pos + 8])
+        if size < 8:
+            break
+        item = payload[pos + 8 : pos + size]
+        # item 안의 data 박스: size, 'data', 타입, 로케일, 값
+        if len(item) >= 16 and item[4:8] == b"data":
+            (data_size,) = struct.unpack(">L", item[:4])
+            (data_type,) = struct.unpack(">L", item[8:12])
+            if data_type == 1:
+                values[index] = item[16:data_size].decode("utf-8", errors="ignore")
+        pos += size
+    return values
+
+
+def _format_creation_date(text):
+    """
+    com.apple.quicktime.creationdate(예: '2025-05-12T10:00:00+0900') →
+    촬영 현지 시각 'YYYY:MM:DD HH:MM:SS'
+    """
+    text = text.strip()
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y:%m:%d %H:%M:%S")
+        except ValueError:
+            continue
+    return None
+
+
+def _walk_meta(f, payload_start, box_end, found):
+    """meta 박스(QuickTime 형식 또는 FullBox 형식)에서 keys/ilst 읽기"""
+    # udta/meta는 version/flags 4바이트가 앞에 붙는 FullBox, moov/meta는 아님
+    f.seek(payload_start)
+    peek = f.read(8)
+    if len(peek) == 8 and peek[4:8] not in (b"hdlr", b"keys", b"ilst"):
+        payload_start += 4
+
+    keys = {}
+    values = {}
+    for box_type, child_start, child_end in iter_boxes(f, payload_start, box_end):
+        if box_type == b"keys":
+            keys = _parse_keys(_read_payload(f, child_start, child_end))
+        elif box_type == b"ilst":
+            values = _parse_ilst(_read_payload(f, child_start, child_end))
+
+    for index, value in values.items():
+        key = keys.get(index)
+        if key == KEY_CREATION_DATE:
+            found.setdefault("creationdate", value)
+        elif key == KEY_LOCATION:
+            found.setdefault("location", value)
+
+
+def _walk_moov(f, start, end, found):
+    """moov 하위에서 mvhd / udta / meta만 방문 (trak 등은 건너뜀)"""
+    for box_type, payload_start, box_end in iter_boxes(f, start, end):
+        if box_type == b"mvhd":
+            found["mvhd"] = _parse_mvhd(_read_payload(f, payload_start, box_end))
+        elif box_type == b"\xa9xyz":
+            found.setdefault(
+                "location", _parse_xyz(_read_payload(f, payload_start, box_end))
+            )
+        elif box_type == b"meta":
+            _walk_meta(f, payload_start, box_end, found)
+        elif box_type in CONTAINER_BOXES:
+            _walk_moov(f, payload_start, box_end, found)
+
+
+def read_video_metadata(file_path):
+    """
+    MP4/MOV에서 촬영 날짜와 위치 읽기
+
+    날짜는 com.apple.quicktime.creationdate(현지 시각)를 우선 사용하고,
+    없으면 mvhd의 생성 시각(UTC)을 사용한다.
+
+    Returns:
+        dict: DateTimeOriginal, GPSLat, GPSLong (없는 값은 None)
+
+    Raises:
+        VideoFormatError: ISO-BMFF 구조가 아니거나 moov를 찾을 수 없음
+    """
+    # 작은 read만 하므로 버퍼 없이 열어서 8KB 블록 선읽기를 피함
+    with open(file_path, "rb", buffering=0) as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+
+        found = {}
+        for box_type, payload_start, box_end in iter_boxes(f, 0, file_size):
+            if box_type == b"moov":
+                _walk_moov(f, payload_start, box_end, found)
+                break
+        else:
+            raise VideoFormatError("moov 박스를 찾을 수 없습니다")
+
+    date = None
+    if found.get("creationdate"):
+        date = _format_creation_date(found["creationdate"])
+    if date is None:
+        date = found.get("mvhd")
+
+    lat, lon = parse_iso6709(found.get("location"))
+    return {"DateTimeOriginal": date, "GPSLat": lat, "GPSLong": lon}